@@ -0,0 +1,121 @@
+"""
+Round-trip latency of `Connection.fetchval` through the asqlite worker.
+
+Compares the current event-driven worker against the previous
+implementation, which polled its queue every 200 ms and resolved every
+future with its own `call_soon_threadsafe`.
+
+Run from the repository root:
+
+    python -m benchmarks.asqlite_worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import statistics
+import threading
+import time
+from typing import Any, Callable, List, Type
+
+from tsundoku import asqlite
+
+SEQUENTIAL_QUERIES = 2000
+CONCURRENT_QUERIES = 2000
+
+
+class PollingWorker(threading.Thread):
+    """The worker as it was before, kept here for comparison."""
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop):
+        super().__init__(name="asqlite-polling-worker-thread", daemon=True)
+        self._loop = loop
+        self._worker_queue: queue.Queue = queue.Queue()
+        self._end = threading.Event()
+
+    def _call_entry(self, entry: asqlite._WorkerEntry) -> None:
+        fut = entry.future
+        if fut.cancelled():
+            return
+
+        try:
+            result = entry.func(*entry.args, **entry.kwargs)
+        except Exception as e:
+            self._loop.call_soon_threadsafe(fut.set_exception, e)
+        else:
+            self._loop.call_soon_threadsafe(fut.set_result, result)
+
+    def run(self) -> None:
+        _queue = self._worker_queue
+        while not self._end.is_set():
+            try:
+                entry = _queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            else:
+                self._call_entry(entry)
+
+    def post(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        future = self._loop.create_future()
+        entry = asqlite._WorkerEntry(func=func, args=args, kwargs=kwargs, future=future)
+        self._worker_queue.put_nowait(entry)
+        return future
+
+    def stop(self) -> None:
+        self._end.set()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_with(worker_cls: Type[threading.Thread]) -> None:
+    original = asqlite._Worker
+    asqlite._Worker = worker_cls  # type: ignore
+    try:
+        con = await asqlite.connect(":memory:")
+    finally:
+        asqlite._Worker = original  # type: ignore
+
+    for _ in range(100):
+        await con.fetchval("SELECT 1;")
+
+    samples = []
+    for _ in range(SEQUENTIAL_QUERIES):
+        start = time.perf_counter()
+        await con.fetchval("SELECT 1;")
+        samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(con.fetchval("SELECT 1;") for _ in range(CONCURRENT_QUERIES))
+    )
+    concurrent = time.perf_counter() - start
+
+    worker = con._queue
+    await con.close()
+    start = time.perf_counter()
+    worker.join()
+    shutdown = time.perf_counter() - start
+
+    print(f"{worker_cls.__name__}:")
+    print(
+        f"  sequential fetchval  p50 {statistics.median(samples) * 1e6:8.1f} us"
+        f"   p99 {percentile(samples, 0.99) * 1e6:8.1f} us"
+    )
+    print(
+        f"  {CONCURRENT_QUERIES} concurrent       {concurrent * 1e3:8.1f} ms"
+        f"   ({CONCURRENT_QUERIES / concurrent:,.0f} queries/s)"
+    )
+    print(f"  worker shutdown      {shutdown * 1e3:8.1f} ms")
+
+
+async def main() -> None:
+    await run_with(PollingWorker)
+    await run_with(asqlite._Worker)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+Time taken to parse release filenames with a source's filename
+template compared to anitopy.
+
+Titles follow the pattern of `default_sources/subsplease.json`. Both
+parsers run uncached, and the template's results are checked against
+anitopy's.
+
+Run from the repository root:
+
+    python -m benchmarks.filename_templates
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+import time
+from typing import List
+
+from tsundoku.sources import Source
+from tsundoku.utils import _run_anitopy
+
+TITLES = 5000
+
+
+def make_titles(rng: random.Random, count: int) -> List[str]:
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))).title()
+        for _ in range(500)
+    ]
+
+    titles = []
+    for _ in range(count):
+        title = " ".join(rng.choices(words, k=rng.randint(1, 5)))
+        episode = rng.randint(1, 24)
+        version = rng.choice(("", "", "", "v2"))
+        resolution = rng.choice(("480p", "720p", "1080p"))
+        checksum = "".join(rng.choices("0123456789ABCDEF", k=8))
+        titles.append(
+            f"[SubsPlease] {title} - {episode:02}{version} ({resolution}) [{checksum}].mkv"
+        )
+
+    return titles
+
+
+def main() -> None:
+    with open("default_sources/subsplease.json", "r", encoding="utf-8") as fp:
+        source = Source.from_object(json.load(fp))
+
+    titles = make_titles(random.Random(0), TITLES)
+
+    start = time.perf_counter()
+    expected = [_run_anitopy(title) for title in titles]
+    anitopy = (time.perf_counter() - start) / TITLES
+
+    start = time.perf_counter()
+    found = [source.parse_filename(title) for title in titles]
+    template = (time.perf_counter() - start) / TITLES
+
+    matched = 0
+    for result, parsed in zip(found, expected):
+        if result is not None:
+            matched += 1
+            assert parsed == {**parsed, **result}, "template disagrees with anitopy"
+
+    print(f"{'parser':>10} {'per title':>12}")
+    print(f"{'anitopy':>10} {anitopy * 1e6:>9.1f} us")
+    print(f"{'template':>10} {template * 1e6:>9.1f} us")
+    print(f"{matched}/{TITLES} titles matched the template")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Time taken to match release titles against a growing number of shows.
+
+Compares `fuzzy.extract_one`, which scores every title, against
+`fuzzy.NGramIndex.extract_one` and the batched
+`fuzzy.NGramIndex.extract_many` at the default fuzzy match cutoff,
+and checks that all of them agree on every query.
+
+Run from the repository root:
+
+    python -m benchmarks.fuzzy_index
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import time
+from typing import List
+
+from tsundoku.feeds.fuzzy import NGramIndex, extract_one
+
+SIZES = (500, 1000, 2000, 5000)
+QUERIES = 200
+CUTOFF = 90
+
+
+def make_titles(rng: random.Random, count: int) -> List[str]:
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+        for _ in range(count)
+    ]
+    titles: List[str] = []
+    while len(titles) < count:
+        title = " ".join(rng.choices(words, k=rng.randint(2, 6))).title()
+        if title not in titles:
+            titles.append(title)
+
+    return titles
+
+
+def make_query(rng: random.Random, title: str) -> str:
+    # Titles parsed from releases often differ slightly from the show's.
+    chars = list(title)
+    for _ in range(rng.randint(0, 3)):
+        chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+
+    return "".join(chars)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    all_titles = make_titles(rng, max(SIZES))
+
+    print(
+        f"{'titles':>8} {'linear':>12} {'index':>12} {'batch':>12} {'candidates':>12}"
+    )
+    for size in SIZES:
+        titles = all_titles[:size]
+        queries = [make_query(rng, rng.choice(titles)) for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        index = NGramIndex()
+        for title in titles:
+            index.add(title)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [extract_one(q, titles, score_cutoff=CUTOFF) for q in queries]
+        linear = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        found = [index.extract_one(q, score_cutoff=CUTOFF) for q in queries]
+        indexed = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        batched = index.extract_many(queries, score_cutoff=CUTOFF)
+        batch = (time.perf_counter() - start) / QUERIES
+
+        assert found == expected, "index disagrees with extract_one"
+        assert batched == expected, "extract_many disagrees with extract_one"
+
+        candidates = sum(len(index.candidates(q, CUTOFF)) for q in queries) / QUERIES
+        print(
+            f"{size:>8} {linear * 1e3:>9.3f} ms {indexed * 1e3:>9.3f} ms"
+            f" {batch * 1e3:>9.3f} ms"
+            f" {candidates:>12.1f}   (index built in {build * 1e3:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -250,7 +250,13 @@ feeds-fuzzy-cutoff-subtitle = Cutoff for matching show names
 
 feeds-pollinginterval-title = Polling Interval
 feeds-pollinginterval-tooltip = Setting this to a low number may get you blocked from certain RSS feeds
-feeds-pollinginterval-subtitle = Frequency for checking RSS feeds
+feeds-pollinginterval-subtitle = Starting frequency for checking each RSS feed
+
+feeds-minpollinginterval-title = Minimum Polling Interval
+feeds-minpollinginterval-subtitle = Shortest wait between checks of a busy feed
+
+feeds-maxpollinginterval-title = Maximum Polling Interval
+feeds-maxpollinginterval-subtitle = Longest wait between checks of a quiet feed
 
 feeds-completioncheck-title = Completion Check Interval
 feeds-completioncheck-subtitle = Frequency for checking completion status
@@ -0,0 +1,15 @@
+-- depends: 0036_change_default_host_bind
+
+CREATE INDEX IF NOT EXISTS show_entry_show_id_episode_idx ON show_entry (show_id, episode);
+
+CREATE INDEX IF NOT EXISTS show_entry_torrent_hash_idx ON show_entry (torrent_hash);
+
+CREATE INDEX IF NOT EXISTS show_entry_unfinished_idx ON show_entry (current_state)
+    WHERE current_state != 'completed' AND current_state != 'failed';
+
+CREATE INDEX IF NOT EXISTS encode_unfinished_idx ON encode (started_at, queued_at)
+    WHERE ended_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS seen_release_seen_at_idx ON seen_release (seen_at);
+
+CREATE INDEX IF NOT EXISTS webhook_base_idx ON webhook (base);
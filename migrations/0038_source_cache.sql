@@ -0,0 +1,11 @@
+-- depends: 0037_hot_path_indexes
+
+CREATE TABLE IF NOT EXISTS source_cache (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    last_etag TEXT,
+    last_modified TEXT,
+    most_recent_hash TEXT,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (name, version)
+);
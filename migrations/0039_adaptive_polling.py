@@ -0,0 +1,52 @@
+from sqlite3 import Connection
+
+from yoyo import step
+
+
+__depends__ = {"0038_source_cache"}
+
+
+COLUMNS = {
+    "min_polling_interval": 180,
+    "max_polling_interval": 3600,
+}
+
+
+def add_interval_bounds(con: Connection):
+    cur = con.cursor()
+    cur.execute(
+        """
+        PRAGMA table_info(feeds_config);
+    """
+    )
+    existing = {row[1] for row in cur.fetchall()}
+
+    for column, default in COLUMNS.items():
+        if column in existing:
+            continue
+
+        cur.execute(
+            f"""
+            ALTER TABLE
+                feeds_config
+            ADD COLUMN
+                {column} INTEGER NOT NULL DEFAULT {default};
+        """
+        )
+
+
+def drop_interval_bounds(con: Connection):
+    cur = con.cursor()
+
+    for column in COLUMNS:
+        cur.execute(
+            f"""
+            ALTER TABLE
+                feeds_config
+            DROP COLUMN
+                {column};
+        """
+        )
+
+
+steps = (step(add_interval_bounds, drop_interval_bounds),)
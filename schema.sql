@@ -48,6 +48,18 @@ CREATE TABLE seen_release (
     PRIMARY KEY (title, release_group, episode, resolution)
 );
 
+CREATE INDEX seen_release_seen_at_idx ON seen_release (seen_at);
+
+CREATE TABLE source_cache (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    last_etag TEXT,
+    last_modified TEXT,
+    most_recent_hash TEXT,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (name, version)
+);
+
 CREATE TABLE library (
     id INTEGER PRIMARY KEY,
     folder TEXT NOT NULL,
@@ -81,6 +93,13 @@ CREATE TABLE show_entry (
     last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX show_entry_show_id_episode_idx ON show_entry (show_id, episode);
+
+CREATE INDEX show_entry_torrent_hash_idx ON show_entry (torrent_hash);
+
+CREATE INDEX show_entry_unfinished_idx ON show_entry (current_state)
+    WHERE current_state != 'completed' AND current_state != 'failed';
+
 CREATE TABLE encode (
     entry_id INTEGER PRIMARY KEY REFERENCES show_entry(id) ON DELETE CASCADE,
     initial_size INTEGER,
@@ -90,6 +109,9 @@ CREATE TABLE encode (
     ended_at TIMESTAMP
 );
 
+CREATE INDEX encode_unfinished_idx ON encode (started_at, queued_at)
+    WHERE ended_at IS NULL;
+
 CREATE TABLE general_config (
     id INTEGER PRIMARY KEY CHECK (id = 0),
     host TEXT NOT NULL DEFAULT '0.0.0.0',
@@ -105,6 +127,8 @@ CREATE TABLE general_config (
 CREATE TABLE feeds_config (
     id INTEGER PRIMARY KEY CHECK (id = 0),
     polling_interval INTEGER NOT NULL DEFAULT 900,
+    min_polling_interval INTEGER NOT NULL DEFAULT 180,
+    max_polling_interval INTEGER NOT NULL DEFAULT 3600,
     complete_check_interval INTEGER NOT NULL DEFAULT 15,
     fuzzy_cutoff INTEGER NOT NULL DEFAULT 90,
     seed_ratio_limit REAL NOT NULL DEFAULT 0.0
@@ -167,6 +191,8 @@ CREATE TABLE webhook (
     PRIMARY KEY (show_id, base)
 );
 
+CREATE INDEX webhook_base_idx ON webhook (base);
+
 CREATE TABLE webhook_trigger (
     show_id INTEGER NOT NULL,
     base INTEGER NOT NULL,
@@ -4,7 +4,7 @@ from typing import AsyncGenerator
 import pytest
 import pytest_asyncio
 
-from tests.mock import MockTsundokuApp, mock_get_all_sources, mock_feedparser_parse
+from tests.mock import MockTsundokuApp, mock_get_all_sources, mock_fetch_source
 from tests.mock import filesystem
 
 
@@ -18,7 +18,7 @@ def pytest_collection_modifyitems(config, items):
 async def create_app(
     monkeypatch: pytest.MonkeyPatch,
 ) -> AsyncGenerator[MockTsundokuApp, None]:
-    monkeypatch.setattr("feedparser.parse", mock_feedparser_parse)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_source", mock_fetch_source)
     monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", mock_get_all_sources)
 
     monkeypatch.setattr("pathlib.Path.symlink_to", filesystem.mock_symlink_to)
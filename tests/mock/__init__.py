@@ -1,6 +1,6 @@
 from .app import MockTsundokuApp, UserType
 from .dl_client import InMemoryDownloadClient, MockDownloadManager
-from .rss_feed import mock_feedparser_parse
+from .rss_feed import mock_fetch_source
 from .sources import mock_get_all_sources
 
 __all__ = (
@@ -8,6 +8,6 @@ __all__ = (
     "UserType",
     "InMemoryDownloadClient",
     "MockDownloadManager",
-    "mock_feedparser_parse",
+    "mock_fetch_source",
     "mock_get_all_sources",
 )
@@ -27,7 +27,7 @@ from quart_rate_limiter import RateLimiter
 
 from .dl_client import MockDownloadManager
 from tsundoku.app import CustomFluentLocalization
-from tsundoku.asqlite import Connection, connect
+from tsundoku.asqlite import Connection, Writer, connect, create_writer
 from tsundoku.blueprints import api_blueprint, ux_blueprint
 from tsundoku.flags import Flags
 from tsundoku.feeds import Poller, Downloader, Encoder
@@ -64,6 +64,7 @@ class MockTsundokuApp(Quart):
 
     __async_db_connection: Connection
     __sync_db_connection: sqlite3.Connection
+    __db_writer: Writer
 
     def __init__(self):
         super().__init__("Tsundoku", static_folder=None)
@@ -97,6 +98,7 @@ class MockTsundokuApp(Quart):
         self.__sync_db_connection = sqlite3.connect(
             "file::memory:?cache=shared", uri=True
         )
+        self.__db_writer = create_writer(self.__async_db_connection)
 
         async with self.acquire_db() as con:
             async with aiofiles.open("schema.sql", "r") as fp:
@@ -175,6 +177,13 @@ class MockTsundokuApp(Quart):
 
         return sync_con_generator()
 
+    async def write_db(self, sql: str, /, *parameters) -> int:
+        return await self.__db_writer.execute(sql, *parameters)
+
+    async def write_many_db(self, sql: str, seq_of_parameters, /) -> int:
+        return await self.__db_writer.executemany(sql, seq_of_parameters)
+
     async def cleanup(self) -> None:
+        await self.__db_writer.close()
         await self.__async_db_connection.close()
         self.__sync_db_connection.close()
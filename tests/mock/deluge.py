@@ -0,0 +1,115 @@
+"""
+A stand-in for Deluge's WebAPI, implementing the JSON-RPC
+methods `DelugeClient` uses, including session authentication.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import re
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from aiohttp import web
+
+MAGNET_RE = re.compile(r"\burn:btih:([A-z\d]+)\b")
+
+SESSION_COOKIE = "_session_id"
+
+
+class DelugeServer:
+    """
+    Keeps torrents in memory and answers one JSON-RPC call
+    per request, like the Deluge Web UI's `/json` endpoint.
+
+    Attributes
+    ----------
+    requests: Counter[str]
+        The number of calls made to each method, e.g. `auth.login`.
+    calls: List[Dict[str, Any]]
+        Every call made, oldest first.
+    """
+
+    def __init__(self, password: str = "deluge") -> None:
+        self.password = password
+
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter[str] = Counter()
+        self.calls: List[Dict[str, Any]] = []
+
+        self._session: Optional[str] = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/json", self.json)
+        return app
+
+    def add_torrent(self, torrent_hash: str) -> None:
+        self.torrents[torrent_hash] = {
+            "hash": torrent_hash,
+            "name": torrent_hash,
+            "state": "Downloading",
+            "progress": 0.0,
+            "ratio": 0.0,
+            "move_completed_path": "/downloads",
+            "files": [{"path": f"{torrent_hash}.mkv"}],
+        }
+
+    def update(self, torrent_hash: str, **fields: Any) -> None:
+        self.torrents[torrent_hash].update(fields)
+
+    def expire_session(self) -> None:
+        self._session = None
+
+    async def json(self, request: web.Request) -> web.Response:
+        call = await request.json()
+        method = call["method"]
+        params = call.get("params", [])
+        self.requests[method] += 1
+        self.calls.append(call)
+
+        def respond(result: Any = None, error: Any = None) -> web.Response:
+            resp = web.json_response(
+                {"id": call["id"], "result": result, "error": error}
+            )
+            if method == "auth.login" and result:
+                resp.set_cookie(SESSION_COOKIE, self._session)
+            return resp
+
+        if method == "auth.login":
+            if params != [self.password]:
+                return respond(False)
+
+            self._session = uuid4().hex
+            return respond(True)
+
+        authorized = (
+            self._session is not None
+            and request.cookies.get(SESSION_COOKIE) == self._session
+        )
+        if method == "auth.check_session":
+            return respond(authorized)
+
+        if not authorized:
+            return respond(error={"message": "Not authenticated", "code": 1})
+
+        if method == "webapi.get_torrents":
+            ids, keys = params
+            torrents = [
+                {key: torrent[key] for key in keys if key in torrent}
+                for torrent_hash, torrent in self.torrents.items()
+                if ids is None or torrent_hash in ids
+            ]
+            return respond({"torrents": torrents})
+        elif method == "webapi.add_torrent":
+            match = MAGNET_RE.search(params[0])
+            if match is None:
+                return respond(error={"message": "Invalid magnet", "code": 3})
+
+            torrent_hash = match.group(1).lower()
+            self.add_torrent(torrent_hash)
+            return respond(torrent_hash)
+        elif method == "webapi.remove_torrent":
+            return respond(self.torrents.pop(params[0], None) is not None)
+
+        return respond(error={"message": "Unknown method", "code": 2})
@@ -4,9 +4,9 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from tsundoku.dl_client.abstract import TorrentClient
+from tsundoku.dl_client.abstract import TorrentClient, TorrentInfo
 from tsundoku.dl_client import Manager
 
 
@@ -84,6 +84,28 @@ class InMemoryDownloadClient(TorrentClient):
 
         return self.torrents[torrent_id].ratio
 
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        statuses = {}
+        for torrent_id in torrent_ids:
+            torrent = self.torrents.get(torrent_id)
+            if torrent is None:
+                continue
+
+            completed = torrent.is_complete()
+            statuses[torrent_id] = TorrentInfo(
+                torrent_id,
+                torrent.status.name.lower(),
+                completed,
+                1.0 if completed else 0.0,
+                torrent.ratio,
+                torrent.fp,
+                [torrent.fp.name] if torrent.fp else [],
+            )
+
+        return statuses
+
     async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
         self.torrents.pop(torrent_id, None)
 
@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Optional
 
 
-def mock_resolve_file(cls, path: Path, _) -> Optional[Path]:
+async def mock_resolve_file(cls, path: Path, _) -> Optional[Path]:
     return path
 
 
@@ -0,0 +1,178 @@
+"""
+A stand-in for qBittorrent's Web API, implementing the endpoints
+`qBittorrentClient` uses, including the `sync/maindata` delta protocol.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import json
+import re
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from aiohttp import web
+
+MAGNET_RE = re.compile(r"\burn:btih:([A-z\d]+)\b")
+
+
+class QBittorrentServer:
+    """
+    Keeps torrents in memory and remembers the revision each
+    of their fields last changed at, so that `sync/maindata`
+    only sends what changed since the requested `rid`.
+
+    Attributes
+    ----------
+    requests: Counter[str]
+        The number of requests made to each endpoint, e.g. `sync/maindata`.
+    responses: List[Dict[str, Any]]
+        Every `sync/maindata` response sent, oldest first.
+    """
+
+    def __init__(self, username: str = "admin", password: str = "password") -> None:
+        self.username = username
+        self.password = password
+
+        self.revision = 0
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter[str] = Counter()
+        self.responses: List[Dict[str, Any]] = []
+
+        self._sid: Optional[str] = None
+        # hash -> field -> revision it last changed at
+        self._modified: Dict[str, Dict[str, int]] = {}
+        # hash -> revision it was removed at
+        self._removed: Dict[str, int] = {}
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/v2/auth/login", self.login)
+        app.router.add_route("*", "/api/v2/torrents/add", self.add)
+        app.router.add_route("*", "/api/v2/torrents/info", self.info)
+        app.router.add_route("*", "/api/v2/torrents/delete", self.delete)
+        app.router.add_get("/api/v2/sync/maindata", self.maindata)
+        return app
+
+    def add_torrent(self, torrent_hash: str, name: Optional[str] = None) -> None:
+        self.update(
+            torrent_hash,
+            name=name or torrent_hash,
+            state="downloading",
+            progress=0.0,
+            ratio=0.0,
+            save_path="/downloads",
+            content_path=f"/downloads/{name or torrent_hash}",
+        )
+
+    def update(self, torrent_hash: str, **fields: Any) -> None:
+        """
+        Changes the fields of a torrent, adding it if it does not exist.
+        """
+        self.revision += 1
+        torrent = self.torrents.setdefault(torrent_hash, {"hash": torrent_hash})
+        modified = self._modified.setdefault(torrent_hash, {"hash": self.revision})
+        self._removed.pop(torrent_hash, None)
+
+        for field, value in fields.items():
+            if torrent.get(field) != value:
+                torrent[field] = value
+                modified[field] = self.revision
+
+    def remove_torrent(self, torrent_hash: str) -> None:
+        self.revision += 1
+        self.torrents.pop(torrent_hash, None)
+        self._modified.pop(torrent_hash, None)
+        self._removed[torrent_hash] = self.revision
+
+    def _json(self, data: Any) -> web.Response:
+        # qBittorrentClient only decodes this exact content type.
+        return web.Response(
+            body=json.dumps(data).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+
+    def _authorized(self, request: web.Request) -> bool:
+        return self._sid is not None and request.cookies.get("SID") == self._sid
+
+    async def login(self, request: web.Request) -> web.Response:
+        self.requests["auth/login"] += 1
+
+        form = await request.post()
+        if (
+            form.get("username") != self.username
+            or form.get("password") != self.password
+        ):
+            return web.Response(status=403, text="Fails.")
+
+        self._sid = uuid4().hex
+        resp = web.Response(text="Ok.")
+        resp.set_cookie("SID", self._sid)
+        return resp
+
+    async def add(self, request: web.Request) -> web.Response:
+        self.requests["torrents/add"] += 1
+        if not self._authorized(request):
+            return web.Response(status=403)
+
+        form = await request.post()
+        for url in str(form.get("urls", "")).splitlines():
+            match = MAGNET_RE.search(url)
+            if match is not None:
+                self.add_torrent(match.group(1).lower())
+
+        return web.Response(text="Ok.")
+
+    async def info(self, request: web.Request) -> web.Response:
+        self.requests["torrents/info"] += 1
+        if not self._authorized(request):
+            return web.Response(status=403)
+
+        hashes = request.query.get("hashes")
+        torrents = list(self.torrents.values())
+        if hashes:
+            wanted = set(hashes.split("|"))
+            torrents = [t for t in torrents if t["hash"] in wanted]
+
+        return self._json(torrents)
+
+    async def delete(self, request: web.Request) -> web.Response:
+        self.requests["torrents/delete"] += 1
+        if not self._authorized(request):
+            return web.Response(status=403)
+
+        params = {**request.query, **(await request.post())}
+        for torrent_hash in str(params.get("hashes", "")).split("|"):
+            if torrent_hash in self.torrents:
+                self.remove_torrent(torrent_hash)
+
+        return web.Response(text="Ok.")
+
+    async def maindata(self, request: web.Request) -> web.Response:
+        self.requests["sync/maindata"] += 1
+        if not self._authorized(request):
+            return web.Response(status=403)
+
+        rid = int(request.query.get("rid", "0"))
+        data: Dict[str, Any] = {"rid": self.revision}
+
+        # Unknown response IDs get everything, like a first sync.
+        if rid == 0 or rid > self.revision:
+            data["full_update"] = True
+            data["torrents"] = {h: dict(t) for h, t in self.torrents.items()}
+        else:
+            changed = {}
+            for torrent_hash, modified in self._modified.items():
+                torrent = self.torrents[torrent_hash]
+                fields = {f: torrent[f] for f, rev in modified.items() if rev > rid}
+                if fields:
+                    changed[torrent_hash] = fields
+
+            removed = [h for h, rev in self._removed.items() if rev > rid]
+            if changed:
+                data["torrents"] = changed
+            if removed:
+                data["torrents_removed"] = removed
+
+        self.responses.append(data)
+        return self._json(data)
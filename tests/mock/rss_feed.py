@@ -1,17 +1,13 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 import random
 import string
-from typing import List, TypedDict
+from typing import Any, AsyncIterator
+from xml.sax.saxutils import escape
 
-
-class MockRSSFeed(TypedDict):
-    items: List[MockRSSFeedItem]
-
-
-class MockRSSFeedItem(TypedDict):
-    title: str
-    link: str
+from tsundoku.feeds.poller import FetchedFeed
+from tsundoku.sources import Source
 
 
 BASE32_CHARSET = string.ascii_letters + "234567"
@@ -23,10 +19,32 @@ def generate_fake_magnet() -> str:
     )
 
 
-def mock_feedparser_parse(*_, **__) -> MockRSSFeed:
+def generate_rss_feed() -> bytes:
     with open("tests/mock/_rss_item_titles.txt", "r", encoding="utf-8") as fp:
         titles = [line.strip() for line in fp.readlines() if line]
 
-    return {
-        "items": [{"title": title, "link": generate_fake_magnet()} for title in titles]
-    }
+    items = "".join(
+        f"<item><title>{escape(title)}</title>"
+        f"<link>{escape(generate_fake_magnet())}</link></item>"
+        for title in titles
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0"><channel><title>Mock Feed</title>'
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+async def iter_chunks(body: bytes, size: int = 256) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@asynccontextmanager
+async def mock_fetch_source(_: Any, source: Source) -> AsyncIterator[FetchedFeed]:
+    yield FetchedFeed(
+        200,
+        iter_chunks(generate_rss_feed()),
+        {"content-type": "application/rss+xml", "content-location": source.url},
+    )
@@ -0,0 +1,157 @@
+"""
+A stand-in for Transmission's RPC server, implementing the methods
+`TransmissionClient` uses, including `recently-active` torrent lookups.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import json
+import re
+import time
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from aiohttp import web
+
+MAGNET_RE = re.compile(r"\burn:btih:([A-z\d]+)\b")
+
+# Seconds a change keeps a torrent in the `recently-active` set.
+RECENTLY_ACTIVE_SECONDS = 60
+
+
+class TransmissionServer:
+    """
+    Keeps torrents in memory and remembers when each of them
+    last changed or was removed, so that `torrent-get` with
+    `ids: "recently-active"` only sends those changed recently.
+
+    Attributes
+    ----------
+    requests: Counter[str]
+        The number of requests made with each RPC method, e.g. `torrent-get`.
+    queries: List[Dict[str, Any]]
+        The arguments of every `torrent-get` request made, oldest first.
+    responses: List[Dict[str, Any]]
+        The arguments of every `torrent-get` response sent, oldest first.
+    """
+
+    def __init__(self) -> None:
+        self.session_id = uuid4().hex
+
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter[str] = Counter()
+        self.queries: List[Dict[str, Any]] = []
+        self.responses: List[Dict[str, Any]] = []
+
+        self._next_id = 1
+        # hash -> time it last changed at
+        self._active: Dict[str, float] = {}
+        # id -> time it was removed at
+        self._removed: Dict[int, float] = {}
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/transmission/rpc", self.rpc)
+        return app
+
+    def add_torrent(self, torrent_hash: str) -> Dict[str, Any]:
+        torrent = {
+            "id": self._next_id,
+            "hashString": torrent_hash,
+            "name": torrent_hash,
+            "status": 4,
+            "isFinished": False,
+            "percentDone": 0.0,
+            "uploadRatio": 0.0,
+            "downloadDir": "/downloads",
+            "files": [{"name": f"{torrent_hash}.mkv"}],
+        }
+        self._next_id += 1
+        self.torrents[torrent_hash] = torrent
+        self._active[torrent_hash] = time.monotonic()
+        return torrent
+
+    def update(self, torrent_hash: str, **fields: Any) -> None:
+        self.torrents[torrent_hash].update(fields)
+        self._active[torrent_hash] = time.monotonic()
+
+    def remove_torrent(self, torrent_hash: str) -> None:
+        torrent = self.torrents.pop(torrent_hash)
+        self._active.pop(torrent_hash, None)
+        self._removed[torrent["id"]] = time.monotonic()
+
+    def settle(self) -> None:
+        """
+        Makes every change so far older than the recently active window.
+        """
+        self._active.clear()
+        self._removed.clear()
+
+    async def rpc(self, request: web.Request) -> web.Response:
+        if request.headers.get("X-Transmission-Session-Id") != self.session_id:
+            return web.Response(
+                status=409, headers={"X-Transmission-Session-Id": self.session_id}
+            )
+
+        body = await request.json()
+        method = body["method"]
+        arguments = body.get("arguments", {})
+        self.requests[method] += 1
+
+        if method == "torrent-get":
+            self.queries.append(arguments)
+            result = self.torrent_get(arguments)
+            self.responses.append(result)
+        elif method == "torrent-add":
+            match = MAGNET_RE.search(arguments.get("filename", ""))
+            if match is None:
+                return web.json_response({"result": "invalid magnet"})
+
+            torrent_hash = match.group(1).lower()
+            torrent = self.torrents.get(torrent_hash) or self.add_torrent(torrent_hash)
+            result = {"torrent-added": {"hashString": torrent["hashString"]}}
+        elif method == "torrent-remove":
+            for torrent in self._select(arguments.get("ids")):
+                self.remove_torrent(torrent["hashString"])
+            result = {}
+        elif method == "session-stats":
+            result = {}
+        else:
+            return web.json_response({"result": "method name not recognized"})
+
+        return web.Response(
+            text=json.dumps({"result": "success", "arguments": result}),
+            content_type="application/json",
+        )
+
+    def torrent_get(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        fields = arguments.get("fields", [])
+        ids = arguments.get("ids")
+
+        result: Dict[str, Any] = {}
+        if ids == "recently-active":
+            since = time.monotonic() - RECENTLY_ACTIVE_SECONDS
+            torrents = [self.torrents[h] for h, t in self._active.items() if t >= since]
+            result["removed"] = [i for i, t in self._removed.items() if t >= since]
+        else:
+            torrents = self._select(ids)
+
+        result["torrents"] = [
+            {field: t[field] for field in fields if field in t} for t in torrents
+        ]
+        return result
+
+    def _select(self, ids: Any) -> List[Dict[str, Any]]:
+        if ids is None:
+            return list(self.torrents.values())
+
+        if not isinstance(ids, list):
+            ids = [ids]
+
+        wanted = {str(i).lower() for i in ids}
+        return [
+            t
+            for t in self.torrents.values()
+            if t["hashString"] in wanted or str(t["id"]) in wanted
+        ]
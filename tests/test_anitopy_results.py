@@ -1,4 +1,12 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+import json
+from typing import Any
+
+import pytest
+
 from tsundoku import utils
+from tsundoku.sources import Source
 
 
 def parse_title(title: str) -> utils.ParserResult:
@@ -77,7 +85,7 @@ def test_6():
         {
             "release_group": "SubsPlease",
             "anime_title": "Bocchi the Rock!",
-            "episode_number": ["01", "12"],
+            "episode_number": ("01", "12"),
             "video_resolution": "1080p",
             "release_information": "Batch",
         },
@@ -105,3 +113,122 @@ def test_8():
             "episode_number": "01",
         },
     )
+
+
+def test_results_are_cached_and_read_only():
+    title = "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv"
+    utils.clear_parser_cache()
+
+    result = utils.parse_anime_title(title)
+    assert utils.parse_anime_title(title) is result
+
+    stats = utils.parser_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+    with pytest.raises(TypeError):
+        result["anime_title"] = "Bocchi the Rock!"  # type: ignore
+
+
+@pytest.mark.parametrize("threshold", [1, 1_000])
+async def test_parse_many_agrees_with_parse_anime_title(
+    monkeypatch: pytest.MonkeyPatch, threshold: int
+):
+    # A threshold of 1 sends every uncached title to the process pool.
+    monkeypatch.setattr(utils, "PARSER_PROCESS_THRESHOLD", threshold)
+    monkeypatch.setattr(utils, "PARSER_CHUNK_SIZE", 2)
+
+    titles = [
+        "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv",
+        "[SubsPlease] Bocchi the Rock! (01-12) (1080p) [Batch]",
+        "[ASW] Shadowverse Flame - 41 [1920x1080 HEVC x265 10Bit][AAC]",
+        "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv",
+        "[Erai-raws] Spy x Family - 25 [720p][Multiple Subtitle].mkv",
+    ]
+
+    utils.clear_parser_cache()
+    try:
+        results = await utils.parse_many(titles)
+    finally:
+        utils.shutdown_parser_pool()
+
+    assert utils.parser_cache_stats()["size"] == 4
+    assert results[0] is results[3]
+    assert results == [utils.parse_anime_title(title) for title in titles]
+
+
+async def test_parse_many_falls_back_when_the_pool_breaks(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(utils, "PARSER_PROCESS_THRESHOLD", 1)
+
+    def broken_submit(*_: Any) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(BrokenProcessPool())
+        return future
+
+    monkeypatch.setattr(utils, "_submit_chunk", broken_submit)
+
+    title = "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv"
+    utils.clear_parser_cache()
+    results = await utils.parse_many([title])
+
+    assert utils._parser_pool is None
+    assert results == [utils.parse_anime_title(title)]
+
+
+TEMPLATE_TITLES = [
+    "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv",
+    "[SubsPlease] NieR Automata Ver1.1a - 04 (720p) [CC00E892].mkv",
+    "[SubsPlease] NieR Automata Ver1.1a - 04v2 (720p) [CC00E892].mkv",
+    "[SubsPlease] Tomo-chan wa Onnanoko! - 03 (480p) [F21C23E2].mkv",
+    "[SubsPlease] Bocchi the Rock! (01-12) (1080p) [Batch]",
+    "[SubsPlease] Kaguya-sama - Love is War - 03 (1080p) [6E8B4C1A].mkv",
+    "[SubsPlease] Mob Psycho 100 III - 01 (1080p) [0A3F5B21].mkv",
+    "[SubsPlease] One Piece - 1071 (1080p) [9C0D3E44].mkv",
+    "[SubsPlease] Spy x Family - 12.5 (1080p) [5B7A2C90].mkv",
+    "[SubsPlease] Vinland Saga S2 - 01 (1080p) [D1E2F3A4].mkv",
+    "[SubsPlease] Kimi ni Todoke 3rd Season - 01 (1080p) [11223344].mkv",
+    "[SubsPlease] Urusei Yatsura (2022) - 01 (1080p) [55667788].mkv",
+]
+
+
+def test_filename_template_agrees_with_anitopy():
+    with open("default_sources/subsplease.json", "r", encoding="utf-8") as fp:
+        source = Source.from_object(json.load(fp))
+
+    with open("tests/mock/_rss_item_titles.txt", "r", encoding="utf-8") as fp:
+        titles = [line.strip() for line in fp if line.strip()]
+
+    matched = 0
+    for title in TEMPLATE_TITLES + titles:
+        result = source.parse_filename(title)
+        if result is None:
+            continue
+
+        matched += 1
+        assertAnitopyResultContains(title, result)
+
+    assert matched >= 10
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        r"(?P<anime_title>.+) - (?P<episode_number>\d+",
+        r"(?P<anime_title>.+) - (?P<episode>\d+)",
+        r"(?P<anime_title>.+) - \d+",
+    ],
+)
+def test_invalid_filename_templates(template: str):
+    with pytest.raises(Exception, match="filenameTemplate"):
+        Source.from_object(
+            {
+                "name": "Template",
+                "version": "1.0.0",
+                "url": "https://example.com/rss",
+                "rssItemKeyMapping": {"filename": "$.title", "torrent": "$.link"},
+                "filenameTemplate": template,
+            }
+        )
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+from yoyo import get_backend, read_migrations
+
+from tsundoku import asqlite, database
+
+
+async def test_pool_reuses_connections(tmp_path: Path):
+    pool = asqlite.create_pool(str(tmp_path / "pool.db"), size=2)
+
+    seen = set()
+    for _ in range(10):
+        async with pool.acquire() as con:
+            seen.add(id(con))
+            assert await con.fetchval("SELECT 1;") == 1
+
+    stats = pool.stats()
+    await pool.close()
+
+    assert len(seen) <= 2
+    assert stats["open"] == 2
+    assert stats["idle"] == 2
+    assert stats["leases"] == 10
+
+
+async def test_pool_lease_timeout(tmp_path: Path):
+    pool = asqlite.create_pool(str(tmp_path / "pool.db"), size=1)
+
+    async with pool.acquire():
+        with pytest.raises(asyncio.TimeoutError):
+            async with pool.acquire(timeout=0.05):
+                pass
+
+        assert pool.stats()["in_use"] == 1
+
+    stats = pool.stats()
+    await pool.close()
+
+    assert stats["timeouts"] == 1
+    assert stats["in_use"] == 0
+
+
+async def test_pool_rolls_back_on_release(tmp_path: Path):
+    pool = asqlite.create_pool(str(tmp_path / "pool.db"), size=1)
+
+    async with pool.acquire() as con:
+        await con.execute("CREATE TABLE t (x INTEGER);")
+        await con.execute("BEGIN TRANSACTION;")
+        await con.execute("INSERT INTO t (x) VALUES (1);")
+
+    async with pool.acquire() as con:
+        count = await con.fetchval("SELECT COUNT(*) FROM t;")
+
+    await pool.close()
+
+    assert count == 0
+
+
+async def test_writer_coalesces_writes(tmp_path: Path):
+    con = await asqlite.connect(str(tmp_path / "writer.db"))
+    await con.execute("CREATE TABLE t (x INTEGER UNIQUE);")
+
+    writer = asqlite.create_writer(con, window=0.01)
+    await asyncio.gather(
+        *(writer.execute("INSERT INTO t (x) VALUES (?);", i) for i in range(50))
+    )
+
+    stats = writer.stats()
+    count = await con.fetchval("SELECT COUNT(*) FROM t;")
+
+    await writer.close()
+    await con.close()
+
+    assert count == 50
+    assert stats["writes"] == 50
+    assert stats["batches"] < 50
+
+
+async def test_writer_isolates_failures(tmp_path: Path):
+    con = await asqlite.connect(str(tmp_path / "writer.db"))
+    await con.execute("CREATE TABLE t (x INTEGER UNIQUE);")
+
+    writer = asqlite.create_writer(con, window=0.01)
+    results = await asyncio.gather(
+        writer.execute("INSERT INTO t (x) VALUES (1);"),
+        writer.execute("INSERT INTO t (x) VALUES (1);"),
+        writer.execute("INSERT INTO t (x) VALUES (2);"),
+        return_exceptions=True,
+    )
+
+    count = await con.fetchval("SELECT COUNT(*) FROM t;")
+
+    await writer.close()
+    await con.close()
+
+    assert results[0] == 1 and results[2] == 1
+    assert isinstance(results[1], sqlite3.IntegrityError)
+    assert count == 2
+
+
+async def test_worker_counters_and_shutdown():
+    con = await asqlite.connect(":memory:")
+    await asyncio.gather(*(con.fetchval("SELECT 1;") for _ in range(20)))
+
+    stats = con.worker_stats()
+    worker = con._queue
+    await con.close()
+    worker.join(timeout=1)
+
+    assert stats["queue_depth"] == 0
+    assert stats["executed"] >= 20
+    assert not worker.is_alive()
+
+
+async def test_migrate_backs_up_only_when_migrations_are_pending(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setattr("tsundoku.database.DATA_DIR", tmp_path)
+    backup = tmp_path / "tsundoku.db.autobak"
+
+    con = sqlite3.connect(tmp_path / "tsundoku.db")
+    con.executescript(Path("schema.sql").read_text())
+    con.close()
+
+    backend = get_backend(f"sqlite:///{tmp_path / 'tsundoku.db'}")
+    migrations = read_migrations("migrations")
+    with backend.lock():
+        backend.mark_migrations(backend.to_apply(migrations))
+
+    await database.migrate()
+    assert not backup.exists()
+
+    with backend.lock():
+        backend.unmark_migrations(migrations[-1:])
+
+    await database.migrate()
+    assert backup.exists()
+
+    con = sqlite3.connect(tmp_path / "tsundoku.db")
+    auto_vacuum = con.execute("PRAGMA auto_vacuum;").fetchone()[0]
+    con.close()
+
+    assert auto_vacuum == 2
+
+
+async def test_maintain_reclaims_free_pages(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setattr("tsundoku.database.DATA_DIR", tmp_path)
+    database.enable_incremental_vacuum()
+
+    con = sqlite3.connect(tmp_path / "tsundoku.db", isolation_level=None)
+    con.execute("CREATE TABLE t (x BLOB);")
+    con.executemany(
+        "INSERT INTO t (x) VALUES (?);", ((b"x" * 4096,) for _ in range(64))
+    )
+    con.execute("DELETE FROM t;")
+    assert con.execute("PRAGMA freelist_count;").fetchone()[0] > 0
+
+    try:
+        await database.maintain()
+    finally:
+        await database.close_pool()
+
+    free_pages = con.execute("PRAGMA freelist_count;").fetchone()[0]
+    con.close()
+
+    assert free_pages == 0
+
+
+async def test_query_statistics_aggregate_normalized_statements(
+    caplog: pytest.LogCaptureFixture,
+):
+    asqlite.query_statistics.reset()
+    con = await asqlite.connect(":memory:")
+    await con.execute("CREATE TABLE t (x INTEGER);")
+    await con.executemany("INSERT INTO t (x) VALUES (?);", ((i,) for i in range(10)))
+
+    assert len(await con.fetchall("SELECT x FROM t WHERE x > 1;")) == 8
+    assert len(await con.fetchall("SELECT   x FROM t WHERE x > 4;")) == 5
+
+    asqlite.query_statistics.slow_query_threshold = 0
+    try:
+        await con.fetchval("SELECT COUNT(*) FROM t;")
+    finally:
+        asqlite.query_statistics.slow_query_threshold = None
+    await con.close()
+
+    statements = {s["sql"]: s for s in asqlite.query_statistics.snapshot()}
+    select = statements["SELECT x FROM t WHERE x > ?"]
+    # Fetches are part of the execution they read from.
+    assert select["calls"] == 2
+    assert select["rows"] == 13
+    assert statements["INSERT INTO t (x) VALUES (?)"]["rows"] == 10
+    assert "Slow query: SELECT COUNT(*) FROM t" in caplog.text
+
+
+def test_query_statistics_add_fetches_to_their_execution(
+    caplog: pytest.LogCaptureFixture,
+):
+    stats = asqlite.QueryStatistics(slow_query_threshold=0.5)
+    execution = asqlite._Execution("SELECT x FROM t;")
+
+    # Neither reaches the threshold alone, together they do.
+    stats._record(execution, execution_time=0.3, queue_wait=0.1, rows=0)
+    assert "Slow query" not in caplog.text
+    for _ in range(2):
+        stats._record(execution, execution_time=0.3, queue_wait=0.0, rows=2, fetch=True)
+
+    [select] = stats.snapshot()
+    assert select["calls"] == 1 and select["rows"] == 4
+    assert select["average_time"] == select["max_time"] == pytest.approx(0.9)
+    assert select["average_queue_wait"] == pytest.approx(0.1)
+    assert caplog.text.count("Slow query: SELECT x FROM t") == 1
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, Tuple
+
+import aiohttp
+from aiohttp.test_utils import TestServer
+import pytest_asyncio
+
+from tests.mock.deluge import DelugeServer
+from tests.mock.qbittorrent import QBittorrentServer
+from tests.mock.transmission import TransmissionServer
+from tsundoku.dl_client.deluge import DelugeClient
+from tsundoku.dl_client.qbittorrent import qBittorrentClient
+from tsundoku.dl_client.transmission import TransmissionClient
+
+HASHES = ("a" * 40, "b" * 40, "c" * 40)
+
+
+@pytest_asyncio.fixture
+async def qbittorrent() -> AsyncIterator[Tuple[QBittorrentServer, qBittorrentClient]]:
+    server = QBittorrentServer()
+    async with TestServer(server.make_app()) as test_server:
+        # Cookies are not stored for IP addresses otherwise.
+        jar = aiohttp.CookieJar(unsafe=True)
+        async with aiohttp.ClientSession(cookie_jar=jar) as session:
+            client = qBittorrentClient(
+                session,
+                {"username": server.username, "password": server.password},
+                host=test_server.host,
+                port=test_server.port,
+                secure=False,
+            )
+            yield server, client
+
+
+@pytest_asyncio.fixture
+async def transmission() -> AsyncIterator[
+    Tuple[TransmissionServer, TransmissionClient]
+]:
+    server = TransmissionServer()
+    async with TestServer(server.make_app()) as test_server:
+        async with aiohttp.ClientSession() as session:
+            client = TransmissionClient(
+                session,
+                host=test_server.host,
+                port=test_server.port,
+                secure=False,
+            )
+            yield server, client
+
+
+@pytest_asyncio.fixture
+async def deluge() -> AsyncIterator[Tuple[DelugeServer, DelugeClient]]:
+    server = DelugeServer()
+    async with TestServer(server.make_app()) as test_server:
+        jar = aiohttp.CookieJar(unsafe=True)
+        async with aiohttp.ClientSession(cookie_jar=jar) as session:
+            client = DelugeClient(
+                session,
+                host=test_server.host,
+                port=test_server.port,
+                secure=False,
+                auth=server.password,
+            )
+            yield server, client
+
+
+async def test_qbittorrent_mirror_follows_deltas(
+    qbittorrent: Tuple[QBittorrentServer, qBittorrentClient]
+):
+    server, client = qbittorrent
+    for torrent_hash in HASHES:
+        server.add_torrent(torrent_hash)
+
+    statuses = await client.get_torrents_status(HASHES)
+    assert not any(status.completed for status in statuses.values())
+    assert server.responses[-1].get("full_update")
+
+    server.update(HASHES[0], state="uploading", progress=1.0, ratio=0.5)
+    server.remove_torrent(HASHES[1])
+
+    statuses = await client.get_torrents_status(HASHES)
+    assert set(statuses) == {HASHES[0], HASHES[2]}
+    assert statuses[HASHES[0]].completed and statuses[HASHES[0]].ratio == 0.5
+    assert statuses[HASHES[0]].content_path == Path("/downloads", HASHES[0])
+    assert not statuses[HASHES[2]].completed
+
+    # Only what changed is sent after the first sync.
+    delta = server.responses[-1]
+    assert not delta.get("full_update")
+    assert delta["torrents"] == {
+        HASHES[0]: {"state": "uploading", "progress": 1.0, "ratio": 0.5}
+    }
+    assert delta["torrents_removed"] == [HASHES[1]]
+
+    await client.get_torrents_status(HASHES)
+    assert "torrents" not in server.responses[-1]
+    assert server.requests["torrents/info"] == 0
+
+
+async def test_qbittorrent_per_torrent_checks_use_the_mirror(
+    qbittorrent: Tuple[QBittorrentServer, qBittorrentClient]
+):
+    server, client = qbittorrent
+
+    torrent_hash = await client.add_torrent(f"magnet:?xt=urn:btih:{HASHES[0]}")
+    assert torrent_hash == HASHES[0]
+    assert not await client.check_torrent_completed(HASHES[0])
+
+    server.update(HASHES[0], state="stalledUP", progress=1.0, ratio=1.5)
+    assert await client.check_torrent_completed(HASHES[0])
+    assert await client.check_torrent_ratio(HASHES[0]) == 1.5
+    assert await client.get_torrent_fp(HASHES[0]) == Path("/downloads", HASHES[0])
+    assert await client.get_torrent_fp(HASHES[1]) is None
+
+    assert server.requests["auth/login"] == 1
+    assert server.requests["sync/maindata"] == 5
+    assert server.requests["torrents/info"] == 0
+
+
+async def test_transmission_table_follows_recent_activity(
+    transmission: Tuple[TransmissionServer, TransmissionClient]
+):
+    server, client = transmission
+    for torrent_hash in HASHES:
+        server.add_torrent(torrent_hash)
+
+    statuses = await client.get_torrents_status(HASHES)
+    assert set(statuses) == set(HASHES)
+    assert not any(status.completed for status in statuses.values())
+    assert "removed" not in server.responses[-1]
+
+    server.settle()
+    server.update(HASHES[0], status=6, percentDone=1.0, uploadRatio=0.5)
+    server.remove_torrent(HASHES[1])
+
+    statuses = await client.get_torrents_status(HASHES)
+    assert set(statuses) == {HASHES[0], HASHES[2]}
+    assert statuses[HASHES[0]].completed and statuses[HASHES[0]].ratio == 0.5
+    assert statuses[HASHES[0]].content_path == Path("/downloads", HASHES[0])
+    assert not statuses[HASHES[2]].completed
+
+    # Only the recently active torrents are sent after the first sync,
+    # without the fields that are not needed for their status.
+    delta = server.responses[-1]
+    assert [t["hashString"] for t in delta["torrents"]] == [HASHES[0]]
+    assert "files" not in delta["torrents"][0]
+    assert delta["removed"] == [2]
+    assert server.requests["torrent-get"] == 2
+
+
+async def test_transmission_table_is_rebuilt_when_stale(
+    transmission: Tuple[TransmissionServer, TransmissionClient]
+):
+    server, client = transmission
+    server.add_torrent(HASHES[0])
+    await client.get_torrents_status(HASHES[:1])
+
+    # Changes that are no longer recent are only seen by requesting
+    # the torrents again.
+    server.update(HASHES[0], status=6, percentDone=1.0)
+    server.settle()
+    statuses = await client.get_torrents_status(HASHES[:1])
+    assert not statuses[HASHES[0]].completed
+
+    client._synced_at -= 60
+    statuses = await client.get_torrents_status(HASHES[:1])
+    assert statuses[HASHES[0]].completed
+    assert "removed" not in server.responses[-1]
+    assert server.requests["torrent-get"] == 3
+
+
+async def test_transmission_long_intervals_only_request_tracked_torrents(
+    transmission: Tuple[TransmissionServer, TransmissionClient]
+):
+    server, client = transmission
+    for torrent_hash in HASHES:
+        server.add_torrent(torrent_hash)
+
+    await client.get_torrents_status(HASHES[:2])
+    server.update(HASHES[0], status=6, percentDone=1.0)
+    server.remove_torrent(HASHES[1])
+    server.settle()
+
+    # Checks further apart than the recently active window.
+    client._synced_at -= 300
+    statuses = await client.get_torrents_status(HASHES[:2])
+    assert list(statuses) == [HASHES[0]] and statuses[HASHES[0]].completed
+
+    # Torrents that are not tracked are never sent.
+    assert server.queries[-1]["ids"] == list(HASHES[:2])
+    assert all("ids" in query for query in server.queries)
+    assert all(
+        torrent["hashString"] != HASHES[2]
+        for response in server.responses
+        for torrent in response["torrents"]
+    )
+
+    # A torrent that starts being tracked is requested once.
+    await client.get_torrents_status(HASHES)
+    await client.get_torrents_status(HASHES)
+    assert server.queries[-2:] == [
+        {"ids": [HASHES[2]], "fields": server.queries[-1]["fields"]},
+        {"ids": "recently-active", "fields": server.queries[-1]["fields"]},
+    ]
+
+
+async def test_transmission_full_lookups_without_delta_sync(
+    transmission: Tuple[TransmissionServer, TransmissionClient]
+):
+    server, client = transmission
+    client.delta_sync = False
+    server.add_torrent(HASHES[0])
+
+    statuses = await client.get_torrents_status(HASHES)
+    assert list(statuses) == [HASHES[0]]
+    assert statuses[HASHES[0]].files == [f"{HASHES[0]}.mkv"]
+
+
+async def test_deluge_session_is_reused(deluge: Tuple[DelugeServer, DelugeClient]):
+    server, client = deluge
+
+    torrent_hash = await client.add_torrent(f"magnet:?xt=urn:btih:{HASHES[0]}")
+    assert torrent_hash == HASHES[0]
+    assert not await client.check_torrent_completed(HASHES[0])
+    server.update(HASHES[0], state="Seeding", progress=100.0)
+    statuses = await client.get_torrents_status(HASHES)
+    assert list(statuses) == [HASHES[0]] and statuses[HASHES[0]].completed
+
+    assert server.requests["auth.login"] == 1
+    assert server.requests["auth.check_session"] == 0
+    assert sum(server.requests.values()) == 4
+
+    # An expired session is renewed once and the call is made again.
+    server.expire_session()
+    assert await client.get_torrent_fp(HASHES[0]) == Path("/downloads", HASHES[0])
+    assert server.requests["auth.login"] == 2
+    assert server.requests["webapi.get_torrents"] == 4
+
+
+async def test_deluge_failed_authentication_does_not_wait(
+    deluge: Tuple[DelugeServer, DelugeClient]
+):
+    server, client = deluge
+    client.password = "wrong"
+
+    assert not await asyncio.wait_for(client.test_client(), 1)
+    assert await asyncio.wait_for(client.get_torrents_status(HASHES), 1) == {}
+    assert server.requests["auth.login"] == 2
+    assert sum(server.requests.values()) == 2
+
+
+async def test_deluge_concurrent_lookups_share_a_call(
+    deluge: Tuple[DelugeServer, DelugeClient]
+):
+    server, client = deluge
+    for torrent_hash in HASHES[:2]:
+        server.add_torrent(torrent_hash)
+    server.update(HASHES[0], state="Seeding", ratio=2.0)
+
+    completed, ratio, fp, exists = await asyncio.gather(
+        client.check_torrent_completed(HASHES[0]),
+        client.check_torrent_ratio(HASHES[0]),
+        client.get_torrent_fp(HASHES[1]),
+        client.check_torrent_exists(HASHES[2]),
+    )
+    assert completed and ratio == 2.0
+    assert fp == Path("/downloads", HASHES[1])
+    assert not exists
+
+    assert server.requests["webapi.get_torrents"] == 1
+    ids, keys = server.calls[-1]["params"]
+    assert sorted(ids) == sorted(HASHES)
+    assert set(keys) == {"hash", "state", "ratio", "name", "move_completed_path"}
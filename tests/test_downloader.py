@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
 
-from pytest import LogCaptureFixture
+from pytest import LogCaptureFixture, MonkeyPatch
 
 from tests.mock import MockTsundokuApp
+from tests.mock.dl_client import InMemoryDownloadClient
 from tsundoku.config import GeneralConfig
+from tsundoku.dl_client import TorrentInfo
+from tsundoku.feeds.downloader import Downloader
+from tsundoku.manager import Entry
 
 
 async def test_expected_file_paths(app: MockTsundokuApp, caplog: LogCaptureFixture):
@@ -68,3 +74,103 @@ async def test_no_season_folder(app: MockTsundokuApp, caplog: LogCaptureFixture)
 
     for path in paths:
         assert path.parts in expected_parts
+
+
+async def test_entries_are_checked_with_one_status_request(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.poller.poll()
+    app.dl_client.mark_all_torrent_complete()
+
+    requested = []
+    get_torrents_status = InMemoryDownloadClient.get_torrents_status
+
+    async def counting_get_torrents_status(
+        client: InMemoryDownloadClient, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        requested.append(list(torrent_ids))
+        return await get_torrents_status(client, torrent_ids)
+
+    async def per_torrent_request(*_: Any) -> None:
+        raise AssertionError("torrents should not be checked one at a time")
+
+    monkeypatch.setattr(
+        InMemoryDownloadClient, "get_torrents_status", counting_get_torrents_status
+    )
+    for method in ("check_torrent_completed", "check_torrent_ratio", "get_torrent_fp"):
+        monkeypatch.setattr(InMemoryDownloadClient, method, per_torrent_request)
+
+    await app.downloader.check_show_entries()
+
+    async with app.acquire_db() as con:
+        states = await con.fetchall("SELECT current_state FROM show_entry;")
+
+    assert len(requested) == 1 and len(requested[0]) == len(states) > 1
+    assert all(row["current_state"] == "completed" for row in states)
+
+
+async def test_entries_are_checked_concurrently(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.poller.poll()
+    app.dl_client.mark_all_torrent_complete()
+
+    app.downloader.move_semaphore = asyncio.Semaphore(2)
+    handle_move = Downloader.handle_move
+    moving = []
+    most_moving = 0
+
+    async def slow_handle_move(downloader: Downloader, entry: Entry) -> Optional[Path]:
+        nonlocal most_moving
+        moving.append(entry.id)
+        most_moving = max(most_moving, len(moving))
+        await asyncio.sleep(0.05)
+        moving.remove(entry.id)
+        return await handle_move(downloader, entry)
+
+    monkeypatch.setattr(Downloader, "handle_move", slow_handle_move)
+    await app.downloader.check_show_entries()
+
+    async with app.acquire_db() as con:
+        states = await con.fetchall("SELECT current_state FROM show_entry;")
+
+    # Moves overlap, but never more than the semaphore allows.
+    assert len(states) > 2 and most_moving == 2
+    assert all(row["current_state"] == "completed" for row in states)
+
+
+async def test_entry_is_not_checked_twice_at_once(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.poller.poll()
+    app.dl_client.mark_all_torrent_complete()
+
+    handle_rename = Downloader.handle_rename
+    renamed = []
+
+    async def slow_handle_rename(
+        downloader: Downloader, entry: Entry
+    ) -> Optional[Path]:
+        renamed.append(entry.id)
+        await asyncio.sleep(0.05)
+        return await handle_rename(downloader, entry)
+
+    monkeypatch.setattr(Downloader, "handle_rename", slow_handle_rename)
+
+    async with app.acquire_db() as con:
+        entry_id = await con.fetchval("SELECT id FROM show_entry LIMIT 1;")
+
+    entry = await Entry.from_entry_id(app, entry_id)  # type: ignore
+    same_entry = await Entry.from_entry_id(app, entry_id)  # type: ignore
+    await asyncio.gather(
+        app.downloader.check_show_entry(entry),
+        app.downloader.check_show_entry(same_entry),
+    )
+
+    assert renamed == [entry_id]
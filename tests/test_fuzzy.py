@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+import random
+import string
+
+import pytest
+
+from tsundoku.feeds import fuzzy
+from tsundoku.feeds.fuzzy import NGramIndex, extract_many, extract_one
+
+
+def random_titles(rng: random.Random, count: int) -> list[str]:
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(count // 2)
+    ]
+    titles = (" ".join(rng.choices(words, k=rng.randint(1, 5))) for _ in range(count))
+    return list(dict.fromkeys(titles))
+
+
+def mutate(rng: random.Random, title: str) -> str:
+    chars = list(title)
+    for _ in range(rng.randint(0, 4)):
+        i = rng.randrange(len(chars))
+        op = rng.random()
+        if op < 0.4:
+            chars.insert(i, rng.choice(string.ascii_lowercase + " "))
+        elif op < 0.8 and len(chars) > 1:
+            chars.pop(i)
+        else:
+            chars[i] = rng.choice(string.ascii_lowercase)
+
+    return "".join(chars)
+
+
+def test_index_agrees_with_extract_one():
+    rng = random.Random(0)
+    titles = random_titles(rng, 200)
+
+    index = NGramIndex()
+    for title in titles:
+        index.add(title)
+
+    for _ in range(50):
+        query = mutate(rng, rng.choice(titles))
+        for cutoff in (0, 50, 80, 90, 95, 100):
+            assert index.extract_one(query, score_cutoff=cutoff) == extract_one(
+                query, titles, score_cutoff=cutoff
+            )
+
+
+def test_index_candidates_can_all_reach_the_cutoff():
+    rng = random.Random(2)
+    titles = random_titles(rng, 300)
+
+    index = NGramIndex()
+    for title in titles:
+        index.add(title)
+
+    for _ in range(50):
+        query = mutate(rng, rng.choice(titles))
+        for cutoff in (50, 80, 90, 95, 100):
+            ratios = {
+                t: 100 * SequenceMatcher(None, query, t).quick_ratio() for t in titles
+            }
+            candidates = index.candidates(query, cutoff)
+            # Only choices whose ratio rounds to at least the cutoff are kept.
+            assert candidates == {t for t, r in ratios.items() if r >= cutoff - 0.5}
+
+
+def test_index_updates_incrementally():
+    index = NGramIndex()
+    index.add("Kimetsu no Yaiba")
+    index.add("Shingeki no Kyojin")
+
+    assert index.extract_one("Shingeki no Kyojin", score_cutoff=90) == (
+        "Shingeki no Kyojin",
+        100,
+    )
+
+    index.remove("Shingeki no Kyojin")
+    assert index.extract_one("Shingeki no Kyojin", score_cutoff=90) is None
+    assert len(index) == 1
+
+    index.add("Shingeki no Kyojin")
+    assert "Shingeki no Kyojin" in index
+    assert index.candidates("Shingeki no Kyojin", 90) == {"Shingeki no Kyojin"}
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_extract_many_agrees_with_extract_one(
+    monkeypatch: pytest.MonkeyPatch, vectorized: bool
+):
+    if vectorized:
+        assert fuzzy.np is not None, "NumPy is in requirements.txt"
+    else:
+        monkeypatch.setattr(fuzzy, "np", None)
+
+    rng = random.Random(1)
+    titles = random_titles(rng, 200)
+    # Ties are resolved to the first choice, as in `extract_one`.
+    titles += ["ab", "ba"]
+    queries = [mutate(rng, rng.choice(titles)) for _ in range(50)] + ["", "ab"]
+
+    for cutoff in (0, 50, 80, 90, 95, 100):
+        assert extract_many(queries, titles, score_cutoff=cutoff) == [
+            extract_one(query, titles, score_cutoff=cutoff) for query in queries
+        ]
@@ -1,10 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from typing import Any, AsyncGenerator
 
-from pytest import LogCaptureFixture
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import feedparser
+from pytest import LogCaptureFixture, MonkeyPatch
 
 from tests.mock import MockTsundokuApp
+from tests.mock.rss_feed import generate_rss_feed, mock_fetch_source
+from tsundoku import asqlite
+from tsundoku.feeds.fuzzy import extract_one
+from tsundoku.feeds.matcher import ShowMatcher
+from tsundoku.feeds.poller import ParsedEntries, Poller
+from tsundoku.feeds.schedule import published_at, SourceSchedule
+from tsundoku.feeds.stream import FeedStream
+from tsundoku.manager import Show
+from tsundoku.sources import Source
+
+# Kept before the app fixture swaps it out for the mock.
+fetch_source = Poller.fetch_source
 
 
 async def test_all_found_are_managed(app: MockTsundokuApp, caplog: LogCaptureFixture):
@@ -63,3 +82,346 @@ async def test_rss_force_poll(app: MockTsundokuApp, caplog: LogCaptureFixture):
     found_after = await app.poller.poll(force=True)
 
     assert len(found) > 0 and len(found) == len(found_after)
+
+
+async def test_slow_source_does_not_block_poll(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.WARNING, logger="tsundoku")
+
+    async def fast(_: web.Request) -> web.Response:
+        return web.Response(body=generate_rss_feed(), content_type="application/xml")
+
+    released = asyncio.Event()
+
+    async def slow(_: web.Request) -> web.Response:
+        await released.wait()
+        return web.Response(body=generate_rss_feed(), content_type="application/xml")
+
+    server_app = web.Application()
+    server_app.router.add_get("/fast", fast)
+    server_app.router.add_get("/slow", slow)
+
+    async with TestServer(server_app) as server:
+
+        async def get_all_sources() -> AsyncGenerator[Source, None]:
+            for name, timeout in (("slow", 0.2), ("fast", None)):
+                yield Source.from_object(
+                    {
+                        "name": name,
+                        "version": "1.0.0",
+                        "url": str(server.make_url(f"/{name}")),
+                        "timeout": timeout,
+                        "rssItemKeyMapping": {
+                            "filename": "$.title",
+                            "torrent": "$.link",
+                        },
+                    }
+                )
+
+        monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", get_all_sources)
+        monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_source", fetch_source)
+
+        async with aiohttp.ClientSession() as session:
+            app.session = session
+
+            start = time.perf_counter()
+            found = await app.poller.poll()
+            elapsed = time.perf_counter() - start
+
+        released.set()
+
+    assert len(found) > 0
+    assert elapsed < 5
+    assert "`slow@1.0.0` - Timed out fetching RSS feed" in caplog.text
+
+
+async def test_rss_cache_survives_restart(
+    app: MockTsundokuApp, caplog: LogCaptureFixture
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    found = await app.poller.poll()
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+
+    app.poller = Poller(app.app_context())
+    found_after = await app.poller.poll()
+
+    assert len(found) > 0 and len(found_after) == 0
+
+
+async def test_show_matcher_is_updated_after_show_changes(
+    app: MockTsundokuApp, monkeypatch: MonkeyPatch
+):
+    async def from_show_id(*_: Any) -> None:
+        return None
+
+    # Metadata would be fetched from Kitsu otherwise.
+    monkeypatch.setattr("tsundoku.manager.show.KitsuManager.from_show_id", from_show_id)
+
+    matcher = await ShowMatcher.get(app)
+    assert await ShowMatcher.get(app) is matcher
+
+    async with app.acquire_db() as con:
+        show_id = await con.fetchval("SELECT id FROM shows WHERE watch = 1 LIMIT 1;")
+
+    show = await Show.from_id(app, show_id)
+    show.watch = False
+    await show.update()
+
+    shows = len(matcher)
+    assert len(await ShowMatcher.get(app)) == shows - 1
+
+
+async def test_show_matcher_agrees_with_extract_one(app: MockTsundokuApp):
+    async with app.acquire_db() as con:
+        titles = [
+            row["title"] for row in await con.fetchall("SELECT title FROM shows;")
+        ]
+
+    matcher = ShowMatcher(enumerate(titles))
+
+    with open("tests/mock/_rss_item_titles.txt", "r", encoding="utf-8") as fp:
+        names = [line.strip() for line in fp.readlines() if line]
+
+    for cutoff in (0, 50, 80, 90, 95):
+        matches = matcher.match_many(names, cutoff)
+        for name, batch_match in zip(names, matches):
+            expected = extract_one(name, titles, score_cutoff=cutoff)
+            match = matcher.match(name, cutoff)
+            assert (match and (match[0], match[2])) == expected
+            assert batch_match == match
+
+
+async def test_poll_loads_parsed_entries_once(
+    app: MockTsundokuApp, caplog: LogCaptureFixture
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    asqlite.query_statistics.reset()
+    found = await app.poller.poll()
+
+    statements = asqlite.query_statistics.snapshot()
+    entry_lookups = sum(
+        s["calls"]
+        for s in statements
+        if "FROM show_entry" in s["sql"] and "show_id" in s["sql"].split("WHERE")[-1]
+    )
+    preference_lookups = sum(
+        s["calls"] for s in statements if "preferred_release_group FROM" in s["sql"]
+    )
+
+    # Each is one query for the whole poll, whatever the number of matches.
+    assert len(found) > 1
+    assert entry_lookups == 1
+    assert preference_lookups == 1
+
+
+async def test_parsed_entries_keep_highest_version(app: MockTsundokuApp):
+    parsed = ParsedEntries(app)
+    parsed.add(1, 1, "v1")
+    parsed.add(1, 1, "v2")
+    parsed.add(1, 1, "v0")
+    parsed.add(1, 2, "v0", created_manually=True)
+
+    assert parsed.is_parsed(1, 1, "v2")
+    assert not parsed.is_parsed(1, 1, "v3")
+    assert parsed.is_parsed(1, 2, "v5")
+    assert not parsed.is_parsed(1, 3, "v0")
+
+
+def test_feed_stream_agrees_with_feedparser(app: MockTsundokuApp):
+    body = generate_rss_feed()
+    expected = feedparser.parse(body)["items"]
+
+    stream = FeedStream(None, app.poller.hash_rss_item)
+    for i in range(0, len(body), 100):
+        stream.feed(body[i : i + 100])
+    stream.close()
+
+    assert not stream.fallback and not stream.done
+    assert [(i["title"], i["link"]) for i in stream.items] == [
+        (i["title"], i["link"]) for i in expected
+    ]
+    assert stream.first_hash == app.poller.hash_rss_item(expected[0])
+
+    cursor = app.poller.hash_rss_item(expected[3])
+    stream = FeedStream(cursor, app.poller.hash_rss_item)
+    for i in range(0, len(body), 100):
+        stream.feed(body[i : i + 100])
+        if stream.done:
+            break
+
+    assert stream.done
+    assert len(stream.body) < len(body)
+    assert [i["title"] for i in stream.items] == [i["title"] for i in expected[:3]]
+
+
+def test_feed_stream_falls_back_for_atom(app: MockTsundokuApp):
+    stream = FeedStream(None, app.poller.hash_rss_item)
+    stream.feed(b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">')
+    stream.feed(b"<entry><title>Title</title></entry></feed>")
+    stream.close()
+
+    assert stream.fallback and not stream.items
+    assert feedparser.parse(stream.body)["items"][0]["title"] == "Title"
+
+
+async def test_poll_stops_reading_at_cursor(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.WARNING, logger="tsundoku")
+
+    body = generate_rss_feed()
+    # Everything after the first item is held back on the second poll.
+    split = body.index(b"</item>") + len(b"</item>")
+    requests = 0
+    released = asyncio.Event()
+
+    async def feed(request: web.Request) -> web.StreamResponse:
+        nonlocal requests
+        requests += 1
+
+        resp = web.StreamResponse(headers={"Content-Type": "application/xml"})
+        await resp.prepare(request)
+        await resp.write(body[:split])
+        if requests > 1:
+            await released.wait()
+        await resp.write(body[split:])
+        return resp
+
+    server_app = web.Application()
+    server_app.router.add_get("/feed", feed)
+
+    async with TestServer(server_app) as server:
+
+        async def get_all_sources() -> AsyncGenerator[Source, None]:
+            yield Source.from_object(
+                {
+                    "name": "stream",
+                    "version": "1.0.0",
+                    "url": str(server.make_url("/feed")),
+                    "timeout": 2,
+                    "rssItemKeyMapping": {"filename": "$.title", "torrent": "$.link"},
+                }
+            )
+
+        monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", get_all_sources)
+        monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_source", fetch_source)
+
+        async with aiohttp.ClientSession() as session:
+            app.session = session
+
+            found = await app.poller.poll()
+
+            start = time.perf_counter()
+            found_after = await app.poller.poll()
+            elapsed = time.perf_counter() - start
+
+        released.set()
+
+    assert len(found) > 0 and len(found_after) == 0
+    assert elapsed < 1
+    assert "Timed out" not in caplog.text
+
+
+def test_schedule_adapts_to_source_activity():
+    bounds = (180, 3600)
+    schedule = SourceSchedule(900)
+
+    # A release every 10 minutes is looked for every 5 minutes.
+    published = [
+        published_at({"published": f"Sat, 07 Sep 2024 14:{m:02}:00 +0000"})
+        for m in (50, 40, 30, 20)
+    ]
+    schedule.update(published, 1000.0, bounds)
+    assert schedule.cadence == 600
+    assert schedule.interval == 300
+    assert schedule.next_poll_at == 1300
+
+    # Releases without dates still shorten the interval.
+    schedule.update([None], 1300.0, bounds)
+    assert schedule.interval == 300
+
+    intervals = []
+    for i in range(10):
+        schedule.update([], 2000.0 + i, bounds)
+        intervals.append(schedule.interval)
+
+    assert intervals == sorted(intervals)
+    assert intervals[0] > 300 and intervals[-1] == 3600
+    assert schedule.idle_rate > 0.9
+
+    schedule.update([None], 3000.0, bounds)
+    assert schedule.interval == 300
+    assert schedule.idle_rate < 0.7
+
+
+async def test_poll_skips_sources_that_are_not_due(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    fetches = 0
+
+    def counting_fetch_source(poller: Poller, source: Source) -> Any:
+        nonlocal fetches
+        fetches += 1
+        return mock_fetch_source(poller, source)
+
+    monkeypatch.setattr(
+        "tsundoku.feeds.poller.Poller.fetch_source", counting_fetch_source
+    )
+
+    await app.poller.poll(due_only=True)
+    await app.poller.poll(due_only=True)
+    assert fetches == 1
+
+    (schedule,) = app.poller.schedules.values()
+    assert schedule.last_polled_at is not None
+    assert app.poller.min_interval <= schedule.interval <= app.poller.max_interval
+    assert 1 <= app.poller.seconds_until_next_poll() <= app.poller.interval
+
+    schedule.next_poll_at = 0
+    await app.poller.poll(due_only=True)
+    await app.poller.poll()
+    assert fetches == 3
+
+
+async def test_poll_resolves_torrents_concurrently(
+    app: MockTsundokuApp, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+    monkeypatch.setattr("tsundoku.feeds.poller.POLLER_PIPELINE_RESOLVE_WORKERS", 3)
+
+    get_torrent_link = Poller.get_torrent_link
+    resolving = 0
+    most_resolving = 0
+
+    async def slow_get_torrent_link(poller: Poller, source: Source, item: dict) -> str:
+        nonlocal resolving, most_resolving
+        resolving += 1
+        most_resolving = max(most_resolving, resolving)
+        try:
+            await asyncio.sleep(0.05)
+            return await get_torrent_link(poller, source, item)
+        finally:
+            resolving -= 1
+
+    monkeypatch.setattr(
+        "tsundoku.feeds.poller.Poller.get_torrent_link", slow_get_torrent_link
+    )
+
+    start = time.perf_counter()
+    found = await app.poller.poll()
+    elapsed = time.perf_counter() - start
+
+    async with app.acquire_db() as con:
+        entry_count = await con.fetchval("SELECT COUNT(*) FROM show_entry;")
+
+    assert len(found) > 3 and len(found) == entry_count
+    assert len(set(found)) == len(found)
+    assert most_resolving == 3
+    assert elapsed < len(found) * 0.05
@@ -0,0 +1,163 @@
+"""
+Runs `EXPLAIN QUERY PLAN` over every SQL literal in the package against
+`schema.sql` and fails when a query on one of the large tables falls back
+to a full table scan.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+import sqlite3
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+PACKAGE = ROOT / "tsundoku"
+
+# Tables that grow with the number of releases and entries seen.
+LARGE_TABLES = {"show_entry", "seen_release", "encode"}
+
+# (module, function) pairs whose queries have to visit every row,
+# e.g. aggregates for statistics pages.
+ALLOWED_SCANS = {
+    ("tsundoku/feeds/encoder.py", "Encoder.get_stats"),
+}
+
+SQL_START = re.compile(r"\s*(?:SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b")
+SQL_BODY = re.compile(r"\b(?:FROM|INTO|SET)\b")
+TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE
+)
+PLAN_SCAN = re.compile(
+    r"^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?(?: USING (?:COVERING )?INDEX (\w+))?"
+)
+NAMED_PARAMETER = re.compile(r"(?<![:\w]):(\w+)")
+
+SQL_KEYWORDS = {
+    "as", "cross", "group", "inner", "join", "left", "limit", "natural", "on",
+    "order", "outer", "returning", "set", "using", "values", "where",
+}  # fmt: skip
+
+
+class _Collector(ast.NodeVisitor):
+    def __init__(self, module: str) -> None:
+        self.module = module
+        self.scope: list[str] = []
+        self.queries: list[tuple[str, str, int, str]] = []
+
+    def _visit_scope(self, node: ast.AST, name: str) -> None:
+        self.scope.append(name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._visit_scope(node, node.name)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_scope(node, node.name)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_scope(node, node.name)
+
+    def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
+        # f-strings build their SQL at runtime, nothing to plan here.
+        return
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if not isinstance(node.value, str):
+            return
+        if not SQL_START.match(node.value) or not SQL_BODY.search(node.value):
+            return
+
+        self.queries.append(
+            (self.module, ".".join(self.scope), node.lineno, node.value)
+        )
+
+
+def collect_queries() -> Iterator[tuple[str, str, int, str]]:
+    for path in sorted(PACKAGE.rglob("*.py")):
+        module = path.relative_to(ROOT).as_posix()
+        collector = _Collector(module)
+        collector.visit(ast.parse(path.read_text(encoding="utf-8")))
+        yield from collector.queries
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    aliases = {}
+    for table, alias in TABLE_REFERENCE.findall(sql):
+        aliases[table] = table
+        if alias and alias.lower() not in SQL_KEYWORDS:
+            aliases[alias] = table
+
+    return aliases
+
+
+def bind_parameters(sql: str) -> Optional[object]:
+    names = NAMED_PARAMETER.findall(sql)
+    if names:
+        return {name: None for name in names}
+
+    return [None] * sql.count("?")
+
+
+@pytest.fixture(scope="module")
+def schema() -> Iterator[sqlite3.Connection]:
+    con = sqlite3.connect(":memory:")
+    con.executescript((ROOT / "schema.sql").read_text(encoding="utf-8"))
+
+    yield con
+
+    con.close()
+
+
+def partial_indexes(con: sqlite3.Connection) -> set[str]:
+    return {
+        name
+        for name, sql in con.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index';"
+        )
+        if sql and " WHERE " in sql.upper()
+    }
+
+
+QUERIES = list(collect_queries())
+
+
+def test_queries_were_collected():
+    assert any("show_entry" in sql for *_, sql in QUERIES)
+    assert any("seen_release" in sql for *_, sql in QUERIES)
+
+
+@pytest.mark.parametrize(
+    "module, function, lineno, sql",
+    QUERIES,
+    ids=[f"{module}:{lineno}" for module, _, lineno, _ in QUERIES],
+)
+def test_query_plan_avoids_full_scans(
+    schema: sqlite3.Connection, module: str, function: str, lineno: int, sql: str
+):
+    try:
+        plan = schema.execute(
+            f"EXPLAIN QUERY PLAN {sql}", bind_parameters(sql)
+        ).fetchall()
+    except sqlite3.Error as e:
+        pytest.fail(f"{module}:{lineno} could not be planned against schema.sql: {e}")
+
+    if (module, function) in ALLOWED_SCANS:
+        return
+
+    aliases = table_aliases(sql)
+    bounded = partial_indexes(schema)
+
+    for *_, detail in plan:
+        match = PLAN_SCAN.match(detail)
+        if match is None:
+            continue
+
+        name, alias, index = match.groups()
+        table = aliases.get(alias or name, name)
+        if table in LARGE_TABLES and index not in bounded:
+            pytest.fail(f"{module}:{lineno} ({function}) scans {table}: {detail}")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import logging
+
+from pytest import LogCaptureFixture
+
+from tests.mock import MockTsundokuApp
+from tsundoku import asqlite
+from tsundoku.manager import SeenRelease
+from tsundoku.utils import parse_anime_title
+
+
+async def test_add_many_keeps_highest_versions(app: MockTsundokuApp):
+    await SeenRelease.add(
+        app,
+        parse_anime_title("[SubsPlease] Chainsaw Man - 12v2 (1080p) [179132FA].mkv"),
+        "existing",
+    )
+
+    added = await SeenRelease.add_many(
+        app,
+        [
+            (
+                parse_anime_title(
+                    "[SubsPlease] Chainsaw Man - 12 (1080p) [179132FA].mkv"
+                ),
+                "older",
+            ),
+            (
+                parse_anime_title(
+                    "[SubsPlease] NieR Automata Ver1.1a - 04 (720p) [CC00E892].mkv"
+                ),
+                "first",
+            ),
+            (
+                parse_anime_title(
+                    "[SubsPlease] NieR Automata Ver1.1a - 04v2 (720p) [CC00E892].mkv"
+                ),
+                "second",
+            ),
+            (
+                parse_anime_title(
+                    "[SubsPlease] Bocchi the Rock! (01-12) (1080p) [Batch]"
+                ),
+                "batch",
+            ),
+        ],
+    )
+
+    assert [(r.title, r.version, r.torrent_destination) for r in added] == [
+        ("NieR Automata Ver1.1a", "2", "second")
+    ]
+
+    releases = {r.title: r.torrent_destination for r in await SeenRelease.filter(app)}
+    assert releases == {
+        "Chainsaw Man": "existing",
+        "NieR Automata Ver1.1a": "second",
+    }
+
+
+async def test_poll_writes_seen_releases_once(
+    app: MockTsundokuApp, caplog: LogCaptureFixture
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    asqlite.query_statistics.reset()
+    await app.poller.poll()
+
+    upserts = [
+        s
+        for s in asqlite.query_statistics.snapshot()
+        if s["sql"].startswith("INSERT INTO seen_release")
+    ]
+
+    assert len(upserts) == 1 and upserts[0]["calls"] == 1
+    assert upserts[0]["rows"] == len(await SeenRelease.filter(app)) > 1
+
+
+async def test_add_many_checks_titles_in_chunks(app: MockTsundokuApp):
+    # More titles than older SQLite versions can bind in one statement.
+    names = [
+        f"[SubsPlease] Show {i:04} - 01 (1080p) [179132FA].mkv" for i in range(1200)
+    ]
+    await SeenRelease.add(
+        app, parse_anime_title(names[-1].replace(" - 01 ", " - 01v2 ")), "existing"
+    )
+
+    asqlite.query_statistics.reset()
+    added = await SeenRelease.add_many(
+        app, [(parse_anime_title(name), "new") for name in names]
+    )
+
+    assert len(added) == len(names) - 1
+    assert "Show 1199" not in {r.title for r in added}
+
+    selects = [
+        s
+        for s in asqlite.query_statistics.snapshot()
+        if "FROM seen_release" in s["sql"] and "title IN" in s["sql"]
+    ]
+    assert sum(s["calls"] for s in selects) == 3
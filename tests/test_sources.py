@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+
+from pytest import LogCaptureFixture
+
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.sources import SourceRegistry
+
+
+def write_source(path: Path, **changes: object) -> None:
+    path.write_text(json.dumps({**json.loads(MOCK_SOURCE), **changes}))
+    # Modification times can be too coarse to tell quick writes apart.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+async def test_registry_reuses_unchanged_sources(tmp_path: Path):
+    (tmp_path / "COPIED").touch()
+    write_source(tmp_path / "a.json", name="A")
+    write_source(tmp_path / "b.json", name="B")
+
+    registry = SourceRegistry(tmp_path)
+    first = await registry.refresh()
+    second = await registry.refresh()
+
+    assert [s.name for s in first] == ["A", "B"]
+    assert all(a is b for a, b in zip(first, second))
+
+    write_source(tmp_path / "b.json", name="B", version="2.0.0")
+    (tmp_path / "a.json").unlink()
+    write_source(tmp_path / "c.json", name="C")
+
+    third = await registry.refresh()
+    assert [(s.name, s.version) for s in third] == [
+        ("B", "2.0.0"),
+        ("C", "1.0.0"),
+    ]
+
+
+async def test_registry_reports_malformed_sources(
+    tmp_path: Path, caplog: LogCaptureFixture
+):
+    caplog.set_level(logging.WARNING, logger="tsundoku")
+
+    (tmp_path / "COPIED").touch()
+    write_source(tmp_path / "good.json")
+    (tmp_path / "broken.json").write_text("{")
+    write_source(tmp_path / "missing.json", url=None)
+
+    registry = SourceRegistry(tmp_path)
+    sources = await registry.refresh()
+
+    assert [s.name for s in sources] == ["Mock Source"]
+    assert set(registry.errors) == {"broken.json", "missing.json"}
+    assert "Failed to load RSS source 'broken.json'" in caplog.text
+
+    write_source(tmp_path / "missing.json", name="Fixed")
+    sources = await registry.refresh()
+
+    assert sorted(s.name for s in sources) == ["Fixed", "Mock Source"]
+    assert set(registry.errors) == {"broken.json"}
+
+
+async def test_registry_copies_default_sources_once(tmp_path: Path):
+    registry = SourceRegistry(tmp_path / "sources")
+    sources = await registry.refresh()
+
+    assert sources and not registry.errors
+    assert (tmp_path / "sources" / "COPIED").exists()
+
+    for path in (tmp_path / "sources").glob("*.json"):
+        path.unlink()
+
+    assert await registry.refresh() == []
+
+
+def test_registry_refreshes_overlap_on_any_loop(tmp_path: Path):
+    (tmp_path / "COPIED").touch()
+    write_source(tmp_path / "a.json", name="A")
+    write_source(tmp_path / "b.json", name="B")
+
+    # Created outside of a loop, like the module's registry.
+    registry = SourceRegistry(tmp_path)
+
+    async def refresh_twice() -> None:
+        first, second = await asyncio.gather(registry.refresh(), registry.refresh())
+        assert [s.name for s in first] == [s.name for s in second] == ["A", "B"]
+
+    for _ in range(2):
+        write_source(tmp_path / "b.json", name="B")
+        asyncio.run(refresh_twice())
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 
-from pytest import LogCaptureFixture
+from pytest import LogCaptureFixture, MonkeyPatch
 
 from tests.mock import MockTsundokuApp, UserType
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.sources import SourceRegistry
 
 
 async def test_unauthorized_index(app: MockTsundokuApp, caplog: LogCaptureFixture):
@@ -49,3 +52,74 @@ async def test_authorized_index_readonly(
     client = await app.test_client(user_type=UserType.READONLY)
     response = await client.get("/")
     assert response.status_code == 200
+
+
+async def test_debug_queries(app: MockTsundokuApp, caplog: LogCaptureFixture):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    client = await app.test_client(user_type=UserType.REGULAR)
+    response = await client.get("/api/v1/debug/queries")
+    assert response.status_code == 200
+
+    data = await response.get_json()
+    assert any("FROM users" in s["sql"] for s in data["result"]["statements"])
+
+    response = await client.delete("/api/v1/debug/queries")
+    assert response.status_code == 200
+
+    data = await response.get_json()
+    assert not any("FROM users" in s["sql"] for s in data["result"]["statements"])
+
+
+async def test_readonly_cannot_reset_debug_queries(
+    app: MockTsundokuApp, caplog: LogCaptureFixture
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    client = await app.test_client(user_type=UserType.READONLY)
+    response = await client.delete("/api/v1/debug/queries")
+    assert response.status_code == 403
+
+    response = await client.get("/api/v1/debug/queries")
+    assert response.status_code == 200
+    data = await response.get_json()
+    assert data["result"]["statements"]
+
+
+async def test_source_schedule(app: MockTsundokuApp, caplog: LogCaptureFixture):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.poller.poll()
+
+    client = await app.test_client(user_type=UserType.REGULAR)
+    response = await client.get("/api/v1/sources/schedule")
+    assert response.status_code == 200
+
+    data = await response.get_json()
+    (schedule,) = data["result"]
+    assert schedule["name"] == "Mock Source"
+    assert schedule["next_poll_at"] is not None
+
+
+async def test_sources_report_malformed_files(
+    tmp_path: Path,
+    app: MockTsundokuApp,
+    caplog: LogCaptureFixture,
+    monkeypatch: MonkeyPatch,
+):
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    (tmp_path / "COPIED").touch()
+    (tmp_path / "mock.json").write_text(MOCK_SOURCE)
+    (tmp_path / "broken.json").write_text("{")
+    monkeypatch.setattr(
+        "tsundoku.blueprints.api.routes.registry", SourceRegistry(tmp_path)
+    )
+
+    client = await app.test_client(user_type=UserType.REGULAR)
+    response = await client.get("/api/v1/sources")
+    assert response.status_code == 200
+
+    data = await response.get_json()
+    assert [s["name"] for s in data["result"]["sources"]] == ["Mock Source"]
+    assert list(data["result"]["errors"]) == ["broken.json"]
@@ -8,6 +8,7 @@ from pathlib import Path
 import secrets
 import sqlite3
 from typing import (
+    Awaitable,
     Optional,
     Tuple,
     MutableSet,
@@ -39,14 +40,25 @@ from tsundoku.asqlite import Connection
 from tsundoku.blueprints import api_blueprint, ux_blueprint
 from tsundoku.config import GeneralConfig
 from tsundoku.constants import DATA_DIR, DATABASE_FILE_NAME
-from tsundoku.database import acquire, migrate, sync_acquire
+from tsundoku.database import (
+    acquire,
+    close_pool,
+    close_writer,
+    maintain,
+    migrate,
+    sync_acquire,
+    write,
+    write_many,
+)
 from tsundoku.dl_client import Manager
 from tsundoku.feeds import Downloader, Encoder, Poller
 from tsundoku.flags import Flags
 from tsundoku.fluent import CustomFluentLocalization
 from tsundoku.git import check_for_updates
+from tsundoku.manager import SeenRelease
 from tsundoku.log import setup_logging
 from tsundoku.user import User
+from tsundoku.utils import shutdown_parser_pool
 
 
 class TsundokuApp(Quart):
@@ -63,6 +75,8 @@ class TsundokuApp(Quart):
 
     acquire_db: Callable[..., AsyncContextManager[Connection]]
     sync_acquire_db: Callable[..., ContextManager[sqlite3.Connection]]
+    write_db: Callable[..., Awaitable[int]]
+    write_many_db: Callable[..., Awaitable[int]]
 
     flags: Flags
 
@@ -77,6 +91,8 @@ class TsundokuApp(Quart):
 
         self.acquire_db = acquire
         self.sync_acquire_db = sync_acquire
+        self.write_db = write
+        self.write_many_db = write_many
 
         self.connected_websockets = set()
         self.flags = Flags()
@@ -173,10 +189,6 @@ async def setup_db() -> None:
     Creates a database pool for database interaction.
     """
     async with app.acquire_db() as con:
-        logger.debug("VACUUMing database...")
-        await con.execute("VACUUM;")
-        logger.debug("Database VACUUM'd.")
-
         users = await con.fetchval(
             """
             SELECT
@@ -237,6 +249,13 @@ async def setup_tasks() -> None:
     app.scheduler.start()
 
     app.scheduler.add_job(check_for_updates, CronTrigger.from_crontab("* 4 * * *"))
+    app.scheduler.add_job(maintain, CronTrigger.from_crontab("30 * * * *"))
+    app.scheduler.add_job(
+        SeenRelease.delete_old,
+        CronTrigger.from_crontab("15 * * * *"),
+        args=(app,),
+        kwargs={"days": 30},
+    )
 
     async def poller() -> None:
         app.poller = Poller(app.app_context())
@@ -283,6 +302,14 @@ async def cleanup() -> None:
 
     logger.debug(f"Cleanup: Tasks cancelled. [{failed_to_cancel} failed to cancel]")
 
+    logger.debug("Cleanup: Stopping title parser processes...")
+    try:
+        shutdown_parser_pool()
+    except Exception:
+        logger.warning("Cleanup: Could not stop title parser processes!", exc_info=True)
+    else:
+        logger.debug("Cleanup: Title parser processes stopped.")
+
     logger.debug("Cleanup: Closing aiohttp session...")
     try:
         await app.session.close()
@@ -291,6 +318,24 @@ async def cleanup() -> None:
     else:
         logger.debug("Cleanup: aiohttp session closed.")
 
+    logger.debug("Cleanup: Flushing database writes...")
+    try:
+        await close_writer()
+    except Exception:
+        logger.warning("Cleanup: Could not flush database writes!", exc_info=True)
+    else:
+        logger.debug("Cleanup: Database writes flushed.")
+
+    logger.debug("Cleanup: Closing database connection pool...")
+    try:
+        await close_pool()
+    except Exception:
+        logger.warning(
+            "Cleanup: Could not close database connection pool!", exc_info=True
+        )
+    else:
+        logger.debug("Cleanup: Database connection pool closed.")
+
 
 @ux_blueprint.context_processor
 async def insert_locale() -> dict:
@@ -28,12 +28,17 @@ from __future__ import annotations
 
 import sqlite3
 import threading
-import queue
 import asyncio
+import logging
+import re
+import time
+from collections import deque
+from functools import lru_cache
 from typing import (
     Any,
     AsyncContextManager,
     Callable,
+    Deque,
     Dict,
     Generator,
     Generic,
@@ -58,9 +63,217 @@ PARSE_COLNAMES = sqlite3.PARSE_COLNAMES
 T = TypeVar("T")
 U = TypeVar("U", covariant=True, bound=AsyncContextManager[Any])
 
+logger = logging.getLogger("tsundoku")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Normalizes a statement so that executions differing only in
+    literals, whitespace or the length of a parameter list are
+    aggregated together.
+
+    Parameters
+    ------------
+    sql: str
+        The statement to normalize.
+
+    Returns
+    --------
+    str
+        The normalized statement.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip().rstrip(";").rstrip()
+    return _PARAMETER_LIST.sub("?, ...", sql)
+
+
+def _count_rows(result: Any) -> int:
+    if isinstance(result, list):
+        return len(result)
+    elif isinstance(result, sqlite3.Cursor):
+        # -1 for statements that do not modify rows.
+        return max(result.rowcount, 0)
+    elif result is None:
+        return 0
+    return 1
+
+
+class _Execution:
+    """The time spent on one execution of a statement so far,
+    including the fetches made from its cursor afterwards."""
+
+    __slots__ = ("sql", "execution_time", "queue_wait", "rows", "logged")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.execution_time = 0.0
+        self.queue_wait = 0.0
+        self.rows = 0
+        self.logged = False
+
+
+class QueryStatistics:
+    """Aggregates execution statistics of the statements run through
+    every :class:`Connection`, keyed by :func:`normalize_sql`.
+
+    Fetches made through a :class:`Cursor` are added to the execution
+    of the statement that created it: they do not count as calls, and
+    the slow query log compares the execution and its fetches together
+    against the threshold.
+
+    A module-wide instance is available as :data:`query_statistics`.
+
+    Parameters
+    ------------
+    slow_query_threshold: Optional[float]
+        Statements whose execution takes at least this many seconds
+        are logged. ``None`` disables the log.
+    max_statements: int
+        How many distinct statements are tracked, anything past that
+        is aggregated under ``"<other>"``.
+    """
+
+    def __init__(
+        self,
+        *,
+        slow_query_threshold: Optional[float] = None,
+        max_statements: int = 500,
+    ):
+        self.slow_query_threshold: Optional[float] = slow_query_threshold
+        self.max_statements: int = max_statements
+        self._lock = threading.Lock()
+        self._statements: Dict[str, List[Any]] = {}
+
+    def record(
+        self,
+        sql: str,
+        *,
+        execution_time: float,
+        queue_wait: float,
+        rows: int,
+        failed: bool = False,
+    ) -> None:
+        """Records a single execution of a statement.
+
+        Parameters
+        ------------
+        sql: str
+            The statement, as passed to SQLite.
+        execution_time: float
+            Seconds spent executing the statement on the worker thread.
+        queue_wait: float
+            Seconds the statement waited before the worker picked it up.
+        rows: int
+            The number of rows returned or modified.
+        failed: bool
+            Whether the statement raised.
+        """
+        self._record(
+            _Execution(sql),
+            execution_time=execution_time,
+            queue_wait=queue_wait,
+            rows=rows,
+            failed=failed,
+        )
+
+    def _record(
+        self,
+        execution: _Execution,
+        *,
+        execution_time: float,
+        queue_wait: float,
+        rows: int,
+        failed: bool = False,
+        fetch: bool = False,
+    ) -> None:
+        execution.execution_time += execution_time
+        execution.queue_wait += queue_wait
+        execution.rows += rows
+
+        statement = normalize_sql(execution.sql)
+        with self._lock:
+            entry = self._statements.get(statement)
+            if entry is None:
+                if len(self._statements) >= self.max_statements:
+                    statement = "<other>"
+                entry = self._statements.setdefault(
+                    statement, [0, 0, 0.0, 0.0, 0.0, 0.0, 0]
+                )
+
+            if not fetch:
+                entry[0] += 1
+            entry[1] += failed
+            entry[2] += execution_time
+            entry[3] = max(entry[3], execution.execution_time)
+            entry[4] += queue_wait
+            entry[5] = max(entry[5], execution.queue_wait)
+            entry[6] += rows
+
+        threshold = self.slow_query_threshold
+        if (
+            threshold is not None
+            and not execution.logged
+            and execution.execution_time >= threshold
+        ):
+            # Logged once, when the execution and the fetches
+            # made so far first reach the threshold together.
+            execution.logged = True
+            logger.warning(
+                f"Slow query: {statement} "
+                f"[execution_time={execution.execution_time * 1000:.1f}ms, "
+                f"queue_wait={execution.queue_wait * 1000:.1f}ms, "
+                f"rows={execution.rows}]"
+            )
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Returns the aggregated statistics of every statement,
+        the most expensive first."""
+        with self._lock:
+            items = [(sql, list(entry)) for sql, entry in self._statements.items()]
+
+        statements = [
+            {
+                "sql": sql,
+                "calls": calls,
+                "errors": errors,
+                "total_time": total_time,
+                "average_time": total_time / calls,
+                "max_time": max_time,
+                "total_queue_wait": total_wait,
+                "average_queue_wait": total_wait / calls,
+                "max_queue_wait": max_wait,
+                "rows": rows,
+            }
+            for sql, (
+                calls,
+                errors,
+                total_time,
+                max_time,
+                total_wait,
+                max_wait,
+                rows,
+            ) in items
+        ]
+        statements.sort(key=lambda s: s["total_time"], reverse=True)
+        return statements
+
+    def reset(self) -> None:
+        """Discards every recorded execution."""
+        with self._lock:
+            self._statements.clear()
+
+
+query_statistics = QueryStatistics()
+
 
 class _WorkerEntry:
-    __slots__ = ("func", "args", "kwargs", "future", "cancelled")
+    __slots__ = ("func", "args", "kwargs", "future", "execution", "fetch", "queued_at")
 
     def __init__(
         self,
@@ -68,79 +281,203 @@ class _WorkerEntry:
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
         future: asyncio.Future,
+        execution: Optional[_Execution] = None,
+        fetch: bool = False,
     ):
         self.func = func
         self.args = args
         self.kwargs = kwargs
         self.future = future
+        self.execution = execution
+        self.fetch = fetch
+        self.queued_at = time.perf_counter()
+
+
+def _set_results(
+    results: List[Tuple[asyncio.Future, Optional[BaseException], Any]]
+) -> None:
+    for fut, exc, result in results:
+        if fut.done():
+            continue
+        elif exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
 
 
 class _Worker(threading.Thread):
     def __init__(self, *, loop: asyncio.AbstractEventLoop):
         super().__init__(name="asqlite-worker-thread", daemon=True)
         self._loop = loop
-        self._worker_queue: queue.Queue[_WorkerEntry] = queue.Queue()
-        self._end = threading.Event()
+        self._jobs: Deque[_WorkerEntry] = deque()
+        self._wakeup = threading.Condition(threading.Lock())
+        self._end = False
+
+        self._executed = 0
+        self._drains = 0
+        self._busy_time = 0.0
+        self._max_execution_time = 0.0
+        self._queue_wait = 0.0
+        self._max_queue_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of jobs waiting to be executed."""
+        return len(self._jobs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the worker's execution counters."""
+        return {
+            "queue_depth": len(self._jobs),
+            "executed": self._executed,
+            "drains": self._drains,
+            "busy_time": self._busy_time,
+            "average_execution_time": (
+                self._busy_time / self._executed if self._executed else 0.0
+            ),
+            "max_execution_time": self._max_execution_time,
+            "average_queue_wait": (
+                self._queue_wait / self._executed if self._executed else 0.0
+            ),
+            "max_queue_wait": self._max_queue_wait,
+        }
+
+    def _call_entries(self, entries: Deque[_WorkerEntry]) -> None:
+        results: List[Tuple[asyncio.Future, Optional[BaseException], Any]] = []
+        for entry in entries:
+            fut = entry.future
+            if fut.cancelled():
+                continue
 
-    def _call_entry(self, entry: _WorkerEntry) -> None:
-        fut = entry.future
-        if fut.cancelled():
+            start = time.perf_counter()
+            failed = False
+            try:
+                result = entry.func(*entry.args, **entry.kwargs)
+            except Exception as e:
+                failed = True
+                result = None
+                results.append((fut, e, None))
+            else:
+                results.append((fut, None, result))
+
+            elapsed = time.perf_counter() - start
+            waited = start - entry.queued_at
+            self._executed += 1
+            self._busy_time += elapsed
+            self._queue_wait += waited
+            if elapsed > self._max_execution_time:
+                self._max_execution_time = elapsed
+            if waited > self._max_queue_wait:
+                self._max_queue_wait = waited
+
+            if entry.execution is not None:
+                query_statistics._record(
+                    entry.execution,
+                    execution_time=elapsed,
+                    queue_wait=waited,
+                    rows=_count_rows(result),
+                    failed=failed,
+                    fetch=entry.fetch,
+                )
+
+        self._drains += 1
+        if not results:
             return
 
         try:
-            result = entry.func(*entry.args, **entry.kwargs)
-        except Exception as e:
-            self._loop.call_soon_threadsafe(fut.set_exception, e)
-        else:
-            self._loop.call_soon_threadsafe(fut.set_result, result)
+            self._loop.call_soon_threadsafe(_set_results, results)
+        except RuntimeError:
+            # The event loop has been closed, nobody is waiting anymore.
+            pass
 
     def run(self) -> None:
-        _queue = self._worker_queue
-        while not self._end.is_set():
-            try:
-                entry = _queue.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            else:
-                self._call_entry(entry)
+        wakeup = self._wakeup
+        while True:
+            with wakeup:
+                while not self._jobs and not self._end:
+                    wakeup.wait()
+
+                if not self._jobs:
+                    return
+
+                entries, self._jobs = self._jobs, deque()
+
+            self._call_entries(entries)
 
     def post(
         self, func: Callable[..., T], *args: Any, **kwargs: Any
     ) -> asyncio.Future[T]:
-        future: asyncio.Future[T] = self._loop.create_future()
-        entry = _WorkerEntry(func=func, args=args, kwargs=kwargs, future=future)
-        self._worker_queue.put_nowait(entry)
-        return future
+        return self._append(
+            _WorkerEntry(func, args, kwargs, self._loop.create_future())
+        )
+
+    def post_statement(
+        self,
+        execution: Optional[_Execution],
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> asyncio.Future[T]:
+        """Same as :meth:`post`, but accounts the call as ``execution``
+        in :data:`query_statistics`."""
+        entry = _WorkerEntry(func, args, kwargs, self._loop.create_future(), execution)
+        return self._append(entry)
+
+    def post_fetch(
+        self,
+        execution: Optional[_Execution],
+        func: Callable[..., T],
+        *args: Any,
+    ) -> asyncio.Future[T]:
+        """Same as :meth:`post`, but adds the call to ``execution``
+        in :data:`query_statistics` without counting it as one."""
+        entry = _WorkerEntry(
+            func, args, {}, self._loop.create_future(), execution, fetch=True
+        )
+        return self._append(entry)
+
+    def _append(self, entry: _WorkerEntry) -> asyncio.Future:
+        with self._wakeup:
+            self._jobs.append(entry)
+            self._wakeup.notify()
+        return entry.future
 
     def stop(self) -> None:
-        self._end.set()
+        with self._wakeup:
+            self._end = True
+            self._wakeup.notify()
 
 
 class _ContextManagerMixin(Generic[T, U]):
     def __init__(
         self,
         _queue: _Worker,
-        _factory: Callable[[T], U],
+        _factory: Callable[[T, Optional[_Execution]], U],
         func: Callable[..., Any],
         *args: Any,
         timeout: Optional[float] = None,
+        statement: Optional[str] = None,
         **kwargs: Any,
     ):
         self._worker: _Worker = _queue
         self.func: Callable[..., Any] = func
         self.timeout: Optional[float] = timeout
-        self._factory: Callable[[T], U] = _factory
+        self.statement: Optional[str] = statement
+        self._factory: Callable[[T, Optional[_Execution]], U] = _factory
         self.args: Tuple[Any, ...] = args
         self.kwargs: Dict[str, Any] = kwargs
         self.__result: Optional[U] = None
 
     async def _runner(self) -> U:
-        future = self._worker.post(self.func, *self.args, **self.kwargs)
+        execution = None if self.statement is None else _Execution(self.statement)
+        future = self._worker.post_statement(
+            execution, self.func, *self.args, **self.kwargs
+        )
         if self.timeout is not None:
             ret = await asyncio.wait_for(future, timeout=self.timeout)
         else:
             ret = await future
-        self.__result = result = self._factory(ret)
+        self.__result = result = self._factory(ret, execution)
         return result
 
     def __await__(self) -> Generator[Any, None, U]:
@@ -170,10 +507,19 @@ class Cursor:
     Create these with :meth:`Connection.cursor`.
     """
 
-    def __init__(self, connection: Connection, cursor: sqlite3.Cursor):
+    def __init__(
+        self,
+        connection: Connection,
+        cursor: sqlite3.Cursor,
+        execution: Optional[_Execution] = None,
+    ):
         self._conn = connection
         self._cursor = cursor
         self._post = connection._post
+        self._post_statement = connection._post_statement
+        self._post_fetch = connection._post_fetch
+        # The last statement executed, which fetches are added to.
+        self._execution = execution
 
     async def __aenter__(self: C) -> C:
         return self
@@ -219,39 +565,49 @@ class Cursor:
         """Asynchronous version of :meth:`sqlite3.Cursor.execute`."""
         if len(parameters) == 1 and isinstance(parameters[0], (dict, tuple)):
             parameters = parameters[0]  # type: ignore
-        await self._post(self._cursor.execute, sql, parameters)
+        self._execution = _Execution(sql)
+        await self._post_statement(
+            self._execution, self._cursor.execute, sql, parameters
+        )
         return self
 
     async def executemany(
         self: C, sql: str, seq_of_parameters: Iterable[Iterable[Any]]
     ) -> C:
         """Asynchronous version of :meth:`sqlite3.Cursor.executemany`."""
-        await self._post(self._cursor.executemany, sql, seq_of_parameters)
+        self._execution = _Execution(sql)
+        await self._post_statement(
+            self._execution, self._cursor.executemany, sql, seq_of_parameters
+        )
         return self
 
     async def executescript(self: C, sql_script: str) -> C:
         """Asynchronous version of :meth:`sqlite3.Cursor.executescript`."""
-        await self._post(self._cursor.executescript, sql_script)
+        self._execution = _Execution(sql_script)
+        await self._post_statement(
+            self._execution, self._cursor.executescript, sql_script
+        )
         return self
 
     async def fetchval(self) -> Any:
+        row = await self._post_fetch(self._execution, self._cursor.fetchone)
         try:
-            return (await self._post(self._cursor.fetchone))[0]
+            return row[0]
         except TypeError:
             return
 
     async def fetchone(self) -> sqlite3.Row:
         """Asynchronous version of :meth:`sqlite3.Cursor.fetchone`."""
-        return await self._post(self._cursor.fetchone)
+        return await self._post_fetch(self._execution, self._cursor.fetchone)
 
     async def fetchmany(self, size: Optional[int] = None) -> List[sqlite3.Row]:
         """Asynchronous version of :meth:`sqlite3.Cursor.fetchmany`."""
         size = self._cursor.arraysize if size is None else size
-        return await self._post(self._cursor.fetchmany, size)
+        return await self._post_fetch(self._execution, self._cursor.fetchmany, size)
 
     async def fetchall(self) -> List[sqlite3.Row]:
         """Asynchronous version of :meth:`sqlite3.Cursor.fetchall`."""
-        return await self._post(self._cursor.fetchall)
+        return await self._post_fetch(self._execution, self._cursor.fetchall)
 
 
 class Transaction:
@@ -340,6 +696,8 @@ class Connection:
         self._conn = connection
         self._queue = queue
         self._post = queue.post
+        self._post_statement = queue.post_statement
+        self._post_fetch = queue.post_fetch
 
     async def __aenter__(self: T) -> T:
         return self
@@ -356,6 +714,11 @@ class Connection:
         """Retrieves the internal :class:`sqlite3.Connection` object."""
         return self._conn
 
+    def worker_stats(self) -> Dict[str, Any]:
+        """Returns the queue depth and execution counters of this
+        connection's worker thread."""
+        return self._queue.stats()
+
     def transaction(self) -> Transaction:
         """Gets a transaction object.
 
@@ -394,7 +757,7 @@ class Connection:
             The cursor.
         """
 
-        def factory(cur: sqlite3.Cursor) -> Cursor:
+        def factory(cur: sqlite3.Cursor, _: Optional[_Execution]) -> Cursor:
             if transaction:
                 return _CursorWithTransaction(self, cur)
             else:
@@ -443,11 +806,11 @@ class Connection:
         if len(parameters) == 1 and isinstance(parameters[0], (dict, tuple)):
             parameters = parameters[0]  # type: ignore
 
-        def factory(cur: sqlite3.Cursor):
-            return Cursor(self, cur)
+        def factory(cur: sqlite3.Cursor, execution: Optional[_Execution]):
+            return Cursor(self, cur, execution)
 
         return _ContextManagerMixin(
-            self._queue, factory, self._conn.execute, sql, parameters
+            self._queue, factory, self._conn.execute, sql, parameters, statement=sql
         )
 
     def executemany(
@@ -458,11 +821,16 @@ class Connection:
         Note that this returns a :class:`Cursor` instead of a :class:`sqlite3.Cursor`.
         """
 
-        def factory(cur: sqlite3.Cursor):
-            return Cursor(self, cur)
+        def factory(cur: sqlite3.Cursor, execution: Optional[_Execution]):
+            return Cursor(self, cur, execution)
 
         return _ContextManagerMixin(
-            self._queue, factory, self._conn.executemany, sql, seq_of_parameters
+            self._queue,
+            factory,
+            self._conn.executemany,
+            sql,
+            seq_of_parameters,
+            statement=sql,
         )
 
     def executescript(
@@ -473,11 +841,15 @@ class Connection:
         Note that this returns a :class:`Cursor` instead of a :class:`sqlite3.Cursor`.
         """
 
-        def factory(cur: sqlite3.Cursor):
-            return Cursor(self, cur)
+        def factory(cur: sqlite3.Cursor, execution: Optional[_Execution]):
+            return Cursor(self, cur, execution)
 
         return _ContextManagerMixin(
-            self._queue, factory, self._conn.executescript, sql_script
+            self._queue,
+            factory,
+            self._conn.executescript,
+            sql_script,
+            statement=sql_script,
         )
 
     @overload
@@ -599,7 +971,7 @@ def connect(
     queue = _Worker(loop=loop)
     queue.start()
 
-    def factory(con: sqlite3.Connection) -> Connection:
+    def factory(con: sqlite3.Connection, _: Optional[_Execution]) -> Connection:
         return Connection(con, queue)
 
     kwargs["detect_types"] = PARSE_DECLTYPES | PARSE_COLNAMES
@@ -616,3 +988,482 @@ def connect(
     return _ContextManagerMixin(
         queue, factory, new_connect, database, timeout=timeout, **kwargs
     )
+
+
+def _reset_connection(con: sqlite3.Connection) -> None:
+    if con.in_transaction:
+        con.rollback()
+
+
+class _PoolAcquireContext:
+    __slots__ = ("pool", "timeout", "connection")
+
+    def __init__(self, pool: Pool, timeout: Optional[float]):
+        self.pool: Pool = pool
+        self.timeout: Optional[float] = timeout
+        self.connection: Optional[Connection] = None
+
+    async def __aenter__(self) -> Connection:
+        self.connection = await self.pool._acquire(self.timeout)
+        return self.connection
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self.connection is not None:
+            con, self.connection = self.connection, None
+            await self.pool.release(con)
+
+
+class Pool:
+    """A pool of long-lived :class:`Connection` objects.
+
+    Create these with :func:`create_pool`.
+
+    Every connection in the pool keeps its worker thread and underlying
+    :class:`sqlite3.Connection` open for the lifetime of the pool, so
+    leasing one does not pay for spawning a thread, opening the database
+    file or running the connection pragmas again.
+
+    The connections are opened lazily, all at once, the first time
+    :meth:`acquire` is used.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, bytes],
+        *,
+        size: int,
+        timeout: Optional[float],
+        init: Optional[Callable[[sqlite3.Connection], None]],
+        loop: asyncio.AbstractEventLoop,
+        **kwargs: Any,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self._database = database
+        self._size = size
+        self._timeout = timeout
+        self._init = init
+        self._loop = loop
+        self._kwargs = kwargs
+
+        self._idle: asyncio.Queue[Connection] = asyncio.Queue()
+        self._holders: List[Connection] = []
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+        self._closed = False
+
+        self._leases = 0
+        self._timeouts = 0
+        self._waiting = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop the pool's connections report back to."""
+        return self._loop
+
+    @property
+    def size(self) -> int:
+        """The number of connections held by the pool."""
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called."""
+        return self._closed
+
+    async def _connect(self) -> Connection:
+        return await connect(
+            self._database, init=self._init, loop=self._loop, **self._kwargs
+        )
+
+    async def _initialize(self) -> None:
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            for _ in range(self._size):
+                con = await self._connect()
+                self._holders.append(con)
+                self._idle.put_nowait(con)
+
+            self._initialized = True
+
+    async def _acquire(self, timeout: Optional[float]) -> Connection:
+        if self._closed:
+            raise RuntimeError("Cannot acquire a connection from a closed pool")
+
+        if not self._initialized:
+            await self._initialize()
+
+        if timeout is None:
+            timeout = self._timeout
+
+        start = time.perf_counter()
+        self._waiting += 1
+        try:
+            if timeout is None:
+                con = await self._idle.get()
+            else:
+                con = await asyncio.wait_for(self._idle.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            self._waiting -= 1
+
+        waited = time.perf_counter() - start
+        self._leases += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+        return con
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _PoolAcquireContext:
+        """Leases a connection from the pool.
+
+        This must be used as an asynchronous context manager, the
+        connection is returned to the pool when the block exits.
+
+        .. code-block:: python3
+
+            async with pool.acquire() as conn:
+                ...
+
+        Parameters
+        ------------
+        timeout: Optional[float]
+            How long to wait for a free connection before raising
+            :exc:`asyncio.TimeoutError`. Defaults to the pool's timeout.
+        """
+        return _PoolAcquireContext(self, timeout)
+
+    async def release(self, connection: Connection) -> None:
+        """Returns a leased connection to the pool.
+
+        Any transaction left open on the connection is rolled back. If the
+        connection turns out to be unusable it is replaced with a new one.
+        """
+        if connection not in self._holders:
+            raise ValueError("Connection does not belong to this pool")
+
+        if self._closed:
+            return
+
+        try:
+            await connection._post(_reset_connection, connection._conn)
+        except Exception:
+            self._holders.remove(connection)
+            try:
+                await connection.close()
+            except Exception:
+                connection._queue.stop()
+
+            connection = await self._connect()
+            self._holders.append(connection)
+
+        self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        """Closes every connection held by the pool."""
+        self._closed = True
+
+        holders, self._holders = self._holders, []
+        for con in holders:
+            try:
+                await con.close()
+            except Exception:
+                con._queue.stop()
+
+    def terminate(self) -> None:
+        """Stops every worker thread without waiting on the event loop.
+
+        Useful when the loop the pool was created on is no longer running.
+        """
+        self._closed = True
+
+        holders, self._holders = self._holders, []
+        for con in holders:
+            con._queue.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the pool's usage statistics."""
+        idle = self._idle.qsize()
+        return {
+            "size": self._size,
+            "open": len(self._holders),
+            "idle": idle,
+            "in_use": len(self._holders) - idle,
+            "waiting": self._waiting,
+            "leases": self._leases,
+            "timeouts": self._timeouts,
+            "average_wait": self._total_wait / self._leases if self._leases else 0.0,
+            "max_wait": self._max_wait,
+            "workers": [con.worker_stats() for con in self._holders],
+        }
+
+
+def create_pool(
+    database: Union[str, bytes],
+    *,
+    size: int = 5,
+    timeout: Optional[float] = None,
+    init: Optional[Callable[[sqlite3.Connection], None]] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    **kwargs: Any,
+) -> Pool:
+    """Creates a :class:`Pool` of connections to a database.
+
+    .. code-block:: python3
+
+        pool = create_pool("tsundoku.db", size=5)
+        async with pool.acquire() as conn:
+            ...
+
+    The ``init`` and extra keyword arguments are passed along to
+    :func:`connect` for every connection in the pool.
+
+    Parameters
+    ------------
+    size: int
+        The number of connections to keep open.
+    timeout: Optional[float]
+        The default number of seconds :meth:`Pool.acquire` waits for a
+        free connection. ``None`` waits forever.
+    """
+    loop = loop or asyncio.get_event_loop()
+    return Pool(database, size=size, timeout=timeout, init=init, loop=loop, **kwargs)
+
+
+def _run_write_batch(
+    con: sqlite3.Connection, batch: List[Tuple[bool, str, Any, float]]
+) -> List[Union[int, Exception]]:
+    # Every statement gets its own savepoint so that one failing
+    # write does not take the rest of the batch down with it.
+    owns_transaction = not con.in_transaction
+    if owns_transaction:
+        con.execute("BEGIN IMMEDIATE;")
+
+    results: List[Union[int, Exception]] = []
+    try:
+        for many, sql, parameters, queued_at in batch:
+            con.execute("SAVEPOINT asqlite_write;")
+            start = time.perf_counter()
+            try:
+                if many:
+                    cur = con.executemany(sql, parameters)
+                else:
+                    cur = con.execute(sql, parameters)
+            except Exception as e:
+                con.execute("ROLLBACK TO asqlite_write;")
+                results.append(e)
+            else:
+                results.append(cur.rowcount)
+            con.execute("RELEASE asqlite_write;")
+
+            result = results[-1]
+            query_statistics.record(
+                sql,
+                execution_time=time.perf_counter() - start,
+                queue_wait=start - queued_at,
+                rows=result if isinstance(result, int) else 0,
+                failed=isinstance(result, Exception),
+            )
+
+        if owns_transaction:
+            con.execute("COMMIT;")
+    except Exception:
+        if owns_transaction and con.in_transaction:
+            con.rollback()
+        raise
+
+    return results
+
+
+class _WriteEntry:
+    __slots__ = ("many", "sql", "parameters", "future", "queued_at")
+
+    def __init__(
+        self, many: bool, sql: str, parameters: Any, future: asyncio.Future
+    ) -> None:
+        self.many = many
+        self.sql = sql
+        self.parameters = parameters
+        self.future = future
+        self.queued_at = time.perf_counter()
+
+
+class Writer:
+    """Funnels writes through a single :class:`Connection`.
+
+    Create these with :func:`create_writer`.
+
+    Writes are queued and committed in batches: once a write arrives,
+    the writer waits ``window`` seconds for more to show up and then runs
+    all of them inside one transaction. Each awaiting caller resumes once
+    the transaction containing its statement has been committed.
+
+    Statements are isolated from each other with savepoints, a failing
+    statement raises for its caller only.
+    """
+
+    def __init__(
+        self, connection: Connection, *, window: float, max_batch: int
+    ) -> None:
+        self._connection = connection
+        self._window = window
+        self._max_batch = max_batch
+
+        self._queue: asyncio.Queue[_WriteEntry] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._writes = 0
+        self._batches = 0
+        self._largest_batch = 0
+
+    @property
+    def connection(self) -> Connection:
+        """The :class:`Connection` writes are executed on."""
+        return self._connection
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called."""
+        return self._closed
+
+    def start(self) -> None:
+        """Starts the background task that flushes queued writes."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    def _submit(self, many: bool, sql: str, parameters: Any) -> asyncio.Future[int]:
+        if self._closed:
+            raise RuntimeError("Cannot write using a closed writer")
+
+        self.start()
+        future: asyncio.Future[int] = asyncio.get_event_loop().create_future()
+        self._queue.put_nowait(_WriteEntry(many, sql, parameters, future))
+        return future
+
+    async def execute(self, sql: str, /, *parameters: Any) -> int:
+        """Queues a single statement and waits for it to be committed.
+
+        Returns the number of rows modified by the statement.
+        """
+        if len(parameters) == 1 and isinstance(parameters[0], (dict, tuple)):
+            parameters = parameters[0]  # type: ignore
+        return await self._submit(False, sql, parameters)
+
+    async def executemany(
+        self, sql: str, seq_of_parameters: Iterable[Iterable[Any]]
+    ) -> int:
+        """Queues a statement for every set of parameters, committed together.
+
+        Returns the number of rows modified.
+        """
+        return await self._submit(True, sql, list(seq_of_parameters))
+
+    async def _run(self) -> None:
+        _queue = self._queue
+        while True:
+            batch = [await _queue.get()]
+            if self._window > 0:
+                await asyncio.sleep(self._window)
+
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            await self._flush(batch)
+            for _ in batch:
+                _queue.task_done()
+
+    async def _flush(self, batch: List[_WriteEntry]) -> None:
+        pending = [entry for entry in batch if not entry.future.cancelled()]
+        if not pending:
+            return
+
+        statements = [
+            (entry.many, entry.sql, entry.parameters, entry.queued_at)
+            for entry in pending
+        ]
+        try:
+            results = await self._connection._post(
+                _run_write_batch, self._connection._conn, statements
+            )
+        except Exception as e:
+            for entry in pending:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+            return
+
+        self._writes += len(pending)
+        self._batches += 1
+        self._largest_batch = max(self._largest_batch, len(pending))
+
+        for entry, result in zip(pending, results):
+            if entry.future.done():
+                continue
+            elif isinstance(result, Exception):
+                entry.future.set_exception(result)
+            else:
+                entry.future.set_result(result)
+
+    async def close(self) -> None:
+        """Flushes any queued writes and stops the writer.
+
+        The underlying :class:`Connection` is left open.
+        """
+        self._closed = True
+        if self._task is None:
+            return
+
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the writer's batching statistics."""
+        return {
+            "queued": self._queue.qsize(),
+            "writes": self._writes,
+            "batches": self._batches,
+            "largest_batch": self._largest_batch,
+            "average_batch": self._writes / self._batches if self._batches else 0.0,
+            "worker": self._connection.worker_stats(),
+        }
+
+
+def create_writer(
+    connection: Connection, *, window: float = 0.005, max_batch: int = 256
+) -> Writer:
+    """Creates a :class:`Writer` on top of an existing connection.
+
+    .. code-block:: python3
+
+        conn = await connect("tsundoku.db")
+        writer = create_writer(conn)
+        await writer.execute("UPDATE ...", ...)
+
+    Parameters
+    ------------
+    window: float
+        Seconds to wait after the first queued write for others
+        to join the same transaction.
+    max_batch: int
+        The most statements committed in a single transaction.
+    """
+    return Writer(connection, window=window, max_batch=max_batch)
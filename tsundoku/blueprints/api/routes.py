@@ -28,7 +28,9 @@ from tsundoku.config import (
     GeneralConfig,
     TorrentConfig,
 )
+from tsundoku.database import pool_stats, query_stats, reset_query_stats, writer_stats
 from tsundoku.decorators import deny_readonly
+from tsundoku.sources import registry
 from tsundoku.webhooks import WebhookBase
 from tsundoku.user import User
 from tsundoku.utils import directory_is_writable
@@ -247,6 +249,44 @@ async def get_encode_queue() -> APIResponse:
     return APIResponse(result=await app.encoder.get_queue(page))
 
 
+@api_blueprint.route("/debug/queries", methods=["GET"])
+async def debug_queries() -> APIResponse:
+    """
+    Returns execution statistics for every database statement
+    along with the state of the connection pool and writer.
+
+    :returns: Dict[:class:`str`, Any]
+    """
+    return APIResponse(
+        result={
+            "statements": query_stats(),
+            "pool": pool_stats(),
+            "writer": writer_stats(),
+        }
+    )
+
+
+@api_blueprint.route("/debug/queries", methods=["DELETE"])
+@deny_readonly
+async def reset_debug_queries() -> APIResponse:
+    """
+    Resets the statement statistics, then returns
+    the same statistics as a GET request.
+
+    :returns: Dict[:class:`str`, Any]
+    """
+    logger.info("API - Resetting query statistics")
+    reset_query_stats()
+
+    return APIResponse(
+        result={
+            "statements": query_stats(),
+            "pool": pool_stats(),
+            "writer": writer_stats(),
+        }
+    )
+
+
 @api_blueprint.route("/shows/check", methods=["GET"])
 @deny_readonly
 async def check_for_releases() -> APIResponse:
@@ -269,6 +309,48 @@ async def check_for_releases() -> APIResponse:
     return APIResponse(result=found_items)
 
 
+@api_blueprint.route("/sources", methods=["GET"])
+async def get_sources() -> APIResponse:
+    """
+    Returns every installed RSS source and the
+    reason each malformed source file was skipped.
+
+    .. :quickref: Sources; Retrieves all sources.
+
+    :returns: Dict[:class:`str`, Any]
+    """
+    sources = await registry.refresh()
+
+    return APIResponse(
+        result={
+            "sources": [source.to_dict() for source in sources],
+            "errors": registry.errors,
+        }
+    )
+
+
+@api_blueprint.route("/sources/schedule", methods=["GET"])
+async def get_source_schedule() -> APIResponse:
+    """
+    Returns the polling schedule of every RSS source,
+    the next source to be polled first.
+
+    .. :quickref: Sources; Retrieves the polling schedule.
+
+    :returns: List[Dict[:class:`str`, Any]]
+    """
+    schedules = sorted(
+        app.poller.schedules.items(), key=lambda item: item[1].next_poll_at
+    )
+
+    return APIResponse(
+        result=[
+            {"name": name, "version": version, **schedule.to_dict()}
+            for (name, version), schedule in schedules
+        ]
+    )
+
+
 @api_blueprint.route("/shows/<int:show_id>/cache", methods=["DELETE"])
 async def delete_show_cache(show_id: int) -> APIResponse:
     """
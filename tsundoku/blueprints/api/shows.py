@@ -312,6 +312,8 @@ class ShowsAPI(views.MethodView):
                 show_id,
             )
 
+        Show.changed(app)
+
         logger.info(f"Show Deleted - {title}")
 
         return APIResponse(result=True)
@@ -9,6 +9,8 @@ const _ = getInjector();
 
 interface FeedsConfig {
   polling_interval?: number;
+  min_polling_interval?: number;
+  max_polling_interval?: number;
   complete_check_interval?: number;
   fuzzy_cutoff?: number;
   seed_ratio_limit?: number;
@@ -38,6 +40,14 @@ export const FeedsConfig = () => {
     mutation.mutate({ key: "polling_interval", value: e.target.value });
   };
 
+  const inputMinPollingInterval = async (e: ChangeEvent<HTMLInputElement>) => {
+    mutation.mutate({ key: "min_polling_interval", value: e.target.value });
+  };
+
+  const inputMaxPollingInterval = async (e: ChangeEvent<HTMLInputElement>) => {
+    mutation.mutate({ key: "max_polling_interval", value: e.target.value });
+  };
+
   const inputCompleteCheck = async (e: ChangeEvent<HTMLInputElement>) => {
     mutation.mutate({ key: "complete_check_interval", value: e.target.value });
   };
@@ -142,6 +152,50 @@ export const FeedsConfig = () => {
           </div>
         </div>
       </div>
+      <div className="columns">
+        <div className="column is-3 my-auto">
+          <h1 className="title is-5">{_("feeds-minpollinginterval-title")}</h1>
+          <h2 className="subtitle is-6">
+            {_("feeds-minpollinginterval-subtitle")}
+          </h2>
+          <div className="field has-addons">
+            <div className="control">
+              <input
+                className="input"
+                type="number"
+                min="180"
+                placeholder="180"
+                defaultValue={config.data?.min_polling_interval}
+                onChange={inputMinPollingInterval}
+              />
+            </div>
+            <div className="control">
+              <a className="button is-static">{_("seconds-suffix")}</a>
+            </div>
+          </div>
+        </div>
+        <div className="column is-3 my-auto">
+          <h1 className="title is-5">{_("feeds-maxpollinginterval-title")}</h1>
+          <h2 className="subtitle is-6">
+            {_("feeds-maxpollinginterval-subtitle")}
+          </h2>
+          <div className="field has-addons">
+            <div className="control">
+              <input
+                className="input"
+                type="number"
+                min="180"
+                placeholder="3600"
+                defaultValue={config.data?.max_polling_interval}
+                onChange={inputMaxPollingInterval}
+              />
+            </div>
+            <div className="control">
+              <a className="button is-static">{_("seconds-suffix")}</a>
+            </div>
+          </div>
+        </div>
+      </div>
     </div>
   );
 };
@@ -171,6 +171,8 @@ class FeedsConfig(Config):
     TABLE_NAME = "feeds_config"
 
     polling_interval: int
+    min_polling_interval: int
+    max_polling_interval: int
     complete_check_interval: int
     fuzzy_cutoff: int
     seed_ratio_limit: float
@@ -182,6 +184,24 @@ class FeedsConfig(Config):
         if int(value) < 180:
             raise ConfigCheckFailure("Polling interval must be at least 180 seconds")
 
+    def check_min_polling_interval(self, value: str) -> None:
+        if isinstance(value, str) and not value.isdigit():
+            raise ConfigCheckFailure(f"'{value}' is not a valid integer")
+
+        if int(value) < 180:
+            raise ConfigCheckFailure(
+                "Minimum polling interval must be at least 180 seconds"
+            )
+
+    def check_max_polling_interval(self, value: str) -> None:
+        if isinstance(value, str) and not value.isdigit():
+            raise ConfigCheckFailure(f"'{value}' is not a valid integer")
+
+        if int(value) < int(self.min_polling_interval):
+            raise ConfigCheckFailure(
+                "Maximum polling interval must be at least the minimum polling interval"
+            )
+
     def check_complete_check_interval(self, value: str) -> None:
         if isinstance(value, str) and not value.isdigit():
             raise ConfigCheckFailure(f"'{value}' is not a valid integer")
@@ -57,3 +57,68 @@ DATABASE_FILE_NAME = "tsundoku.db"
 LOGGING_FILE_NAME = "tsundoku.log"
 
 DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
+
+# Number of long-lived connections kept open by `tsundoku.database.acquire`
+# and how many seconds a caller waits for a free one before giving up.
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "8"))
+DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+
+# Writes sent through `tsundoku.database.write` are committed together when
+# they arrive within this many seconds of each other.
+DATABASE_WRITE_WINDOW = float(os.getenv("DATABASE_WRITE_WINDOW", "0.005"))
+DATABASE_WRITE_MAX_BATCH = int(os.getenv("DATABASE_WRITE_MAX_BATCH", "256"))
+
+# Statements that take at least this many seconds to execute are logged,
+# 0 turns the slow query log off.
+DATABASE_SLOW_QUERY_THRESHOLD = float(os.getenv("DATABASE_SLOW_QUERY_THRESHOLD", "0.5"))
+
+# Most values bound to a single `IN (...)` list, SQLite versions
+# before 3.32 reject statements with more than 999 variables.
+DATABASE_MAX_IN_VARIABLES = int(os.getenv("DATABASE_MAX_IN_VARIABLES", "500"))
+
+# Upper bound on the number of free pages handed back to the filesystem
+# by each scheduled `tsundoku.database.maintain` run.
+DATABASE_INCREMENTAL_VACUUM_PAGES = int(
+    os.getenv("DATABASE_INCREMENTAL_VACUUM_PAGES", "2000")
+)
+
+# How many RSS sources are downloaded at the same time, and how many
+# seconds a source may take before it is skipped for the current poll.
+POLLER_MAX_CONCURRENT_FETCHES = int(os.getenv("POLLER_MAX_CONCURRENT_FETCHES", "8"))
+POLLER_FETCH_TIMEOUT = float(os.getenv("POLLER_FETCH_TIMEOUT", "30"))
+
+# Bytes of a feed read at a time, parsing stops between
+# chunks once the newest item of the previous poll is found.
+POLLER_FEED_CHUNK_SIZE = int(os.getenv("POLLER_FEED_CHUNK_SIZE", "16384"))
+
+# Number of releases of a poll whose torrents are resolved and added to the
+# download client at the same time, and how many releases may wait between
+# matching and each of those stages.
+POLLER_PIPELINE_RESOLVE_WORKERS = int(os.getenv("POLLER_PIPELINE_RESOLVE_WORKERS", "4"))
+POLLER_PIPELINE_ADD_WORKERS = int(os.getenv("POLLER_PIPELINE_ADD_WORKERS", "4"))
+POLLER_PIPELINE_QUEUE_SIZE = int(os.getenv("POLLER_PIPELINE_QUEUE_SIZE", "16"))
+
+# Weight of the latest poll in each source's learned release cadence and
+# idle rate, higher values adapt the polling interval faster.
+POLLER_SCHEDULE_SMOOTHING = float(os.getenv("POLLER_SCHEDULE_SMOOTHING", "0.3"))
+
+# Number of show entries the downloader queries the download client for, and
+# renames or moves to their library, at the same time.
+DOWNLOADER_MAX_CONCURRENT_QUERIES = int(
+    os.getenv("DOWNLOADER_MAX_CONCURRENT_QUERIES", "4")
+)
+DOWNLOADER_MAX_CONCURRENT_RENAMES = int(
+    os.getenv("DOWNLOADER_MAX_CONCURRENT_RENAMES", "8")
+)
+DOWNLOADER_MAX_CONCURRENT_MOVES = int(os.getenv("DOWNLOADER_MAX_CONCURRENT_MOVES", "2"))
+
+# Number of file names whose `tsundoku.utils.parse_anime_title` results
+# are kept in memory, the least recently parsed are dropped first.
+PARSER_CACHE_SIZE = int(os.getenv("PARSER_CACHE_SIZE", "4096"))
+
+# Batches of at least this many uncached file names are parsed by
+# `tsundoku.utils.parse_many` in a pool of processes, in chunks of
+# `PARSER_CHUNK_SIZE`. 0 processes starts one for every CPU.
+PARSER_PROCESS_THRESHOLD = int(os.getenv("PARSER_PROCESS_THRESHOLD", "256"))
+PARSER_CHUNK_SIZE = int(os.getenv("PARSER_CHUNK_SIZE", "64"))
+PARSER_PROCESSES = int(os.getenv("PARSER_PROCESSES", "0"))
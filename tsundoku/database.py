@@ -1,33 +1,250 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import sqlite3
 from configparser import ConfigParser
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import asynccontextmanager, closing, contextmanager
 from pathlib import Path
-import shutil
 import subprocess
-from typing import Any, AsyncIterator, Iterator, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from tsundoku.asqlite import Connection
 
 from yoyo import get_backend, read_migrations
 
-from tsundoku.constants import DATA_DIR, DATABASE_FILE_NAME
+from tsundoku.constants import (
+    DATA_DIR,
+    DATABASE_FILE_NAME,
+    DATABASE_INCREMENTAL_VACUUM_PAGES,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_SLOW_QUERY_THRESHOLD,
+    DATABASE_WRITE_MAX_BATCH,
+    DATABASE_WRITE_WINDOW,
+)
 from tsundoku import asqlite
 
 logger = logging.getLogger("tsundoku")
 
+asqlite.query_statistics.slow_query_threshold = DATABASE_SLOW_QUERY_THRESHOLD or None
+
+_pool: Optional[asqlite.Pool] = None
+_writer: Optional[asyncio.Task[asqlite.Writer]] = None
+
+
+def get_pool() -> asqlite.Pool:
+    """
+    Returns the connection pool for the running event loop,
+    creating it if it does not exist yet.
+
+    Returns
+    -------
+    asqlite.Pool
+        The connection pool.
+    """
+    global _pool
+
+    loop = asyncio.get_running_loop()
+    if _pool is not None and not _pool.closed and _pool.loop is loop:
+        return _pool
+
+    if _pool is not None and not _pool.closed:
+        # The loop the previous pool reported back to is gone.
+        _pool.terminate()
+
+    logger.debug(f"Creating database connection pool [size={DATABASE_POOL_SIZE}]")
+    _pool = asqlite.create_pool(
+        f"{DATA_DIR / DATABASE_FILE_NAME}",
+        size=DATABASE_POOL_SIZE,
+        timeout=DATABASE_POOL_TIMEOUT,
+        loop=loop,
+    )
+    return _pool
+
+
+async def close_pool() -> None:
+    """
+    Closes every connection in the connection pool.
+    """
+    global _pool
+
+    if _pool is None:
+        return
+
+    pool, _pool = _pool, None
+    await pool.close()
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Returns usage statistics for the connection pool.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The pool statistics, empty if no pool exists.
+    """
+    if _pool is None:
+        return {}
+
+    return _pool.stats()
+
+
+async def _open_writer() -> asqlite.Writer:
+    logger.debug("Opening database writer connection")
+    con = await asqlite.connect(f"{DATA_DIR / DATABASE_FILE_NAME}")
+    writer = asqlite.create_writer(
+        con, window=DATABASE_WRITE_WINDOW, max_batch=DATABASE_WRITE_MAX_BATCH
+    )
+    writer.start()
+    return writer
+
+
+async def get_writer() -> asqlite.Writer:
+    """
+    Returns the writer for the running event loop,
+    opening its dedicated connection if necessary.
+
+    Returns
+    -------
+    asqlite.Writer
+        The database writer.
+    """
+    global _writer
+
+    loop = asyncio.get_running_loop()
+    if (
+        _writer is None
+        or _writer.get_loop() is not loop
+        or (_writer.done() and _writer.exception() is not None)
+        or (_writer.done() and _writer.result().closed)
+    ):
+        _writer = loop.create_task(_open_writer())
+
+    return await asyncio.shield(_writer)
+
+
+async def close_writer() -> None:
+    """
+    Flushes any pending writes and closes
+    the writer's connection.
+    """
+    global _writer
+
+    if _writer is None:
+        return
+
+    task, _writer = _writer, None
+    try:
+        writer = await task
+    except Exception:
+        return
+
+    await writer.close()
+    await writer.connection.close()
+
+
+def writer_stats() -> Dict[str, Any]:
+    """
+    Returns batching statistics for the writer.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The writer statistics, empty if no writer exists.
+    """
+    if _writer is None or not _writer.done() or _writer.exception() is not None:
+        return {}
+
+    return _writer.result().stats()
+
+
+def query_stats() -> List[Dict[str, Any]]:
+    """
+    Returns execution statistics for every statement
+    run so far, the most expensive first.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        The statistics of each normalized statement.
+    """
+    return asqlite.query_statistics.snapshot()
+
+
+def reset_query_stats() -> None:
+    """
+    Discards the statement statistics collected so far.
+    """
+    asqlite.query_statistics.reset()
+
 
 @asynccontextmanager
 async def acquire() -> AsyncIterator[Connection]:
-    async with asqlite.connect(f"{DATA_DIR / DATABASE_FILE_NAME}") as con:
+    async with get_pool().acquire() as con:
         yield con
 
 
+async def write(sql: str, /, *parameters: Any) -> int:
+    """
+    Queues a write to be committed alongside any other
+    writes made around the same time.
+
+    Waits until the write has been committed.
+
+    Parameters
+    ----------
+    sql: str
+        The statement to execute.
+    *parameters: Any
+        The statement's parameters.
+
+    Returns
+    -------
+    int
+        The number of rows modified.
+    """
+    writer = await get_writer()
+    return await writer.execute(sql, *parameters)
+
+
+async def write_many(sql: str, seq_of_parameters: Iterable[Iterable[Any]], /) -> int:
+    """
+    Queues a statement for every set of parameters, committed
+    in the same transaction as each other and any other writes
+    made around the same time.
+
+    Waits until the writes have been committed.
+
+    Parameters
+    ----------
+    sql: str
+        The statement to execute.
+    seq_of_parameters: Iterable[Iterable[Any]]
+        The parameters of each execution.
+
+    Returns
+    -------
+    int
+        The number of rows modified.
+    """
+    writer = await get_writer()
+    return await writer.executemany(sql, seq_of_parameters)
+
+
 @contextmanager
 def sync_acquire() -> Iterator[sqlite3.Connection]:
     with sqlite3.connect(f"{DATA_DIR / DATABASE_FILE_NAME}") as con:
@@ -185,25 +402,84 @@ async def migrate_to_data_dir() -> None:
             Path(f).rename(Path(DATA_DIR) / f)
 
 
+def enable_incremental_vacuum() -> None:
+    """
+    Switches the database to incremental auto-vacuum so that
+    free pages can be reclaimed by `maintain` instead of
+    rebuilding the whole file with VACUUM.
+
+    An existing database has to be rebuilt once for the
+    change to take effect.
+    """
+    with closing(
+        sqlite3.connect(f"{DATA_DIR / DATABASE_FILE_NAME}", isolation_level=None)
+    ) as con:
+        # 2 is INCREMENTAL.
+        if con.execute("PRAGMA auto_vacuum;").fetchone()[0] == 2:
+            return
+
+        con.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+        if con.execute("SELECT COUNT(*) FROM sqlite_master;").fetchone()[0]:
+            logger.info("Enabling incremental auto-vacuum, this may take a while...")
+            con.execute("VACUUM;")
+
+
+def backup(destination: Path) -> None:
+    """
+    Copies the database to a file using SQLite's online
+    backup API, which is safe while other connections are open.
+
+    Parameters
+    ----------
+    destination: Path
+        The file to write the backup to.
+    """
+    with closing(sqlite3.connect(f"{DATA_DIR / DATABASE_FILE_NAME}")) as source:
+        with closing(sqlite3.connect(f"{destination}")) as target:
+            source.backup(target)
+
+
+async def maintain() -> None:
+    """
+    Returns free pages to the filesystem and lets SQLite
+    refresh the statistics used by the query planner.
+    """
+    async with acquire() as con:
+        free_pages = await con.fetchval("PRAGMA freelist_count;")
+        if free_pages:
+            # sqlite3's execute only steps the pragma once, freeing a
+            # single page, executescript runs it to completion.
+            await con.executescript(
+                f"PRAGMA incremental_vacuum({DATABASE_INCREMENTAL_VACUUM_PAGES});"
+            )
+        await con.execute("PRAGMA optimize;")
+
+    logger.debug(f"Database maintenance finished. [free_pages={free_pages}]")
+
+
 async def migrate() -> None:
     try:
         await migrate_to_data_dir()
     except Exception as e:
         logger.error(f"Error migrating to data directory: {e}", exc_info=True)
 
-    logger.info("Backing up database before performing migrations...")
-    shutil.copy(
-        DATA_DIR / DATABASE_FILE_NAME,
-        (DATA_DIR / DATABASE_FILE_NAME).with_suffix(".db.autobak"),
-    )
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, enable_incremental_vacuum)
 
     backend = get_backend(f"sqlite:///{DATA_DIR / DATABASE_FILE_NAME}")
     migrations = read_migrations("migrations")
     migrations.items = migrations.items[14:]
 
-    logger.info("Applying database migrations...")
     with backend.lock():
-        backend.apply_migrations(backend.to_apply(migrations))
+        to_apply = backend.to_apply(migrations)
+        if to_apply:
+            logger.info("Backing up database before performing migrations...")
+            await loop.run_in_executor(
+                None, backup, (DATA_DIR / DATABASE_FILE_NAME).with_suffix(".db.autobak")
+            )
+
+            logger.info("Applying database migrations...")
+            backend.apply_migrations(to_apply)
 
     try:
         await transfer_config()
@@ -1,3 +1,4 @@
+from .abstract import TorrentInfo
 from .client import Manager
 
-__all__ = ["Manager"]
+__all__ = ["Manager", "TorrentInfo"]
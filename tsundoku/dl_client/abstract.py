@@ -1,6 +1,42 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass
+class TorrentInfo:
+    """
+    The status of a torrent in the download client.
+
+    Attributes
+    ----------
+    hash: str
+        The torrent's info hash, lowercase.
+    state: str
+        The client's name for the torrent's state.
+    completed: bool
+        Whether the torrent is fully downloaded
+        and ready for file I/O operations.
+    progress: float
+        The downloaded fraction, from 0.0 to 1.0.
+    ratio: Optional[float]
+        The torrent's seed ratio.
+    content_path: Optional[Path]
+        The torrent's downloaded file path.
+    files: Optional[List[str]]
+        The paths of the torrent's files, relative to
+        its save path. None if the client does not
+        report them along with the torrent's status.
+    """
+
+    hash: str
+    state: str
+    completed: bool
+    progress: float
+    ratio: Optional[float] = None
+    content_path: Optional[Path] = None
+    files: Optional[List[str]] = None
 
 
 class TorrentClient(ABC):
@@ -83,6 +119,25 @@ class TorrentClient(ABC):
             The torrent's seed ratio.
         """
 
+    @abstractmethod
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        """
+        Retrieves the status of many torrents in a single request.
+
+        Parameters
+        ----------
+        torrent_ids: Sequence[str]
+            The torrent IDs to check.
+
+        Returns
+        -------
+        Dict[str, TorrentInfo]
+            The status of each torrent by lowercase ID,
+            torrents missing from the client are left out.
+        """
+
     @abstractmethod
     async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
         """
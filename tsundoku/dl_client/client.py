@@ -5,7 +5,7 @@ import hashlib
 import logging
 import re
 from pathlib import Path
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
@@ -14,7 +14,7 @@ import aiohttp
 import bencodepy
 
 from tsundoku.config import TorrentConfig
-from tsundoku.dl_client.abstract import TorrentClient
+from tsundoku.dl_client.abstract import TorrentClient, TorrentInfo
 from tsundoku.dl_client.deluge import DelugeClient
 from tsundoku.dl_client.qbittorrent import qBittorrentClient
 from tsundoku.dl_client.transmission import TransmissionClient
@@ -201,6 +201,30 @@ class Manager:
 
         return await self._client.check_torrent_ratio(torrent_id)
 
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        """
+        Retrieves the status of many torrents from
+        a download client in a single request.
+
+        Parameters
+        ----------
+        torrent_ids: Sequence[str]
+            The torrents' IDs (hashes)
+
+        Returns
+        -------
+        Dict[str, TorrentInfo]:
+            The status of each torrent found, by lowercase ID.
+        """
+        if not torrent_ids:
+            return {}
+
+        await self.update_config()
+
+        return await self._client.get_torrents_status(torrent_ids)
+
     async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
         """
         Sends a request to the client to delete the torrent,
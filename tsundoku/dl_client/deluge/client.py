@@ -1,14 +1,28 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 import aiohttp
 
-from tsundoku.dl_client.abstract import TorrentClient
+from tsundoku.dl_client.abstract import TorrentClient, TorrentInfo
 
 logger = logging.getLogger("tsundoku")
 
+# Keys needed to build a `TorrentInfo`.
+STATUS_KEYS = [
+    "hash",
+    "state",
+    "progress",
+    "ratio",
+    "name",
+    "move_completed_path",
+    "files",
+]
+
+# Error code of Deluge WebAPI responses to requests without a valid session.
+AUTH_ERROR_CODE = 1
+
 
 class DelugeClient(TorrentClient):
     def __init__(self, session: aiohttp.ClientSession, **kwargs: Any) -> None:
@@ -24,13 +38,22 @@ class DelugeClient(TorrentClient):
 
         self.url = self.build_api_url(host, port, secure)
 
+        self._authenticated = False
+        self._auth_lock = asyncio.Lock()
+
+        # Single torrent lookups waiting to be sent together, see `get_torrent`.
+        self._lookups: Dict[str, List[asyncio.Future]] = {}
+        self._lookup_keys: Set[str] = set()
+        self._lookup_task: Optional[asyncio.Task] = None
+
     def build_api_url(self, host: str, port: int, secure: bool) -> str:
         protocol = "https" if secure else "http"
 
         return f"{protocol}://{host}:{port}/json"
 
     async def test_client(self) -> bool:
-        return await self.login() is not None
+        self._authenticated = False
+        return await self.login()
 
     async def check_torrent_exists(self, torrent_id: str) -> bool:
         fp = await self.get_torrent_fp(torrent_id)
@@ -38,46 +61,106 @@ class DelugeClient(TorrentClient):
 
     async def check_torrent_completed(self, torrent_id: str) -> bool:
         logger.debug(f"Retrieving torrent state for hash `{torrent_id}`")
-        ret = await self.request("webapi.get_torrents", [[torrent_id], ["state"]])
-
-        ret_list = ret["result"].get("torrents", [])
-
-        try:
-            data = ret_list[0]
-        except IndexError:
+        data = await self.get_torrent(torrent_id, ["state"])
+        if data is None:
             return False
 
         logger.debug(f"Torrent `{torrent_id}` is `{data['state']}`")
         return data["state"] == "Seeding"
 
     async def check_torrent_ratio(self, torrent_id: str) -> Optional[float]:
-        ret = await self.request("webapi.get_torrents", [[torrent_id], ["ratio"]])
+        data = await self.get_torrent(torrent_id, ["ratio"])
+        if data is None:
+            return None
 
-        ret_list = ret["result"].get("torrents", [])
+        return data.get("ratio")
 
-        try:
-            data = ret_list[0]
-        except IndexError:
-            return None
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        ret = await self.request(
+            "webapi.get_torrents", [list(torrent_ids), STATUS_KEYS]
+        )
 
-        if "ratio" in data:
-            return data["ratio"]
+        result = ret.get("result") or {}
+
+        statuses = {}
+        for torrent in result.get("torrents", []):
+            torrent_hash = torrent["hash"].lower()
+            statuses[torrent_hash] = TorrentInfo(
+                torrent_hash,
+                torrent["state"],
+                torrent["state"] == "Seeding",
+                torrent.get("progress", 0.0) / 100,
+                torrent.get("ratio"),
+                Path(torrent["move_completed_path"], torrent["name"]),
+                [file["path"] for file in torrent.get("files", [])],
+            )
 
-        return None
+        return statuses
 
-    async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
-        await self.request("webapi.remove_torrent", [torrent_id, with_files])
+    async def get_torrent(
+        self, torrent_id: str, keys: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves some of a torrent's status keys.
 
-    async def get_torrent_fp(self, torrent_id: str) -> Optional[Path]:
-        ret = await self.request(
-            "webapi.get_torrents", [[torrent_id], ["name", "move_completed_path"]]
-        )
+        The WebAPI answers a single call per HTTP request, so lookups
+        made at the same time, e.g. by concurrent completion checks,
+        are sent together as one `webapi.get_torrents` call for all
+        of their torrents and keys.
+
+        Parameters
+        ----------
+        torrent_id: str
+            The torrent's hash.
+        keys: Sequence[str]
+            The status keys to retrieve.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The torrent's status, None if it does not exist.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._lookups.setdefault(torrent_id.lower(), []).append(future)
+        self._lookup_keys.update(keys)
+
+        if self._lookup_task is None:
+            self._lookup_task = asyncio.create_task(self._send_lookups())
+
+        return await future
 
-        ret_list = ret["result"].get("torrents", [])
+    async def _send_lookups(self) -> None:
+        # Lets every lookup made in the same iteration of the loop join in.
+        await asyncio.sleep(0)
+
+        lookups, keys = self._lookups, self._lookup_keys | {"hash"}
+        self._lookups, self._lookup_keys = {}, set()
+        self._lookup_task = None
 
         try:
-            data = ret_list[0]
-        except IndexError:
+            ret = await self.request("webapi.get_torrents", [list(lookups), list(keys)])
+        except Exception as e:
+            for futures in lookups.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        result = ret.get("result") or {}
+        torrents = {t["hash"].lower(): t for t in result.get("torrents", [])}
+        for torrent_hash, futures in lookups.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(torrents.get(torrent_hash))
+
+    async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
+        await self.request("webapi.remove_torrent", [torrent_id, with_files])
+
+    async def get_torrent_fp(self, torrent_id: str) -> Optional[Path]:
+        data = await self.get_torrent(torrent_id, ["name", "move_completed_path"])
+        if data is None:
             return None
 
         return Path(data["move_completed_path"], data["name"])
@@ -86,46 +169,20 @@ class DelugeClient(TorrentClient):
         data = await self.request("webapi.add_torrent", [magnet_url])
         return data.get("result")
 
-    async def login(self) -> Optional[str]:
-        payload = {
-            "id": self._request_counter,
-            "method": "auth.check_session",
-            "params": [],
-        }
-
-        headers = {"Accept": "application/json", "Content-Type": "application/json"}
-
-        try:
-            auth_status = await self.session.post(
-                self.url, json=payload, headers=headers
-            )
-        except aiohttp.ClientConnectionError:
-            logger.error("Deluge - Failed to Connect")
-            resp = {}
-        else:
-            resp = await auth_status.json(content_type=None)
-
-        self._request_counter += 1
-        result = resp.get("result")
-        if not result:
-            payload = {
-                "id": self._request_counter,
-                "method": "auth.login",
-                "params": [self.password],
-            }
-            auth_request = await self.session.post(
-                self.url, json=payload, headers=headers
-            )
-            resp = await auth_request.json(content_type=None)
+    async def login(self) -> bool:
+        async with self._auth_lock:
+            if self._authenticated:
+                return True
 
-            self._request_counter += 1
-
-            error = resp.get("error")
-            if error or resp["result"] is False:
+            resp = await self._post("auth.login", [self.password])
+            if resp.get("error") or not resp.get("result"):
                 logger.warning("Deluge - Failed to Authenticate")
-                return None
+                return False
+
+            self._authenticated = True
+            logger.info("Deluge - Successfully Authenticated")
 
-        return result
+        return True
 
     async def request(self, method: str, data: list = []) -> dict:
         """
@@ -134,6 +191,9 @@ class DelugeClient(TorrentClient):
         Results will be returned in the 'result' key in the response dict.
         Errors will be returned as an 'error' key in the response dict.
 
+        The session is reused between requests, and only renewed
+        once when the WebAPI responds that it is not authenticated.
+
         Parameters
         ----------
         method: str
@@ -144,22 +204,35 @@ class DelugeClient(TorrentClient):
         Returns
         -------
         dict
-            The response dict.
+            The response dict, empty if the request failed.
         """
-        retries = 5
-        while retries and not await self.login():
-            await asyncio.sleep(10)
-            retries -= 1
-            continue
+        if not await self.login():
+            return {}
 
-        logger.info("Deluge - Successfully Authenticated")
+        resp = await self._post(method, data)
 
-        payload = {"id": self._request_counter, "method": method, "params": data}
+        error = resp.get("error") or {}
+        if error.get("code") == AUTH_ERROR_CODE:
+            logger.info("Deluge - Session expired, authenticating again")
+            self._authenticated = False
+            if not await self.login():
+                return {}
 
-        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+            resp = await self._post(method, data)
 
-        resp = await self.session.post(self.url, json=payload, headers=headers)
+        return resp
 
+    async def _post(self, method: str, params: list) -> dict:
+        payload = {"id": self._request_counter, "method": method, "params": params}
         self._request_counter += 1
 
-        return await resp.json(content_type=None)
+        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+
+        try:
+            async with self.session.post(
+                self.url, json=payload, headers=headers
+            ) as resp:
+                return await resp.json(content_type=None) or {}
+        except aiohttp.ClientConnectionError:
+            logger.error("Deluge - Failed to Connect")
+            return {}
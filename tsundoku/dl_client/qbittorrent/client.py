@@ -3,14 +3,25 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import aiohttp
 
-from tsundoku.dl_client.abstract import TorrentClient
+from tsundoku.dl_client.abstract import TorrentClient, TorrentInfo
 
 logger = logging.getLogger("tsundoku")
 
+# States of torrents that are fully downloaded.
+COMPLETED_STATES = (
+    "checkingUP",
+    "completed",
+    "forcedUP",
+    "pausedUP",
+    "queuedUP",
+    "stalledUP",
+    "uploading",
+)
+
 
 class qBittorrentClient(TorrentClient):
     auth: Dict[str, str]
@@ -31,6 +42,11 @@ class qBittorrentClient(TorrentClient):
 
         self.url = self.build_api_url(host, port, secure)
 
+        # Mirror of the client's torrents, see `sync`.
+        self._rid = 0
+        self._torrents: Dict[str, Dict[str, Any]] = {}
+        self._sync_lock = asyncio.Lock()
+
     def build_api_url(self, host: str, port: int, secure: bool) -> str:
         protocol = "https" if secure else "http"
 
@@ -44,38 +60,91 @@ class qBittorrentClient(TorrentClient):
         return bool(fp)
 
     async def check_torrent_completed(self, torrent_id: str) -> bool:
-        payload = {"hashes": torrent_id}
-
-        logger.debug(f"Retrieving torrent state for hash `{torrent_id}`")
-        data = await self.request("get", "torrents", "info", params=payload)
-        if not data or not data[0].get("state"):
+        statuses = await self.get_torrents_status([torrent_id])
+        status = statuses.get(torrent_id.lower())
+        if status is None or not status.state:
             return False
 
-        state = data[0].get("state")
-        logger.debug(f"Torrent `{torrent_id}` is `{state}`")
-        return state in (
-            "checkingUP",
-            "completed",
-            "forcedUP",
-            "pausedUP",
-            "queuedUP",
-            "stalledUP",
-            "uploading",
-        )
+        logger.debug(f"Torrent `{torrent_id}` is `{status.state}`")
+        return status.completed
 
     async def check_torrent_ratio(self, torrent_id: str) -> Optional[float]:
-        payload = {"hashes": torrent_id}
-
-        logger.debug(f"Retrieving torrent state for hash `{torrent_id}`")
-        data = await self.request("get", "torrents", "info", params=payload)
-        if not data or not data[0].get("state"):
+        statuses = await self.get_torrents_status([torrent_id])
+        status = statuses.get(torrent_id.lower())
+        if status is None or not status.state:
             return None
 
-        state = data[0]
-        if "ratio" in state:
-            return state["ratio"]
+        return status.ratio
+
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        torrents = await self.sync()
+
+        statuses = {}
+        for torrent_id in torrent_ids:
+            torrent_hash = torrent_id.lower()
+            torrent = torrents.get(torrent_hash)
+            if torrent is not None:
+                statuses[torrent_hash] = self._torrent_info(torrent_hash, torrent)
+
+        return statuses
+
+    async def sync(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Brings the local mirror of the client's torrents up to date.
 
-        return None
+        Only the torrent fields that changed since the previous
+        sync are sent by qBittorrent, identified by the response
+        ID (`rid`) of that sync. The mirror is kept as it was if
+        the request fails.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            The fields of every torrent in the client, by lowercase hash.
+        """
+        async with self._sync_lock:
+            data = await self.request(
+                "get", "sync", "maindata", params={"rid": self._rid}
+            )
+            if not isinstance(data, dict) or "rid" not in data:
+                logger.warning("qBittorrent - Failed to sync torrent states")
+                return self._torrents
+
+            if data.get("full_update"):
+                self._torrents = {}
+
+            for torrent_hash, fields in data.get("torrents", {}).items():
+                self._torrents.setdefault(torrent_hash.lower(), {}).update(fields)
+
+            for torrent_hash in data.get("torrents_removed", ()):
+                self._torrents.pop(torrent_hash.lower(), None)
+
+            logger.debug(
+                f"qBittorrent - Synced torrent states, rid {self._rid} -> {data['rid']}"
+            )
+            self._rid = data["rid"]
+
+        return self._torrents
+
+    @staticmethod
+    def _torrent_info(torrent_hash: str, torrent: Dict[str, Any]) -> TorrentInfo:
+        state = torrent.get("state", "")
+
+        # Older versions of qBittorrent do not send the content path.
+        content_path = torrent.get("content_path")
+        if not content_path and "save_path" in torrent and "name" in torrent:
+            content_path = str(Path(torrent["save_path"], torrent["name"]))
+
+        return TorrentInfo(
+            torrent_hash,
+            state,
+            state in COMPLETED_STATES,
+            torrent.get("progress", 0.0),
+            torrent.get("ratio"),
+            Path(content_path) if content_path else None,
+        )
 
     async def delete_torrent(self, torrent_id: str, with_files: bool = True) -> None:
         payload = {
@@ -86,17 +155,12 @@ class qBittorrentClient(TorrentClient):
         await self.request("get", "torrents", "delete", params=payload)
 
     async def get_torrent_fp(self, torrent_id: str) -> Optional[Path]:
-        payload = {"hashes": torrent_id}
-
-        data = await self.request("get", "torrents", "info", params=payload)
-        if not data:
-            return None
-        data = data[0]
-
-        if data.get("hash") != torrent_id:
+        statuses = await self.get_torrents_status([torrent_id])
+        status = statuses.get(torrent_id.lower())
+        if status is None:
             return None
 
-        return Path(data["content_path"])
+        return status.content_path
 
     async def add_torrent(self, magnet_url: str) -> Optional[str]:
         payload = {"urls": magnet_url}
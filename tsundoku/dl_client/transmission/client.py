@@ -3,14 +3,46 @@ import base64
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Set
 
 import aiohttp
 
-from tsundoku.dl_client.abstract import TorrentClient
+from tsundoku.dl_client.abstract import TorrentClient, TorrentInfo
 
 logger = logging.getLogger("tsundoku")
 
+# Names of the values of a torrent's `status` field.
+STATUS_NAMES = (
+    "stopped",
+    "check pending",
+    "checking",
+    "download pending",
+    "downloading",
+    "seed pending",
+    "seeding",
+)
+
+# Fields needed to build a `TorrentInfo`.
+STATUS_FIELDS = [
+    "hashString",
+    "status",
+    "isFinished",
+    "percentDone",
+    "uploadRatio",
+    "downloadDir",
+    "name",
+    "files",
+]
+
+# Fields kept in the cached torrent table, `id` maps removed torrents back.
+DELTA_FIELDS = [field for field in STATUS_FIELDS if field != "files"] + ["id"]
+
+# Torrents active within this many seconds are "recently-active", the
+# tracked torrents are requested by hash if the cached table was last
+# updated longer ago than that.
+RECENTLY_ACTIVE_SECONDS = 60
+
 
 class TransmissionClient(TorrentClient):
     def __init__(self, session: aiohttp.ClientSession, **kwargs: Any) -> None:
@@ -20,11 +52,21 @@ class TransmissionClient(TorrentClient):
         port: int = kwargs.pop("port")
         secure: bool = kwargs.pop("secure")
         auth: Dict[str, str] = kwargs.pop("auth", {})
+        # Whether statuses are read from a table updated with
+        # the recently active torrents, see `sync`.
+        self.delta_sync: bool = kwargs.pop("delta_sync", True)
 
         self.url = self.build_api_url(host, port, secure)
 
         self.session_id: str = ""
 
+        self._torrents: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[int, str] = {}
+        # Hashes the table is up to date for, whether or not they exist.
+        self._checked: Set[str] = set()
+        self._synced_at: Optional[float] = None
+        self._sync_lock = asyncio.Lock()
+
         username = auth.get("username", "")
         password = auth.get("password", "")
         self.credentials = self.get_encoded_credentials(username, password)
@@ -80,8 +122,10 @@ class TransmissionClient(TorrentClient):
         if not len(root):
             return False
 
-        torrent = root[0]
+        return self._is_completed(root[0])
 
+    @staticmethod
+    def _is_completed(torrent: dict) -> bool:
         status = torrent["status"]
         finished = torrent["isFinished"]
         return (status == 0 and finished) or status in (5, 6)
@@ -104,11 +148,134 @@ class TransmissionClient(TorrentClient):
 
         return None
 
+    async def get_torrents_status(
+        self, torrent_ids: Sequence[str]
+    ) -> Dict[str, TorrentInfo]:
+        if self.delta_sync:
+            torrents = await self.sync(torrent_ids)
+            return {
+                torrent_hash: self._torrent_info(torrents[torrent_hash])
+                for torrent_hash in map(str.lower, torrent_ids)
+                if torrent_hash in torrents
+            }
+
+        resp = await self.request(
+            "torrent-get", {"ids": list(torrent_ids), "fields": STATUS_FIELDS}
+        )
+
+        if resp.get("result") != "success":
+            return {}
+
+        statuses = {}
+        for torrent in resp["arguments"]["torrents"]:
+            info = self._torrent_info(torrent)
+            statuses[info.hash] = info
+
+        return statuses
+
+    async def sync(self, torrent_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Brings the cached table of torrent states up to date.
+
+        Only the torrents active in the last `RECENTLY_ACTIVE_SECONDS`
+        are requested, along with the IDs of removed torrents. Newly
+        added torrents count as recently active, so a torrent the
+        table was already checked for and is missing does not exist.
+
+        The passed torrents are requested by hash instead on the first
+        sync, when the previous one is too old for recent activity to
+        cover every change since, and when the table was not checked
+        for some of them yet. The rest of the torrents in the client
+        are never requested, however long the sync interval is.
+
+        Parameters
+        ----------
+        torrent_ids: Iterable[str]
+            The hashes of the torrents whose states are needed.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            The fields of the known torrents, by lowercase hash.
+        """
+        wanted = {torrent_id.lower() for torrent_id in torrent_ids}
+
+        async with self._sync_lock:
+            now = time.monotonic()
+            stale = (
+                self._synced_at is None
+                or now - self._synced_at >= RECENTLY_ACTIVE_SECONDS
+            )
+
+            if stale:
+                self._torrents = {}
+                self._hashes = {}
+                self._checked = set()
+                synced = True
+            else:
+                synced = await self._update_table(
+                    {"ids": "recently-active", "fields": DELTA_FIELDS}
+                )
+
+            missing = wanted - self._checked
+            if synced and missing:
+                synced = await self._update_table(
+                    {"ids": sorted(missing), "fields": DELTA_FIELDS}, missing
+                )
+
+            # A failed update leaves the table stale.
+            self._synced_at = now if synced else None
+
+        return self._torrents
+
+    async def _update_table(
+        self, arguments: dict, requested: Iterable[str] = ()
+    ) -> bool:
+        resp = await self.request("torrent-get", arguments)
+        if resp.get("result") != "success":
+            logger.warning("Transmission - Failed to sync torrent states")
+            return False
+
+        # Requested torrents that were not sent do not exist.
+        self._checked.update(requested)
+
+        root = resp["arguments"]
+        for torrent in root.get("torrents", []):
+            torrent_hash = torrent["hashString"].lower()
+            self._torrents[torrent_hash] = torrent
+            self._hashes[torrent["id"]] = torrent_hash
+            self._checked.add(torrent_hash)
+
+        for torrent_id in root.get("removed", []):
+            torrent_hash = self._hashes.pop(torrent_id, None)
+            if torrent_hash is not None:
+                self._torrents.pop(torrent_hash, None)
+
+        return True
+
+    def _torrent_info(self, torrent: Dict[str, Any]) -> TorrentInfo:
+        status = torrent["status"]
+        files = torrent.get("files")
+        return TorrentInfo(
+            torrent["hashString"].lower(),
+            STATUS_NAMES[status] if 0 <= status < len(STATUS_NAMES) else "",
+            self._is_completed(torrent),
+            torrent.get("percentDone", 0.0),
+            torrent.get("uploadRatio"),
+            Path(torrent["downloadDir"]) / torrent["name"],
+            None if files is None else [file["name"] for file in files],
+        )
+
     async def delete_torrent(self, torrent_id: str, with_files: bool) -> None:
-        await self.request(
+        resp = await self.request(
             "torrent-remove", {"ids": [torrent_id], "delete-local-data": with_files}
         )
 
+        if resp.get("result") == "success":
+            torrent = self._torrents.pop(torrent_id.lower(), None)
+            if torrent is not None:
+                self._hashes.pop(torrent["id"], None)
+
     async def get_torrent_fp(self, torrent_id: str) -> Optional[Path]:
         resp = await self.request(
             "torrent-get", {"ids": [torrent_id], "fields": ["downloadDir", "name"]}
@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Mapping, Optional, TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
@@ -11,8 +12,14 @@ if TYPE_CHECKING:
 import aiofiles.os
 
 from tsundoku.config import FeedsConfig, GeneralConfig
+from tsundoku.constants import (
+    DOWNLOADER_MAX_CONCURRENT_MOVES,
+    DOWNLOADER_MAX_CONCURRENT_QUERIES,
+    DOWNLOADER_MAX_CONCURRENT_RENAMES,
+)
+from tsundoku.dl_client import TorrentInfo
 from tsundoku.manager import Entry, EntryState, Library
-from tsundoku.utils import ExprDict, move, parse_anime_title
+from tsundoku.utils import ExprDict, move, parse_many
 
 logger = logging.getLogger("tsundoku")
 
@@ -31,6 +38,10 @@ class Downloader:
 
     Finally, the item will be marked as complete in the
     `show_entry` table.
+
+    Entries are checked concurrently. Download client queries,
+    renames and moves are each limited to a few at a time, and
+    an entry that is still being checked is skipped.
     """
 
     app: TsundokuApp
@@ -44,6 +55,13 @@ class Downloader:
     def __init__(self, app_context: Any) -> None:
         self.app = app_context.app
 
+        self.query_semaphore = asyncio.Semaphore(DOWNLOADER_MAX_CONCURRENT_QUERIES)
+        self.rename_semaphore = asyncio.Semaphore(DOWNLOADER_MAX_CONCURRENT_RENAMES)
+        self.move_semaphore = asyncio.Semaphore(DOWNLOADER_MAX_CONCURRENT_MOVES)
+        # Entry ID -> lock held while the entry is checked, dropped once
+        # nothing holds it anymore.
+        self.entry_locks: WeakValueDictionary[int, asyncio.Lock] = WeakValueDictionary()
+
     async def update_config(self) -> None:
         """
         Updates the configuration for the task.
@@ -355,7 +373,7 @@ class Downloader:
 
         return None
 
-    def resolve_file(self, root: Path, episode: int) -> Optional[Path]:
+    async def resolve_file(self, root: Path, episode: int) -> Optional[Path]:
         """
         Searches a directory tree for a specific episode
         file.
@@ -378,16 +396,11 @@ class Downloader:
             return root
 
         root.resolve()
-        for subpath in root.rglob("*"):
-            try:
-                parsed = parse_anime_title(subpath.name)
-            except Exception:
-                logger.error(
-                    f"Anitopy - Could not parse `{subpath.name}`, skipping",
-                    exc_info=True,
-                )
-                continue  # TODO: maybe ask user on UI to match manually
-
+        subpaths = list(root.rglob("*"))
+        # Titles that could not be parsed are None, and skipped.
+        # TODO: maybe ask user on UI to match manually
+        results = await parse_many([subpath.name for subpath in subpaths])
+        for subpath, parsed in zip(subpaths, results):
             if parsed is None or "episode_number" not in parsed:
                 continue
 
@@ -403,7 +416,9 @@ class Downloader:
 
         return None
 
-    async def check_show_entry(self, entry: Entry) -> None:
+    async def check_show_entry(
+        self, entry: Entry, statuses: Optional[Mapping[str, TorrentInfo]] = None
+    ) -> None:
         """
         Checks a specific show entry for download completion.
         If an entry is completed, send it to renaming and moving.
@@ -412,25 +427,45 @@ class Downloader:
         ----------
         entry: Entry
             The object of the entry in the database.
+        statuses: Optional[Mapping[str, TorrentInfo]]
+            The status of the entries' torrents, by hash. Retrieved
+            from the download client for this entry if not passed.
         """
+        lock = self.entry_locks.get(entry.id)
+        if lock is None:
+            lock = self.entry_locks[entry.id] = asyncio.Lock()
+        elif lock.locked():
+            logger.debug(f"<e{entry.id}> is already being checked, skipping")
+            return
+
+        async with lock:
+            await self._check_show_entry(entry, statuses)
+
+    async def _check_show_entry(
+        self, entry: Entry, statuses: Optional[Mapping[str, TorrentInfo]]
+    ) -> None:
         logger.info(f"Checking Release Status - <e{entry.id}>")
 
         if entry.state == EntryState.failed:
             return
 
+        if statuses is None:
+            async with self.query_semaphore:
+                statuses = await self.app.dl_client.get_torrents_status(
+                    [entry.torrent_hash]
+                )
+        status = statuses.get((entry.torrent_hash or "").lower())
+
         # Sometimes the file path may exist on disk, but it isn't fully
         # downloaded by the torrent client at this point in time.
-        is_completed = await self.app.dl_client.check_torrent_completed(
-            entry.torrent_hash
-        )
-        if not is_completed:
+        if status is None or not status.completed:
             logger.info(f"<e{entry.id}> torrent state is not completed")
             return
 
         # Initial downloading check. This conditional branch is essentially
         # waiting for the downloaded file to appear in the file system.
         if entry.state == EntryState.downloading:
-            path = await self.app.dl_client.get_torrent_fp(entry.torrent_hash)
+            path = status.content_path
             if not path:
                 logger.error(
                     f"Entry <e{entry.id}> missing from download client, marking as failed."
@@ -451,7 +486,7 @@ class Downloader:
         # This ensures that the path is an actual file rather than
         # a directory. Sometimes with torrents the files can be in
         # folders. Batch releases are typically always in folders.
-        path = self.resolve_file(path, entry.episode)
+        path = await self.resolve_file(path, entry.episode)
         if path is None:
             return
 
@@ -468,9 +503,7 @@ class Downloader:
             logger.info(f"Release Marked as Downloaded - <e{entry.id}>")
 
         if entry.state == EntryState.downloaded:
-            seed_ratio = await self.app.dl_client.check_torrent_ratio(
-                entry.torrent_hash
-            )
+            seed_ratio = status.ratio
             if seed_ratio is None:
                 logger.error(f"<e{entry.id}> seed ratio could not be determined")
                 return
@@ -481,7 +514,8 @@ class Downloader:
                 return
 
             logger.info(f"Preparing to Rename Release - <e{entry.id}>")
-            renamed_path = await self.handle_rename(entry)
+            async with self.rename_semaphore:
+                renamed_path = await self.handle_rename(entry)
             if renamed_path is None:
                 await entry.set_state(EntryState.failed)
                 return
@@ -510,7 +544,8 @@ class Downloader:
 
         if entry.state == EntryState.renamed:
             logger.info(f"Preparing to Move Release - <e{entry.id}>")
-            moved_path = await self.handle_move(entry)
+            async with self.move_semaphore:
+                moved_path = await self.handle_move(entry)
             if moved_path is None:
                 await entry.set_state(EntryState.failed)
                 return
@@ -527,6 +562,9 @@ class Downloader:
         Queries the database for show entries marked as
         downloading, then passes them to a separate function
         to check for completion.
+
+        The entries are checked concurrently, an error
+        while checking one does not stop the others.
         """
         async with self.app.acquire_db() as con:
             entries = await con.fetchall(
@@ -549,6 +587,20 @@ class Downloader:
             """
             )
 
-        for entry in entries:
-            entry = Entry(self.app, entry)
-            await self.check_show_entry(entry)
+        entries = [Entry(self.app, entry) for entry in entries]
+        # Every torrent is looked up in one request to the download client.
+        async with self.query_semaphore:
+            statuses = await self.app.dl_client.get_torrents_status(
+                [entry.torrent_hash for entry in entries if entry.torrent_hash]
+            )
+
+        results = await asyncio.gather(
+            *(self.check_show_entry(entry, statuses) for entry in entries),
+            return_exceptions=True,
+        )
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error occurred while checking entry <e{entry.id}>, '{result}'",
+                    exc_info=result,
+                )
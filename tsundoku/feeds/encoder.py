@@ -178,17 +178,16 @@ class Encoder:
         entry_id:
             The entry to be encoded.
         """
-        async with self.app.acquire_db() as con:
-            await con.execute(
-                """
-                INSERT OR IGNORE INTO
-                    encode (
-                        entry_id
-                    )
-                VALUES (?);
-            """,
-                entry_id,
-            )
+        await self.app.write_db(
+            """
+            INSERT OR IGNORE INTO
+                encode (
+                    entry_id
+                )
+            VALUES (?);
+        """,
+            entry_id,
+        )
 
         if not self.__ffmpeg_procs:
             await self.process_next()
@@ -250,16 +249,15 @@ class Encoder:
                 )
 
             if not ret:
-                async with self.app.acquire_db() as con:
-                    await con.execute(
-                        """
-                        DELETE FROM
-                            encode
-                        WHERE
-                            entry_id = ?;
-                    """,
-                        entry_id,
-                    )
+                await self.app.write_db(
+                    """
+                    DELETE FROM
+                        encode
+                    WHERE
+                        entry_id = ?;
+                """,
+                    entry_id,
+                )
 
                 await self.process_next()
 
@@ -358,20 +356,19 @@ class Encoder:
             )
         else:
             self.__ffmpeg_procs[entry_id] = proc
-            async with self.app.acquire_db() as con:
-                await con.execute(
-                    """
-                    UPDATE
-                        encode
-                    SET
-                        initial_size = ?,
-                        started_at = CURRENT_TIMESTAMP
-                    WHERE
-                        entry_id = ?;
-                """,
-                    file_bytecount,
-                    entry_id,
-                )
+            await self.app.write_db(
+                """
+                UPDATE
+                    encode
+                SET
+                    initial_size = ?,
+                    started_at = CURRENT_TIMESTAMP
+                WHERE
+                    entry_id = ?;
+            """,
+                file_bytecount,
+                entry_id,
+            )
             return True
 
         return False
@@ -459,29 +456,29 @@ class Encoder:
                 entry_id,
             )
 
-            if entry_path is None:
-                logger.warning(
-                    f"Error when finalizing encode for entry <e{entry_id}>: file path is None"
-                )
-                return
+        if entry_path is None:
+            logger.warning(
+                f"Error when finalizing encode for entry <e{entry_id}>: file path is None"
+            )
+            return
 
-            original = Path(entry_path)
-            encoded = original.with_suffix(self.TEMP_SUFFIX)
+        original = Path(entry_path)
+        encoded = original.with_suffix(self.TEMP_SUFFIX)
 
-            encoded_size = os.path.getsize(encoded)
-            await con.execute(
-                """
-                UPDATE
-                    encode
-                SET
-                    ended_at = CURRENT_TIMESTAMP,
-                    final_size = ?
-                WHERE
-                    entry_id = ?;
-            """,
-                encoded_size,
-                entry_id,
-            )
+        encoded_size = os.path.getsize(encoded)
+        await self.app.write_db(
+            """
+            UPDATE
+                encode
+            SET
+                ended_at = CURRENT_TIMESTAMP,
+                final_size = ?
+            WHERE
+                entry_id = ?;
+        """,
+            encoded_size,
+            entry_id,
+        )
 
         # The torrent has to be removed from the download client
         # because the contents of the file will be completely
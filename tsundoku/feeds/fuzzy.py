@@ -8,18 +8,30 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 # help with: http://chairnerd.seatgeek.com/fuzzywuzzy-fuzzy-string-matching-in-python/
 
+from collections import defaultdict
 from difflib import SequenceMatcher
+import math
 from typing import (
+    Any,
     Callable,
     Collection,
+    Dict,
     Generator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
 
+# NumPy is a requirement, the fallback keeps matching
+# working where it cannot be installed.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 SortableCollection = Union[Collection[str], Sequence[str]]
 
 
@@ -57,3 +69,372 @@ def extract_one(
     except Exception:
         # iterator could return nothing
         return None
+
+
+Gram = Tuple[str, int]
+
+# Guards the bounds below against floating point error,
+# they only ever get looser by it.
+_EPSILON = 1e-9
+
+
+_EMPTY: Set[str] = set()
+
+
+def _grams(text: str) -> List[Gram]:
+    # Every occurrence of a character is its own gram, so that the
+    # number of grams two strings share is exactly the number of
+    # matching characters counted by `quick_ratio`.
+    seen: Dict[str, int] = defaultdict(int)
+    grams = []
+    for char in text:
+        grams.append((char, seen[char]))
+        seen[char] += 1
+
+    return grams
+
+
+def _min_ratio(score_cutoff: int) -> float:
+    # `quick_ratio` rounds, anything that rounds up to the cutoff counts.
+    return (score_cutoff - 0.5) / 100
+
+
+class NGramIndex:
+    """
+    An inverted index over a set of choices that finds the ones
+    able to reach a score cutoff against a query, so that only
+    those have to be scored with `quick_ratio`.
+
+    Grams are single character occurrences rather than trigrams:
+    `quick_ratio` compares character counts, and two strings can
+    share every character without sharing a single trigram, so a
+    trigram index would miss matches that `extract_one` finds.
+
+    Choices are posted by length as well as gram. A choice of a given
+    length can only reach the cutoff if it shares a minimum number of
+    grams with the query, so for each length allowed by the cutoff,
+    candidates have to share at least one of any `len(query) - minimum
+    + 1` query grams, the rarest of that length are used. The grams
+    two strings share are exactly the characters `quick_ratio` counts
+    as matching, so counting them for each candidate drops every
+    choice that cannot reach the cutoff, and the number of candidates
+    stays close to the number of matches however many choices there
+    are. The postings read to find and count candidates still grow
+    with the number of choices of a similar length, so lookups are
+    not sub-linear in time, only in the choices that get scored.
+    """
+
+    def __init__(self) -> None:
+        # (character, occurrence, length of the choice) -> choices
+        self._postings: Dict[Tuple[str, int, int], Set[str]] = defaultdict(set)
+        # length -> number of choices of that length
+        self._lengths: Dict[int, int] = defaultdict(int)
+        self._matchers: Dict[str, SequenceMatcher] = {}
+        self._order: Dict[str, Any] = {}
+        self._counter = 0
+        # Built on the first batch lookup after the choices change.
+        self._counts: Optional[_CharCounts] = None
+
+    def __len__(self) -> int:
+        return len(self._matchers)
+
+    def __contains__(self, choice: object) -> bool:
+        return choice in self._matchers
+
+    def add(self, choice: str, order: Any = None) -> None:
+        """
+        Adds a choice to the index.
+
+        Parameters
+        ----------
+        choice: str
+            The choice to add.
+        order: Any
+            Sort key that decides between choices with the same score,
+            defaults to the order the choices were added in.
+        """
+        if order is None:
+            order = self._counter
+        self._counter += 1
+
+        self._order[choice] = order
+        self._counts = None
+        if choice in self._matchers:
+            return
+
+        matcher = SequenceMatcher(None, "", choice)
+        # Computes the character counts of the choice
+        # now instead of on every comparison.
+        matcher.quick_ratio()
+        self._matchers[choice] = matcher
+
+        length = len(choice)
+        self._lengths[length] += 1
+        for char, occurrence in _grams(choice):
+            self._postings[(char, occurrence, length)].add(choice)
+
+    def remove(self, choice: str) -> None:
+        """
+        Removes a choice from the index.
+
+        Parameters
+        ----------
+        choice: str
+            The choice to remove.
+        """
+        if self._matchers.pop(choice, None) is None:
+            return
+
+        del self._order[choice]
+        self._counts = None
+
+        length = len(choice)
+        self._lengths[length] -= 1
+        if not self._lengths[length]:
+            del self._lengths[length]
+
+        for char, occurrence in _grams(choice):
+            key = (char, occurrence, length)
+            postings = self._postings[key]
+            postings.discard(choice)
+            if not postings:
+                del self._postings[key]
+
+    def candidates(self, query: str, score_cutoff: int) -> Set[str]:
+        """
+        Returns the choices that might score at least
+        `score_cutoff` against the query.
+
+        Every choice that does is guaranteed to be included.
+
+        Parameters
+        ----------
+        query: str
+            The query.
+        score_cutoff: int
+            The minimum score, from 0 to 100.
+
+        Returns
+        -------
+        Set[str]
+            The candidate choices.
+        """
+        ratio = _min_ratio(score_cutoff)
+        if ratio <= 0 or not query:
+            return set(self._matchers)
+
+        query_length = len(query)
+
+        # 2 * min(a, b) / (a + b) is an upper bound of the ratio,
+        # which limits how much shorter or longer a choice can be.
+        min_length = math.ceil(query_length * ratio / (2 - ratio) - _EPSILON)
+        max_length = math.floor(query_length * (2 - ratio) / ratio + _EPSILON)
+
+        grams = _grams(query)
+        found: Set[str] = set()
+        for length in self._lengths:
+            if not min_length <= length <= max_length:
+                continue
+
+            # The fewest grams a choice of this length must share with the query.
+            required = math.ceil(ratio * (query_length + length) / 2 - _EPSILON)
+            prefix = query_length - max(required, 1) + 1
+            if prefix <= 0:
+                continue
+
+            postings = sorted(
+                (
+                    self._postings.get((char, occurrence, length), _EMPTY)
+                    for char, occurrence in grams
+                ),
+                key=len,
+            )
+
+            for choice in set().union(*postings[:prefix]):
+                shared = sum(choice in posting for posting in postings)
+                if shared >= required:
+                    found.add(choice)
+
+        return found
+
+    def _score(self, query: str, choice: str) -> int:
+        matcher = self._matchers[choice]
+        matcher.set_seq1(query)
+        return int(round(100 * matcher.quick_ratio()))
+
+    def extract_one(
+        self, query: str, *, score_cutoff: int = 0
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Finds the best scoring choice for a query, giving the
+        same result as `extract_one` over every choice.
+
+        Parameters
+        ----------
+        query: str
+            The query.
+        score_cutoff: int
+            The minimum score, from 0 to 100.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The best choice and its score, None if no
+            choice reaches the cutoff.
+        """
+        order = self._order
+        candidates = sorted(self.candidates(query, score_cutoff), key=order.__getitem__)
+
+        best: Optional[Tuple[str, int]] = None
+        for choice in candidates:
+            score = self._score(query, choice)
+            if score >= score_cutoff and (best is None or score > best[1]):
+                best = (choice, score)
+
+        return best
+
+    def extract_many(
+        self, queries: Sequence[str], *, score_cutoff: int = 0
+    ) -> List[Optional[Tuple[str, int]]]:
+        """
+        Finds the best scoring choice for every query at once,
+        giving the same results as `extract_one` for each of them.
+
+        With NumPy installed, the ratios of every query and choice
+        pair are estimated from character count vectors in one go,
+        and only the choices that could be the best are scored.
+        Otherwise, every query is looked up in the index on its own.
+
+        Parameters
+        ----------
+        queries: Sequence[str]
+            The queries.
+        score_cutoff: int
+            The minimum score, from 0 to 100.
+
+        Returns
+        -------
+        List[Optional[Tuple[str, int]]]
+            The best choice and its score for each query, None
+            where no choice reaches the cutoff.
+        """
+        if np is None or not queries or not self._matchers:
+            return [self.extract_one(q, score_cutoff=score_cutoff) for q in queries]
+
+        if self._counts is None:
+            self._counts = _CharCounts(sorted(self._matchers, key=self._order.get))
+
+        found: List[Optional[Tuple[str, int]]] = []
+        for query, survivors in zip(
+            queries, self._counts.survivors(queries, score_cutoff)
+        ):
+            best: Optional[Tuple[str, int]] = None
+            for choice in survivors:
+                score = self._score(query, choice)
+                if score >= score_cutoff and (best is None or score > best[1]):
+                    best = (choice, score)
+
+            found.append(best)
+
+        return found
+
+
+# Largest number of counts compared at once by `_CharCounts`,
+# which bounds the memory used by a batch to a few dozen MB.
+_BATCH_SIZE = 1 << 22
+
+
+class _CharCounts:
+    """
+    The character counts of a list of choices as a NumPy matrix,
+    one row per choice and one column per character.
+
+    The matching characters counted by `quick_ratio` are the sum of
+    the element-wise minimum of two rows, so the ratio of every pair
+    can be computed in a few array operations. Floating point error
+    makes these estimates rather than exact scores, survivors are
+    rescored with `SequenceMatcher`.
+    """
+
+    def __init__(self, choices: List[str]) -> None:
+        self.choices = choices
+        self.columns: Dict[str, int] = {}
+        for choice in choices:
+            for char in choice:
+                self.columns.setdefault(char, len(self.columns))
+
+        self.counts = self._vectorize(choices)
+        self.lengths = np.array([len(c) for c in choices], dtype=np.float64)
+
+    def _vectorize(self, texts: Sequence[str]) -> Any:
+        counts = np.zeros((len(texts), max(len(self.columns), 1)), dtype=np.int32)
+        columns = self.columns
+        for row, text in enumerate(texts):
+            for char in text:
+                column = columns.get(char)
+                # Characters no choice contains never match.
+                if column is not None:
+                    counts[row, column] += 1
+
+        return counts
+
+    def survivors(
+        self, queries: Sequence[str], score_cutoff: int
+    ) -> Generator[List[str], None, None]:
+        """
+        Yields, for each query, the choices that might be its best
+        match and reach the cutoff, in the order of the choices.
+        """
+        min_score = max(score_cutoff - 0.5, 0)
+        choice_count, column_count = self.counts.shape
+        step = max(1, _BATCH_SIZE // (choice_count * column_count))
+
+        for start in range(0, len(queries), step):
+            batch = queries[start : start + step]
+            counts = self._vectorize(batch)
+            matches = np.minimum(counts[:, None, :], self.counts[None, :, :]).sum(
+                axis=2
+            )
+
+            lengths = np.array([len(q) for q in batch], dtype=np.float64)
+            totals = lengths[:, None] + self.lengths[None, :]
+            scores = np.where(
+                totals > 0, 100 * (2.0 * matches / np.maximum(totals, 1)), 100.0
+            )
+
+            # A choice sharing the best rounded score is within
+            # one point of the best estimate.
+            best = scores.max(axis=1)
+            bounds = np.maximum(best - 1, min_score) - _EPSILON * 100
+            for row, bound in enumerate(bounds):
+                yield [self.choices[i] for i in np.flatnonzero(scores[row] >= bound)]
+
+
+def extract_many(
+    queries: Sequence[str], choices: List[str], *, score_cutoff: int = 0
+) -> List[Optional[Tuple[str, int]]]:
+    """
+    Finds the best scoring choice for every query, giving the
+    same results as calling `extract_one` for each of them.
+
+    Parameters
+    ----------
+    queries: Sequence[str]
+        The queries.
+    choices: List[str]
+        The choices to match the queries against.
+    score_cutoff: int
+        The minimum score, from 0 to 100.
+
+    Returns
+    -------
+    List[Optional[Tuple[str, int]]]
+        The best choice and its score for each query, None
+        where no choice reaches the cutoff.
+    """
+    index = NGramIndex()
+    for order, choice in enumerate(choices):
+        if choice not in index:
+            index.add(choice, order)
+
+    return index.extract_many(queries, score_cutoff=score_cutoff)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+from tsundoku.feeds.fuzzy import NGramIndex
+
+logger = logging.getLogger("tsundoku")
+
+# app -> (shows revision, matcher)
+_matchers: WeakKeyDictionary[Any, Tuple[int, ShowMatcher]] = WeakKeyDictionary()
+
+
+class ShowMatcher:
+    """
+    Fuzzy matches release titles against every watched show.
+
+    Titles are kept in an `NGramIndex`, which is shared between
+    lookups and updated whenever `Show.changed` reports that the
+    `shows` table was modified. Matching gives the same results
+    as `fuzzy.extract_one` over the watched titles.
+    """
+
+    __slots__ = ("_index", "_shows")
+
+    def __init__(self, shows: Iterable[Tuple[int, str]] = ()) -> None:
+        self._index = NGramIndex()
+        self._shows: Dict[str, int] = {}
+        self.update(shows)
+
+    def __len__(self) -> int:
+        return len(self._shows)
+
+    def update(self, shows: Iterable[Tuple[int, str]]) -> None:
+        """
+        Replaces the matched shows, only indexing titles
+        that were not indexed already.
+
+        Parameters
+        ----------
+        shows: Iterable[Tuple[int, str]]
+            The ID and title of every watched show, by ascending ID.
+        """
+        shows_by_title: Dict[str, int] = {}
+        first_ids: Dict[str, int] = {}
+        for show_id, title in shows:
+            # Shows sharing a title resolve to the last one, but rank
+            # where the first one is, as they did in `extract_one`.
+            shows_by_title[title] = show_id
+            first_ids.setdefault(title, show_id)
+
+        for title in self._shows.keys() - shows_by_title.keys():
+            self._index.remove(title)
+
+        for title, first_id in first_ids.items():
+            self._index.add(title, first_id)
+
+        self._shows = shows_by_title
+
+    @classmethod
+    async def get(cls, app: TsundokuApp) -> ShowMatcher:
+        """
+        Returns the matcher for the app's current shows,
+        updating it if the shows changed since it was last used.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to match the shows of.
+
+        Returns
+        -------
+        ShowMatcher
+            The show matcher.
+        """
+        revision = app.flags.SHOWS_REVISION
+        cached = _matchers.get(app)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        async with app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    id,
+                    title,
+                    watch
+                FROM
+                    shows
+                ORDER BY
+                    id;
+            """
+            )
+
+        shows = [(row["id"], row["title"]) for row in rows if row["watch"]]
+        if cached is None:
+            matcher = cls(shows)
+        else:
+            matcher = cached[1]
+            matcher.update(shows)
+
+        # Tagged with the revision from before the query, so shows
+        # changed while it was running cause another update.
+        _matchers[app] = (revision, matcher)
+
+        logger.debug(f"Updated show matcher, {len(matcher)} shows")
+        return matcher
+
+    def match(self, name: str, score_cutoff: int = 0) -> Optional[Tuple[str, int, int]]:
+        """
+        Finds the watched show most similar to a name.
+
+        Parameters
+        ----------
+        name: str
+            The show name to match.
+        score_cutoff: int
+            The minimum match percent.
+
+        Returns
+        -------
+        Optional[Tuple[str, int, int]]
+            The matched title, its show ID, and the match
+            percent, None if no show reaches the cutoff.
+        """
+        found = self._index.extract_one(name, score_cutoff=score_cutoff)
+        if found is None:
+            return None
+
+        title, score = found
+        return title, self._shows[title], score
+
+    def match_many(
+        self, names: Sequence[str], score_cutoff: int = 0
+    ) -> List[Optional[Tuple[str, int, int]]]:
+        """
+        Finds the watched show most similar to each name
+        in a single pass over the watched titles.
+
+        Parameters
+        ----------
+        names: Sequence[str]
+            The show names to match.
+        score_cutoff: int
+            The minimum match percent.
+
+        Returns
+        -------
+        List[Optional[Tuple[str, int, int]]]
+            The matched title, its show ID, and the match percent
+            for each name, None where no show reaches the cutoff.
+        """
+        return [
+            None if found is None else (found[0], self._shows[found[0]], found[1])
+            for found in self._index.extract_many(names, score_cutoff=score_cutoff)
+        ]
@@ -2,27 +2,53 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from functools import partial, cmp_to_key
+from functools import partial
 import hashlib
 import logging
 import os
-from sqlite3 import Row
-from typing import Any, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
 
+import aiohttp
 import feedparser
 
 from tsundoku.config import FeedsConfig
-from tsundoku.feeds.fuzzy import extract_one
+from tsundoku.constants import (
+    POLLER_FEED_CHUNK_SIZE,
+    POLLER_FETCH_TIMEOUT,
+    POLLER_MAX_CONCURRENT_FETCHES,
+    POLLER_PIPELINE_ADD_WORKERS,
+    POLLER_PIPELINE_QUEUE_SIZE,
+    POLLER_PIPELINE_RESOLVE_WORKERS,
+)
+from tsundoku.feeds import fuzzy
+from tsundoku.feeds.matcher import ShowMatcher
+from tsundoku.feeds.schedule import published_at, SourceSchedule
+from tsundoku.feeds.stream import FeedStream
 from tsundoku.manager import SeenRelease
 from tsundoku.sources import get_all_sources, Source
 from tsundoku.utils import (
     compare_version_strings,
     normalize_resolution,
-    parse_anime_title,
+    parse_many,
+    parser_cache_stats,
+    ParserResult,
 )
 
 logger = logging.getLogger("tsundoku")
@@ -54,6 +80,28 @@ class FoundEntry(NamedTuple):
     episode: int
 
 
+class ParsedItem(NamedTuple):
+    item: dict
+    filename: str
+    parsed: ParserResult
+    episode: int
+
+
+class SelectedRelease(NamedTuple):
+    source: Source
+    item: dict
+    show_id: int
+    episode: int
+    version: str
+
+
+class FetchedFeed(NamedTuple):
+    status: int
+    body: AsyncIterator[bytes]
+    # Header names are lowercase, as feedparser expects them.
+    headers: Dict[str, str]
+
+
 @dataclass
 class SourceCache:
     """
@@ -74,6 +122,232 @@ class SourceCache:
     most_recent_hash: Optional[str] = None
 
 
+class ParsedEntries:
+    """
+    The latest version of every episode downloaded for
+    a set of shows, and those shows' release preferences.
+
+    Shows are loaded together the first time they are
+    matched during a poll, so checking the items of a
+    feed does not query the database for every item.
+    """
+
+    app: TsundokuApp
+
+    def __init__(self, app: TsundokuApp) -> None:
+        self.app = app
+
+        # (show_id, episode) -> (version, created_manually)
+        self.entries: Dict[Tuple[int, int], Tuple[str, bool]] = {}
+        # show_id -> (preferred_resolution, preferred_release_group)
+        self.preferences: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        self.loaded: Set[int] = set()
+
+    async def load(self, show_ids: Iterable[int]) -> None:
+        """
+        Loads the entries and preferences of every
+        show that has not been loaded already.
+
+        Parameters
+        ----------
+        show_ids: Iterable[int]
+            The IDs of the shows to load.
+        """
+        missing = sorted(set(show_ids) - self.loaded)
+        if not missing:
+            return
+
+        placeholders = ", ".join("?" * len(missing))
+        async with self.app.acquire_db() as con:
+            shows = await con.fetchall(
+                f"""
+                SELECT
+                    id,
+                    preferred_resolution,
+                    preferred_release_group
+                FROM
+                    shows
+                WHERE
+                    id IN ({placeholders});
+            """,
+                *missing,
+            )
+            entries = await con.fetchall(
+                f"""
+                SELECT
+                    show_id,
+                    episode,
+                    version,
+                    created_manually
+                FROM
+                    show_entry
+                WHERE
+                    show_id IN ({placeholders});
+            """,
+                *missing,
+            )
+
+        self.loaded.update(missing)
+        for row in shows:
+            self.preferences[row["id"]] = (
+                row["preferred_resolution"],
+                row["preferred_release_group"],
+            )
+
+        for row in entries:
+            self.add(
+                row["show_id"],
+                row["episode"],
+                row["version"],
+                bool(row["created_manually"]),
+            )
+
+    def add(
+        self, show_id: int, episode: int, version: str, created_manually: bool = False
+    ) -> None:
+        """
+        Records an entry, keeping only the
+        highest version of every episode.
+
+        Parameters
+        ----------
+        show_id: int
+            The ID of the entry's show.
+        episode: int
+            The entry's episode.
+        version: str
+            The release version of the entry.
+        created_manually: bool
+            Whether the entry was added by a user.
+        """
+        key = (show_id, episode)
+        existing = self.entries.get(key)
+        if existing is None or compare_version_strings(version, existing[0]) > 0:
+            self.entries[key] = (version, created_manually)
+
+    def is_parsed(self, show_id: int, episode: int, version: str) -> bool:
+        """
+        Checks if a version of an episode, or a newer one,
+        was already downloaded. Episodes added by a user are
+        never downloaded again.
+
+        Parameters
+        ----------
+        show_id: int
+            The ID of the show to check.
+        episode: int
+            The episode to check.
+        version: str
+            The release version of the episode.
+
+        Returns
+        -------
+        bool
+            True if the episode has been parsed, False otherwise.
+        """
+        existing = self.entries.get((show_id, episode))
+        if existing is None:
+            return False
+
+        return existing[1] or compare_version_strings(existing[0], version) >= 0
+
+
+class ReleasePipeline:
+    """
+    Downloads the releases selected during a poll
+    while the poller keeps matching the next items.
+
+    Releases go through two stages connected by bounded queues,
+    `POLLER_PIPELINE_RESOLVE_WORKERS` tasks resolve their torrents to
+    magnet URLs and `POLLER_PIPELINE_ADD_WORKERS` tasks add those to
+    the download client. Putting a release waits while the queues
+    are full. Leaving the context waits for every release put.
+
+    Attributes
+    ----------
+    found: List[FoundEntry]
+        The releases that began processing, in
+        the order they were added to the client.
+    """
+
+    def __init__(self, poller: Poller) -> None:
+        self.poller = poller
+        self.found: List[FoundEntry] = []
+
+        self._resolve_queue: asyncio.Queue[Optional[SelectedRelease]] = asyncio.Queue(
+            POLLER_PIPELINE_QUEUE_SIZE
+        )
+        self._add_queue: asyncio.Queue[
+            Optional[Tuple[SelectedRelease, str]]
+        ] = asyncio.Queue(POLLER_PIPELINE_QUEUE_SIZE)
+        self._resolvers: List[asyncio.Task] = []
+        self._adders: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> ReleasePipeline:
+        self._resolvers = [
+            asyncio.create_task(self._resolve())
+            for _ in range(POLLER_PIPELINE_RESOLVE_WORKERS)
+        ]
+        self._adders = [
+            asyncio.create_task(self._add()) for _ in range(POLLER_PIPELINE_ADD_WORKERS)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type: Any, *_: Any) -> None:
+        if exc_type is not None:
+            for task in self._resolvers + self._adders:
+                task.cancel()
+            await asyncio.gather(
+                *self._resolvers, *self._adders, return_exceptions=True
+            )
+            return
+
+        # Each worker stops at the first None it takes.
+        for _ in self._resolvers:
+            await self._resolve_queue.put(None)
+        await asyncio.gather(*self._resolvers)
+
+        for _ in self._adders:
+            await self._add_queue.put(None)
+        await asyncio.gather(*self._adders)
+
+    async def put(self, release: SelectedRelease) -> None:
+        """
+        Queues a release for downloading.
+
+        Parameters
+        ----------
+        release: SelectedRelease
+            The release to download.
+        """
+        await self._resolve_queue.put(release)
+
+    async def _resolve(self) -> None:
+        while (release := await self._resolve_queue.get()) is not None:
+            source = release.source
+            try:
+                magnet_url = await self.poller.get_torrent_link(source, release.item)
+            except Exception:
+                logger.exception(
+                    f"`{source.name}@{source.version}` - poller failed to resolve torrent for '{release.item!r}'",
+                    exc_info=True,
+                )
+                continue
+
+            await self._add_queue.put((release, magnet_url))
+
+    async def _add(self) -> None:
+        while (job := await self._add_queue.get()) is not None:
+            release, magnet_url = job
+            try:
+                self.found.append(await self.poller.add_release(release, magnet_url))
+            except Exception:
+                logger.exception(
+                    f"`{release.source.name}@{release.source.version}` - poller failed to add '{release.item!r}'",
+                    exc_info=True,
+                )
+
+
 class Poller:
     """
     The polling manager handles all RSS feed related
@@ -82,6 +356,8 @@ class Poller:
     Once started, the manager will iterate through every
     enabled RSS feed source and parse their respective
     feeds using custom logic defined in each source.
+    Each source is polled on its own schedule, learned
+    from how often new items appear in its feed.
 
     Items that are matched with the `shows` database will
     be then passed onto the download manager for downloading,
@@ -89,13 +365,21 @@ class Poller:
     """
 
     app: TsundokuApp
-    source_cache: Dict[str, SourceCache]
+    source_cache: Dict[Tuple[str, str], SourceCache]
+    schedules: Dict[Tuple[str, str], SourceSchedule]
 
     def __init__(self, app_context: Any) -> None:
         self.app = app_context.app
         self.loop = asyncio.get_running_loop()
 
         self.source_cache = defaultdict(SourceCache)
+        # Restored by the first poll, as the database
+        # may not be set up yet when the poller is created.
+        self.source_cache_loaded = False
+        self.fetch_semaphore = asyncio.Semaphore(POLLER_MAX_CONCURRENT_FETCHES)
+        # Replaced at the start of every poll.
+        self.parsed_entries = ParsedEntries(self.app)
+        self.schedules = {}
 
     async def update_config(self) -> None:
         """
@@ -103,14 +387,22 @@ class Poller:
         """
         cfg = await FeedsConfig.retrieve(self.app)
         self.interval = cfg.polling_interval
+        self.min_interval = cfg.min_polling_interval
+        self.max_interval = cfg.max_polling_interval
         self.fuzzy_match_cutoff = cfg.fuzzy_cutoff
 
     async def start(self) -> None:
         """
-        The program will poll every n seconds, as specified
-        in the configuration file.
+        The program will poll every source once it is due,
+        sleeping until the next source is due in between.
         """
         logger.debug("Poller task started.")
+        if fuzzy.np is None:
+            logger.warning(
+                "NumPy is not installed, feed items will be matched one at a time"
+            )
+        else:
+            logger.info("Matching feed items in batches with NumPy")
 
         if os.getenv("DISABLE_POLL_ON_START"):
             await self.update_config()
@@ -120,26 +412,59 @@ class Poller:
             await asyncio.sleep(self.interval)
 
         while True:
-            await self.update_config()
-
             try:
-                await self.poll()
+                await self.poll(due_only=True)
             except Exception:
                 logger.error(
                     "An error occurred while polling RSS sources.", exc_info=True
                 )
 
-            try:
-                await SeenRelease.delete_old(self.app, days=30)
-            except Exception:
-                logger.error(
-                    "An error occurred while deleting old seen releases.", exc_info=True
-                )
+            delay = self.seconds_until_next_poll()
+            logger.info(f"Sleeping {delay} seconds before polling RSS sources again...")
+            await asyncio.sleep(delay)
 
-            logger.info(
-                f"Sleeping {self.interval} seconds before polling RSS sources again..."
-            )
-            await asyncio.sleep(self.interval)
+    def get_schedule(self, source: Source) -> SourceSchedule:
+        """
+        Returns the polling schedule of a source,
+        sources that were never polled are due right away.
+
+        Parameters
+        ----------
+        source: Source
+            The source to get the schedule of.
+
+        Returns
+        -------
+        SourceSchedule
+            The source's schedule.
+        """
+        key = (source.name, source.version)
+        schedule = self.schedules.get(key)
+        if schedule is None:
+            interval = max(self.min_interval, min(self.max_interval, self.interval))
+            schedule = self.schedules[key] = SourceSchedule(interval)
+
+        return schedule
+
+    def seconds_until_next_poll(self) -> int:
+        """
+        Returns how long to sleep before the next source is due.
+
+        Sleeps are never longer than the configured polling
+        interval, so that newly installed sources and
+        configuration changes are picked up in time.
+
+        Returns
+        -------
+        int
+            The number of seconds to sleep for.
+        """
+        delay = self.interval
+        if self.schedules:
+            next_poll_at = min(s.next_poll_at for s in self.schedules.values())
+            delay = min(delay, next_poll_at - time.time())
+
+        return max(1, round(delay))
 
     def reset_rss_cache(self) -> None:
         """
@@ -148,8 +473,76 @@ class Poller:
         feed.
         """
         self.source_cache.clear()
+        # Nothing should be restored from the database either,
+        # saved entries are overwritten after the next fetch.
+        self.source_cache_loaded = True
 
-    async def poll(self, force: bool = False) -> List[FoundEntry]:
+    async def load_source_cache(self) -> None:
+        """
+        Restores the ETag, Last-Modified, and most recent
+        item hash of every source from the database.
+        """
+        async with self.app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    name,
+                    version,
+                    last_etag,
+                    last_modified,
+                    most_recent_hash
+                FROM
+                    source_cache;
+            """
+            )
+
+        for row in rows:
+            self.source_cache[(row["name"], row["version"])] = SourceCache(
+                row["last_etag"], row["last_modified"], row["most_recent_hash"]
+            )
+
+        self.source_cache_loaded = True
+        logger.debug(f"Loaded RSS cache for {len(rows)} sources")
+
+    async def save_source_cache(self, source: Source) -> None:
+        """
+        Saves the cache of a source to the database
+        so that it survives restarts.
+
+        Parameters
+        ----------
+        source: Source
+            The source to save the cache of.
+        """
+        cache = self.source_cache[(source.name, source.version)]
+        await self.app.write_db(
+            """
+            INSERT INTO
+                source_cache (
+                    name,
+                    version,
+                    last_etag,
+                    last_modified,
+                    most_recent_hash
+                )
+            VALUES
+                (?, ?, ?, ?, ?)
+            ON CONFLICT (name, version) DO UPDATE SET
+                last_etag = excluded.last_etag,
+                last_modified = excluded.last_modified,
+                most_recent_hash = excluded.most_recent_hash,
+                updated_at = CURRENT_TIMESTAMP;
+        """,
+            source.name,
+            source.version,
+            cache.last_etag,
+            cache.last_modified,
+            cache.most_recent_hash,
+        )
+
+    async def poll(
+        self, force: bool = False, due_only: bool = False
+    ) -> List[FoundEntry]:
         """
         Iterates through every installed RSS source
         and will check for new items to download.
@@ -161,6 +554,8 @@ class Poller:
         ----------
         force: bool
             If True, will force a re-fetch of the RSS feed
+        due_only: bool
+            If True, only sources whose schedule is due are polled.
 
         Returns
         -------
@@ -170,13 +565,56 @@ class Poller:
         """
         logger.info(f"Checking for New Releases... [force: {force}]")
 
+        # Interval bounds may have changed since the last poll.
+        await self.update_config()
+
         if force:
             self.reset_rss_cache()
+        elif not self.source_cache_loaded:
+            await self.load_source_cache()
 
+        self.parsed_entries = ParsedEntries(self.app)
         found = []
 
-        async for source in get_all_sources():
-            items = await self.get_items_from_source(source)
+        async def fetch(source: Source) -> Tuple[Source, List[dict]]:
+            schedule = self.get_schedule(source)
+            try:
+                items = await self.get_items_from_source(source)
+            except Exception:
+                logger.error(
+                    f"`{source.name}@{source.version}` - Failed to retrieve RSS items",
+                    exc_info=True,
+                )
+                schedule.postpone(time.time())
+                return source, []
+
+            schedule.update(
+                [published_at(item) for item in items],
+                time.time(),
+                (self.min_interval, self.max_interval),
+            )
+            logger.debug(
+                f"`{source.name}@{source.version}` - Next poll in {round(schedule.interval)} seconds"
+            )
+            return source, items
+
+        installed = [source async for source in get_all_sources()]
+        # Schedules of removed sources would otherwise always be due.
+        for key in self.schedules.keys() - {(s.name, s.version) for s in installed}:
+            del self.schedules[key]
+
+        now = time.time()
+        sources = [
+            source
+            for source in installed
+            if not due_only or self.get_schedule(source).is_due(now)
+        ]
+
+        # Every source is downloaded at once, the items of each one are
+        # checked as soon as it arrives so that a slow source only delays itself.
+        fetches = [fetch(source) for source in sources]
+        for fetched in asyncio.as_completed(fetches):
+            source, items = await fetched
             if not items:
                 continue
 
@@ -191,6 +629,11 @@ class Poller:
 
         logger.info(f"Checked for New Releases, total of {len(found)} items found")
 
+        cache = parser_cache_stats()
+        logger.debug(
+            f"Title parser cache [hits={cache['hits']}, misses={cache['misses']}, size={cache['size']}]"
+        )
+
         # This still returns information, despite not being used in this particular
         # task, because the REST API hooks into the running Poller task and will call
         # this. See: tsundoku/blueprints/api/routes.py#check_for_releases
@@ -198,14 +641,16 @@ class Poller:
 
     async def check_feed(self, source: Source, items: List[dict]) -> List[FoundEntry]:
         """
-        Iterates through the list of items in an
-        RSS feed and will individually check each
-        item. Returns a list of tuples in the format
-        (show_id, episode).
+        Checks every item in an RSS feed, matching
+        all of their titles against the watched shows
+        in a single pass. Returns a list of tuples in
+        the format (show_id, episode).
 
         Parameters
         ----------
-        feed: dict
+        source: Source
+            The source the feed is from.
+        items: List[dict]
             The RSS feed items.
 
         Returns
@@ -214,21 +659,115 @@ class Poller:
             A list of tuples in the format (show_id, episode).
             These are newly found entries that have begun processing.
         """
-        found_items = []
-
+        named_items = []
         for item in items:
             try:
-                found = await self.check_item(source, item)
+                named_items.append((item, source.get_filename(item)))
+            except Exception:
+                logger.exception(
+                    f"`{source.name}@{source.version}` - poller failed to check item '{item!r}'",
+                    exc_info=True,
+                )
+
+        # Filenames matching the source's template skip anitopy. Large
+        # feeds are parsed in other processes, freeing the event loop.
+        results = [source.parse_filename(filename) for _, filename in named_items]
+        parsed_many = iter(
+            await parse_many(
+                [
+                    filename
+                    for (_, filename), parsed in zip(named_items, results)
+                    if parsed is None
+                ]
+            )
+        )
+        results = [
+            parsed if parsed is not None else next(parsed_many) for parsed in results
+        ]
 
-                if found:
-                    found_items.append(found)
+        parsed_items = []
+        for (item, filename), parsed in zip(named_items, results):
+            try:
+                parsed_item = self.parse_item(source, item, filename, parsed)
             except Exception:
                 logger.exception(
                     f"`{source.name}@{source.version}` - poller failed to check item '{item!r}'",
                     exc_info=True,
                 )
+                continue
+
+            if parsed_item:
+                parsed_items.append(parsed_item)
+
+        if not parsed_items:
+            return []
+
+        matcher = await ShowMatcher.get(self.app)
+        matches = matcher.match_many(
+            [parsed_item.parsed["anime_title"] for parsed_item in parsed_items],
+            self.fuzzy_match_cutoff,
+        )
 
-        return found_items
+        await self.parsed_entries.load(match[1] for match in matches if match)
+
+        unmatched: List[Tuple[ParserResult, str]] = []
+        # Torrents of earlier releases are resolved and
+        # added while the later items are being checked.
+        async with ReleasePipeline(self) as pipeline:
+            for parsed_item, match in zip(parsed_items, matches):
+                entry_match = None
+                if match:
+                    entry_match = EntryMatch(
+                        parsed_item.parsed["anime_title"], match[1], match[2]
+                    )
+
+                try:
+                    release = await self.select_release(
+                        source, parsed_item, entry_match, unmatched
+                    )
+                except Exception:
+                    logger.exception(
+                        f"`{source.name}@{source.version}` - poller failed to check item '{parsed_item.item!r}'",
+                        exc_info=True,
+                    )
+                    continue
+
+                if release is not None:
+                    await pipeline.put(release)
+
+        await self.add_seen_releases(source, unmatched)
+
+        return pipeline.found
+
+    async def add_seen_releases(
+        self, source: Source, unmatched: List[Tuple[ParserResult, str]]
+    ) -> None:
+        """
+        Remembers the releases of a source that
+        did not match any show, all at once.
+
+        Parameters
+        ----------
+        source: Source
+            The source the releases are from.
+        unmatched: List[Tuple[ParserResult, str]]
+            The parsed filename and torrent of each release.
+        """
+        if not unmatched:
+            return
+
+        try:
+            added = await SeenRelease.add_many(self.app, unmatched)
+        except Exception:
+            logger.exception(
+                f"`{source.name}@{source.version}` - poller failed to add {len(unmatched)} seen releases",
+                exc_info=True,
+            )
+            return
+
+        logger.debug(
+            f"`{source.name}@{source.version}` - Added {len(added)} seen releases"
+        )
 
     async def is_parsed(self, show_id: int, episode: int, version: str) -> bool:
         """
@@ -249,117 +788,45 @@ class Poller:
         bool
             True if the episode has been parsed, False otherwise.
         """
-        async with self.app.acquire_db() as con:
-            entries = await con.fetchall(
-                """
-                SELECT
-                    id,
-                    version,
-                    created_manually
-                FROM
-                    show_entry
-                WHERE show_id=? AND episode=?;
-            """,
-                show_id,
-                episode,
-            )
-
-        if not entries:
-            return False
-
-        def compare(first: Row, second: Row) -> int:
-            return compare_version_strings(first["version"], second["version"])
-
-        entries = sorted(entries, key=cmp_to_key(compare), reverse=True)
-
-        return (
-            entries[0]["created_manually"]
-            or compare_version_strings(entries[0]["version"], version) >= 0
-        )
-
-    async def check_item_for_match(self, show_name: str) -> Optional[EntryMatch]:
+        await self.parsed_entries.load((show_id,))
+        return self.parsed_entries.is_parsed(show_id, episode, version)
+
+    def parse_item(
+        self,
+        source: Source,
+        item: dict,
+        filename: str,
+        parsed: Optional[ParserResult],
+    ) -> Optional[ParsedItem]:
         """
-        Takes a show name from RSS and an episode from RSS and
-        checks if the object should be downloaded.
-
-        An item should be downloaded only if it is in the
-        `shows` table.
-
-        Parameters
-        ----------
-        show_name: str
-            The name of the show from RSS.
-
-        Returns
-        -------
-        Optional[EntryMatch]
-            The EntryMatch for the passed show name.
-            Could be None if no shows are desired.
-        """
-        async with self.app.acquire_db() as con:
-            desired_shows = await con.fetchall(
-                """
-                SELECT
-                    id,
-                    title,
-                    watch,
-                    preferred_resolution,
-                    preferred_release_group
-                FROM
-                    shows;
-            """
-            )
-        show_list = {
-            show["title"]: show["id"] for show in desired_shows if show["watch"]
-        }
-
-        if not show_list:
-            return None
-
-        # Extracts a tuple in the format (matched_str, percent_match)
-        match = extract_one(show_name, list(show_list.keys()))
-
-        if match:
-            return EntryMatch(show_name, show_list[match[0]], match[1])
-
-        return None
-
-    async def check_item(self, source: Source, item: dict) -> Optional[FoundEntry]:
-        """
-        Checks an item to see if it is from a
-        desired show entry, and will then begin
-        downloading the item if so.
+        Checks the parsed filename of an item, ignoring
+        it if it is not a single episode release.
 
         Parameters
         ----------
+        source: Source
+            The source the item is from.
         item: dict
-            The item to check for matches.
+            The item.
+        filename: str
+            The item's filename.
+        parsed: Optional[ParserResult]
+            The parsed filename, None if it could not be parsed.
 
         Returns
         -------
-        Optional[FoundEntry]
-            A tuple with (show_id, episode)
+        Optional[ParsedItem]
+            The parsed item, None if it should be ignored.
         """
-        filename = source.get_filename(item)
-
-        try:
-            parsed = parse_anime_title(filename)
-        except Exception:
-            logger.exception(
-                f"`{source.name}@{source.version}` - anitopy failed to parse '{filename}'",
-                exc_info=True,
-            )
-            return None
-
         if parsed is None:
             logger.warning(
                 f"`{source.name}@{source.version}` - anitopy failed to parse '{filename}'"
             )
             return None
 
-        if isinstance(parsed.get("release_information", []), list):
+        if isinstance(parsed.get("release_information", ()), tuple):
             release_info = [
-                info.lower() for info in parsed.get("release_information", [])
+                info.lower() for info in parsed.get("release_information", ())
             ]
         else:
             release_info = [parsed.get("release_information", "").lower()]
@@ -380,7 +847,7 @@ class Poller:
         #         f"`{source.name}@{source.version}` - Ignoring non-episode '{filename}'"
         #     )
         #     return None
-        elif "batch" in release_info or isinstance(parsed["episode_number"], list):
+        elif "batch" in release_info or isinstance(parsed["episode_number"], tuple):
             logger.info(
                 f"`{source.name}@{source.version}` - Ignoring batch release '{filename}'"
             )
@@ -391,11 +858,48 @@ class Poller:
             )
             return None
 
-        show_episode = int(parsed["episode_number"])
-        match = await self.check_item_for_match(parsed["anime_title"])
+        return ParsedItem(item, filename, parsed, int(parsed["episode_number"]))
+
+    async def select_release(
+        self,
+        source: Source,
+        parsed_item: ParsedItem,
+        match: Optional[EntryMatch],
+        unmatched: List[Tuple[ParserResult, str]],
+    ) -> Optional[SelectedRelease]:
+        """
+        Checks whether a parsed item should be downloaded,
+        it has to match a watched show, not be parsed yet,
+        and fit the show's release preferences.
+
+        Selected releases count as parsed for the rest of the
+        poll, so that later items of the same episode are
+        skipped before the first one is added to the client.
+        Items that did not match are added to `unmatched`,
+        to be remembered as seen releases.
+
+        Parameters
+        ----------
+        source: Source
+            The source the item is from.
+        parsed_item: ParsedItem
+            The parsed item.
+        match: Optional[EntryMatch]
+            The show the item's title matched with.
+        unmatched: List[Tuple[ParserResult, str]]
+            The parsed filename and torrent of the
+            unmatched items.
+
+        Returns
+        -------
+        Optional[SelectedRelease]
+            The release to download, None if
+            the item should not be downloaded.
+        """
+        item, filename, parsed, show_episode = parsed_item
 
         if match is None or match.match_percent < self.fuzzy_match_cutoff:
-            await SeenRelease.add(self.app, parsed, source.get_torrent(item))
+            unmatched.append((parsed, source.get_torrent(item)))
             return None
 
         release_version = parsed.get("release_version", "v0")
@@ -405,22 +909,14 @@ class Poller:
         if await self.is_parsed(match.matched_id, show_episode, release_version):
             return None
 
-        async with self.app.acquire_db() as con:
-            preferences = await con.fetchone(
-                """
-                SELECT
-                    preferred_resolution,
-                    preferred_release_group
-                FROM
-                    shows
-                WHERE
-                    id=?;
-            """,
-                match.matched_id,
+        preferences = self.parsed_entries.preferences.get(match.matched_id)
+        if preferences is None:
+            logger.warning(
+                f"`{source.name}@{source.version}` - Ignoring release for '{filename}', show <s{match.matched_id}> no longer exists"
             )
+            return None
 
-        preferred_resolution = preferences["preferred_resolution"]
-        preferred_release_group = preferences["preferred_release_group"]
+        preferred_resolution, preferred_release_group = preferences
 
         resolution = normalize_resolution(parsed.get("video_resolution", ""))
         release_group = parsed.get("release_group")
@@ -442,12 +938,36 @@ class Poller:
             f"`{source.name}@{source.version}` - Release Found for <s{match.matched_id}>, episode {show_episode}{release_version}"
         )
 
-        magnet_url = await self.get_torrent_link(source, item)
+        # Later items of the poll are checked against this release.
+        self.parsed_entries.add(match.matched_id, show_episode, release_version)
+
+        return SelectedRelease(
+            source, item, match.matched_id, show_episode, release_version
+        )
+
+    async def add_release(
+        self, release: SelectedRelease, magnet_url: str
+    ) -> FoundEntry:
+        """
+        Adds a selected release to the download client.
+
+        Parameters
+        ----------
+        release: SelectedRelease
+            The release to add.
+        magnet_url: str
+            The magnet URL of the release's torrent.
+
+        Returns
+        -------
+        FoundEntry
+            A tuple with (show_id, episode)
+        """
         await self.app.downloader.begin_handling(
-            match.matched_id, show_episode, magnet_url, release_version
+            release.show_id, release.episode, magnet_url, release.version
         )
 
-        return FoundEntry(match.matched_id, show_episode)
+        return FoundEntry(release.show_id, release.episode)
 
     def hash_rss_item(self, item: dict) -> str:
         """
@@ -472,69 +992,177 @@ class Poller:
 
         return hashlib.sha256(to_hash.encode("utf-8")).hexdigest()
 
+    @asynccontextmanager
+    async def fetch_source(
+        self, source: Source
+    ) -> AsyncIterator[Optional[FetchedFeed]]:
+        """
+        Requests a source's RSS feed through the app's
+        session, sending the cached ETag and Last-Modified
+        values along.
+
+        The body is streamed while the context is open, the
+        connection is closed on exit even if it was not fully read.
+        At most `POLLER_MAX_CONCURRENT_FETCHES` feeds are
+        downloaded at the same time.
+
+        Parameters
+        ----------
+        source: Source
+            The source to download.
+
+        Yields
+        ------
+        Optional[FetchedFeed]
+            The response, or None if the feed could not be requested.
+        """
+        cache = self.source_cache[(source.name, source.version)]
+
+        headers = {"User-Agent": feedparser.USER_AGENT}
+        if cache.last_etag:
+            headers["If-None-Match"] = cache.last_etag
+        if cache.last_modified:
+            headers["If-Modified-Since"] = cache.last_modified
+
+        timeout = source.timeout or POLLER_FETCH_TIMEOUT
+
+        async with self.fetch_semaphore:
+            resp = None
+            try:
+                resp = await self.app.session.get(
+                    source.url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"`{source.name}@{source.version}` - Timed out fetching RSS feed after {timeout} seconds"
+                )
+            except aiohttp.ClientError as e:
+                logger.warning(
+                    f"`{source.name}@{source.version}` - Failed to fetch RSS feed: {e}"
+                )
+
+            if resp is None:
+                yield None
+                return
+
+            response_headers = {k.lower(): v for k, v in resp.headers.items()}
+            response_headers.setdefault("content-location", str(resp.url))
+            try:
+                yield FetchedFeed(
+                    resp.status,
+                    resp.content.iter_chunked(POLLER_FEED_CHUNK_SIZE),
+                    response_headers,
+                )
+            finally:
+                # Drops the rest of the body if it was not read.
+                resp.close()
+
     async def get_items_from_source(self, source: Source) -> List[dict]:
         """
         Returns new items from the current
         source's RSS feed.
 
+        RSS feeds are parsed as they are downloaded, and the
+        download stops at the most recent item of the previous poll.
+
         Returns
         -------
         List[dict]
             New items in the RSS feed.
         """
-        feed = await self.loop.run_in_executor(
-            None,
-            partial(
-                feedparser.parse,
-                source.url,
-                etag=self.source_cache[source.name].last_etag,
-                modified=self.source_cache[source.name].last_modified,
-            ),
-        )
+        cache = self.source_cache[(source.name, source.version)]
 
-        if hasattr(feed, "etag"):
-            self.source_cache[source.name].last_etag = feed.etag
-        else:
-            self.source_cache[source.name].last_etag = None
+        async with self.fetch_source(source) as fetched:
+            # 304 status means no new items according to the etag/modified attributes.
+            if fetched is None or fetched.status == 304:
+                return []
+            elif fetched.status >= 400:
+                logger.warning(
+                    f"`{source.name}@{source.version}` - RSS feed responded with status {fetched.status}"
+                )
+                return []
 
-        if hasattr(feed, "modified"):
-            self.source_cache[source.name].last_modified = feed.modified
+            stream = FeedStream(cache.most_recent_hash, self.hash_rss_item)
+            try:
+                async for chunk in fetched.body:
+                    stream.feed(chunk)
+                    if stream.done:
+                        break
+                else:
+                    stream.close()
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"`{source.name}@{source.version}` - Timed out reading RSS feed"
+                )
+                return []
+            except aiohttp.ClientError as e:
+                logger.warning(
+                    f"`{source.name}@{source.version}` - Failed to read RSS feed: {e}"
+                )
+                return []
+
+        cache.last_etag = fetched.headers.get("etag")
+        cache.last_modified = fetched.headers.get("last-modified")
+
+        if stream.fallback:
+            feed = await self.loop.run_in_executor(
+                None,
+                partial(
+                    feedparser.parse, stream.body, response_headers=fetched.headers
+                ),
+            )
+            items = self.get_new_items(cache, feed["items"])
         else:
-            self.source_cache[source.name].last_modified = None
+            items = stream.items
+            if stream.first_hash is not None:
+                cache.most_recent_hash = stream.first_hash
 
-        # 304 status means no new items according to the etag/modified attributes.
-        if hasattr(feed, "status") and feed.status == 304:
-            return []
+        await self.save_source_cache(source)
 
-        if (
-            self.source_cache[source.name].last_etag is not None
-            or self.source_cache[source.name].last_modified is not None
-        ):
-            return feed["items"]
+        return items
 
+    def get_new_items(self, cache: SourceCache, items: List[dict]) -> List[dict]:
+        """
+        Returns the items of a feed that are newer
+        than the cached most recent item, updating the cache.
+
+        Parameters
+        ----------
+        cache: SourceCache
+            The cache of the feed's source.
+        items: List[dict]
+            Every item in the feed, most recent first.
+
+        Returns
+        -------
+        List[dict]
+            New items in the RSS feed.
+        """
         new_items = []
 
         # Since new items in the RSS feed are inserted at index 0,
         # the 0th index item is the most recent item in the feed.
-        if feed["items"]:
+        if items:
             # If the first item in the feed is the same as it was
             # on the previous iteration, the feed has no new items.
-            first_hash = self.hash_rss_item(feed["items"][0])
-            if first_hash == self.source_cache[source.name].most_recent_hash:
+            first_hash = self.hash_rss_item(items[0])
+            if first_hash == cache.most_recent_hash:
                 return []
 
-            new_items.append(feed["items"][0])
+            new_items.append(items[0])
 
             # Iterate through the rest of the items in the feed,
             # repeating the same process above.
-            for item in feed["items"][1:]:
+            for item in items[1:]:
                 item_hash = self.hash_rss_item(item)
-                if item_hash == self.source_cache[source.name].most_recent_hash:
+                if item_hash == cache.most_recent_hash:
                     break
 
                 new_items.append(item)
 
-            self.source_cache[source.name].most_recent_hash = first_hash
+            cache.most_recent_hash = first_hash
 
         return new_items
 
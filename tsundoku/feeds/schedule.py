@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from tsundoku.constants import POLLER_SCHEDULE_SMOOTHING
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def published_at(item: dict) -> Optional[float]:
+    """
+    Returns the time an RSS feed item was published at.
+
+    Parameters
+    ----------
+    item: dict
+        The feed item.
+
+    Returns
+    -------
+    Optional[float]
+        The POSIX timestamp of the item, None if
+        it has no date or the date is not valid.
+    """
+    value = item.get("published") or item.get("updated")
+    if not value or not isinstance(value, str):
+        return None
+
+    try:
+        # RSS dates, e.g. `Sat, 07 Sep 2024 14:30:00 +0000`.
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            # Atom dates, e.g. `2024-09-07T14:30:00Z`.
+            date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date.timestamp()
+
+
+@dataclass
+class SourceSchedule:
+    """
+    When a single RSS feed source is polled next.
+
+    The interval shrinks towards half of the time between
+    the source's releases when a poll finds new items, and
+    grows when it does not, by up to twice as much the more
+    of the recent polls came back empty. It always stays
+    between the configured minimum and maximum intervals.
+
+    Attributes
+    ----------
+    interval: float
+        Seconds between two polls of the source.
+    next_poll_at: float
+        POSIX timestamp of the next poll, the
+        source is polled right away if it is 0.
+    last_polled_at: Optional[float]
+        POSIX timestamp of the previous poll.
+    cadence: Optional[float]
+        Smoothed seconds between two releases of the source,
+        None until new items with publish dates were found.
+    last_item_at: Optional[float]
+        Publish date of the most recent item found.
+    idle_rate: float
+        Smoothed share of polls that found nothing new,
+        either because the feed responded with 304 Not Modified
+        or because it had no items past the previous poll's.
+    """
+
+    interval: float
+    next_poll_at: float = 0.0
+    last_polled_at: Optional[float] = None
+    cadence: Optional[float] = None
+    last_item_at: Optional[float] = None
+    idle_rate: float = 0.0
+
+    def is_due(self, now: float) -> bool:
+        return self.next_poll_at <= now
+
+    def update(
+        self,
+        published: Sequence[Optional[float]],
+        now: float,
+        bounds: Tuple[float, float],
+    ) -> None:
+        """
+        Adapts the interval to the result of a poll
+        and schedules the next one.
+
+        Parameters
+        ----------
+        published: Sequence[Optional[float]]
+            The publish date of every new item found,
+            None for items without one. Empty if the
+            poll found nothing new.
+        now: float
+            POSIX timestamp of the poll.
+        bounds: Tuple[float, float]
+            The minimum and maximum interval.
+        """
+        if published:
+            self.idle_rate *= 1 - POLLER_SCHEDULE_SMOOTHING
+            self._update_cadence([t for t in published if t is not None])
+
+            if self.cadence is not None:
+                # Two polls per release keep the delay
+                # before finding one under half the cadence.
+                interval = self.cadence / 2
+            else:
+                interval = self.interval / 2
+        else:
+            self.idle_rate += (1 - self.idle_rate) * POLLER_SCHEDULE_SMOOTHING
+            interval = self.interval * (1 + self.idle_rate)
+
+        low, high = bounds
+        self.interval = max(low, min(high, interval))
+        self.postpone(now)
+
+    def postpone(self, now: float) -> None:
+        """
+        Schedules the next poll without changing
+        the interval, e.g. after a failed poll.
+
+        Parameters
+        ----------
+        now: float
+            POSIX timestamp of the poll.
+        """
+        self.last_polled_at = now
+        self.next_poll_at = now + self.interval
+
+    def _update_cadence(self, timestamps: Sequence[float]) -> None:
+        if not timestamps:
+            return
+
+        points = sorted(timestamps)
+        if self.last_item_at is not None and self.last_item_at < points[0]:
+            points.insert(0, self.last_item_at)
+
+        self.last_item_at = max(points[-1], self.last_item_at or points[-1])
+        if len(points) < 2:
+            return
+
+        gap = (points[-1] - points[0]) / (len(points) - 1)
+        if self.cadence is None:
+            self.cadence = gap
+        else:
+            self.cadence += (gap - self.cadence) * POLLER_SCHEDULE_SMOOTHING
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "interval": round(self.interval),
+            "next_poll_at": _to_datetime(self.next_poll_at or None),
+            "last_polled_at": _to_datetime(self.last_polled_at),
+            "cadence": None if self.cadence is None else round(self.cadence),
+            "last_item_at": _to_datetime(self.last_item_at),
+            "idle_rate": round(self.idle_rate, 3),
+        }
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+# Root elements of the feeds that can be streamed, RSS 2.0 and RSS 1.0.
+STREAMED_ROOTS = ("rss", "RDF")
+
+# Item elements stored under the same keys feedparser uses for them.
+KEY_ALIASES = {
+    "guid": "id",
+    "pubdate": "published",
+}
+
+
+def _split_tag(tag: str) -> Tuple[Optional[str], str]:
+    if tag.startswith("{"):
+        uri, _, local = tag[1:].partition("}")
+        return uri, local
+
+    return None, tag
+
+
+class FeedStream:
+    """
+    Incrementally parses the items of an RSS feed as
+    its body arrives, stopping at the cursor item.
+
+    Items are returned as dictionaries keyed like feedparser's,
+    e.g. `title`, `link` and `nyaa_infohash`, so that source key
+    mappings work for both. Feeds that are not RSS, or that are
+    not well-formed XML, are left for feedparser: `fallback` is set
+    and the rest of the body has to be fed for `body` to be complete.
+
+    Attributes
+    ----------
+    items: List[dict]
+        The items before the cursor, most recent first.
+    first_hash: Optional[str]
+        The hash of the first item in the feed.
+    done: bool
+        True once the cursor was found, the rest
+        of the body does not need to be read.
+    fallback: bool
+        True if the feed has to be parsed by feedparser.
+    """
+
+    def __init__(self, cursor: Optional[str], hash_item: Callable[[dict], str]) -> None:
+        self.cursor = cursor
+        self.hash_item = hash_item
+
+        self.items: List[dict] = []
+        self.first_hash: Optional[str] = None
+        self.done = False
+        self.fallback = False
+
+        self._parser = XMLPullParser(events=("start-ns", "start", "end"))
+        self._prefixes: Dict[str, str] = {}
+        self._stack: List[Element] = []
+        self._body = bytearray()
+
+    @property
+    def body(self) -> bytes:
+        """
+        The part of the body fed so far.
+        """
+        return bytes(self._body)
+
+    def feed(self, data: bytes) -> None:
+        """
+        Parses the next chunk of the body.
+
+        Parameters
+        ----------
+        data: bytes
+            The chunk.
+        """
+        if self.done:
+            return
+
+        # Kept in case the feed turns out to need feedparser.
+        self._body += data
+        if self.fallback:
+            return
+
+        try:
+            self._parser.feed(data)
+            self._read_events()
+        except ParseError:
+            self.fallback = True
+
+    def close(self) -> None:
+        """
+        Finishes parsing once the whole body was fed.
+        """
+        if self.done or self.fallback:
+            return
+
+        try:
+            self._parser.close()
+            self._read_events()
+        except ParseError:
+            self.fallback = True
+
+    def _read_events(self) -> None:
+        for event, value in self._parser.read_events():
+            if event == "start-ns":
+                prefix, uri = value
+                self._prefixes.setdefault(uri, prefix)
+            elif event == "start":
+                if not self._stack and _split_tag(value.tag)[1] not in STREAMED_ROOTS:
+                    self.fallback = True
+                    return
+
+                self._stack.append(value)
+            else:
+                self._stack.pop()
+                if _split_tag(value.tag)[1] == "item":
+                    self._read_item(value)
+                    if self.done:
+                        return
+
+    def _read_item(self, element: Element) -> None:
+        # Items are dropped from the tree once read,
+        # so memory use does not grow with the feed.
+        if self._stack:
+            self._stack[-1].remove(element)
+
+        item = {}
+        for child in element:
+            uri, local = _split_tag(child.tag)
+            prefix = self._prefixes.get(uri) if uri else None
+
+            key = local.lower()
+            if prefix:
+                key = f"{prefix}_{key}"
+            key = KEY_ALIASES.get(key, key)
+
+            item.setdefault(key, (child.text or "").strip())
+
+        if "description" in item:
+            item.setdefault("summary", item["description"])
+
+        item_hash = self.hash_item(item)
+        if item_hash == self.cursor:
+            self.done = True
+            return
+
+        if self.first_hash is None:
+            self.first_hash = item_hash
+
+        self.items.append(item)
@@ -13,6 +13,8 @@ class Flags:
     DL_CLIENT_CONNECTION_ERROR: bool = False
     UPDATE_INFO: Optional[UpdateInformation] = None
     LOCALE: str = "en"
+    # Incremented whenever the `shows` table changes, see `Show.changed`.
+    SHOWS_REVISION: int = 0
 
     def __repr__(self) -> str:
         return f"<Flags IS_DOCKER={self.IS_DOCKER}, IS_DEBUG={self.IS_DEBUG}, IS_FIRST_LAUNCH={self.IS_FIRST_LAUNCH}, DL_CLIENT_CONNECTION_ERROR={self.DL_CLIENT_CONNECTION_ERROR}, LOCALE={self.LOCALE}>"
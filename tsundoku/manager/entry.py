@@ -231,17 +231,16 @@ class Entry:
             The new state to update to.
         """
         self.state = new_state
-        async with self._app.acquire_db() as con:
-            await con.execute(
-                """
-                UPDATE show_entry SET
-                    current_state = ?,
-                    last_update = CURRENT_TIMESTAMP
-                WHERE id=?;
-            """,
-                new_state.value,
-                self.id,
-            )
+        await self._app.write_db(
+            """
+            UPDATE show_entry SET
+                current_state = ?,
+                last_update = CURRENT_TIMESTAMP
+            WHERE id=?;
+        """,
+            new_state.value,
+            self.id,
+        )
 
         if await self.should_encode():
             await self._app.encoder.queue(self.id)
@@ -258,16 +257,15 @@ class Entry:
             The new path to update to.
         """
         self.file_path = new_path
-        async with self._app.acquire_db() as con:
-            await con.execute(
-                """
-                UPDATE show_entry SET
-                    file_path = ?
-                WHERE id=?;
-            """,
-                str(new_path),
-                self.id,
-            )
+        await self._app.write_db(
+            """
+            UPDATE show_entry SET
+                file_path = ?
+            WHERE id=?;
+        """,
+            str(new_path),
+            self.id,
+        )
 
     async def _handle_webhooks(self) -> None:
         """
@@ -505,3 +505,5 @@ class KitsuManager:
                     False,
                     self.show_id,
                 )
+                # Same as `Show.changed`, which cannot be imported here.
+                self.app.flags.SHOWS_REVISION += 1
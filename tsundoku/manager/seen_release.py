@@ -3,12 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
 
-from tsundoku.constants import VALID_RESOLUTIONS
+from tsundoku.constants import DATABASE_MAX_IN_VARIABLES, VALID_RESOLUTIONS
 from tsundoku.utils import normalize_resolution, compare_version_strings, ParserResult
 
 logger = logging.getLogger("tsundoku")
@@ -175,7 +175,8 @@ class SeenRelease:
                     DELETE FROM
                         seen_release as s1
                     WHERE
-                        datetime('now', '-' || ? ||' day') > (SELECT
+                        s1.seen_at < datetime('now', '-' || :days || ' day') AND
+                        datetime('now', '-' || :days || ' day') > (SELECT
                             MAX(seen_at)
                             FROM seen_release
                             WHERE
@@ -183,70 +184,52 @@ class SeenRelease:
                                 release_group = s1.release_group
                         );
                 """,
-                days,
+                {"days": days},
             )
             deleted = await con.fetchval("SELECT changes();")
 
         logger.info(f"Deleted {deleted} old SeenReleases.")
 
-    @classmethod
-    async def add(
-        cls, app: TsundokuApp, anitopy_result: ParserResult, torrent_destination: str
-    ) -> Optional[SeenRelease]:
-        """
-        Adds a new SeenRelease to the database.
-
-        Parameters
-        ----------
-        app : TsundokuApp
-            The TsundokuApp instance.
-        anitopy_result : ParserResult
-            The result of parsing a torrent's filename
-            with Anitopy.
-        torrent_destination : str
-            The destination of the torrent.
-
-        Returns
-        -------
-        SeenRelease
-            The SeenRelease that was added.
-        """
+    @staticmethod
+    def _validate(
+        anitopy_result: ParserResult,
+    ) -> Optional[Tuple[str, str, int, str, str]]:
         if "file_name" not in anitopy_result:
             logger.warning(
                 f"Not adding '{anitopy_result}' to seen releases because it has no file name."
             )
-            return
+            return None
         elif "anime_title" not in anitopy_result:
             logger.warning(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases because it has no anime title."
             )
-            return
+            return None
         elif "episode_number" not in anitopy_result:
             logger.warning(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases because it has no episode number."
             )
-            return
+            return None
 
         release_group = anitopy_result.get("release_group", "")
         if not release_group:
             logger.warning(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases because it has no release group."
             )
-            return
+            return None
 
         resolution = anitopy_result.get("video_resolution", "")
         if not resolution:
             logger.warning(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases because it has no resolution."
             )
-            return
+            return None
 
         resolution = normalize_resolution(resolution)
         if resolution not in VALID_RESOLUTIONS:
             logger.info(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases because it has an invalid resolution '{resolution}'."
             )
-            return
+            return None
 
         version = anitopy_result.get("release_version", "v0")
 
@@ -257,67 +240,151 @@ class SeenRelease:
             logger.warning(
                 f"Not adding '{anitopy_result['file_name']}' to seen releases episode number is not an integer."
             )
-            return
+            return None
 
         episode = int(anitopy_result["episode_number"])
 
+        return (
+            anitopy_result["anime_title"],
+            release_group,
+            episode,
+            resolution,
+            version,
+        )
+
+    @classmethod
+    async def add(
+        cls, app: TsundokuApp, anitopy_result: ParserResult, torrent_destination: str
+    ) -> Optional[SeenRelease]:
+        """
+        Adds a new SeenRelease to the database.
+
+        Parameters
+        ----------
+        app : TsundokuApp
+            The TsundokuApp instance.
+        anitopy_result : ParserResult
+            The result of parsing a torrent's filename
+            with Anitopy.
+        torrent_destination : str
+            The destination of the torrent.
+
+        Returns
+        -------
+        SeenRelease
+            The SeenRelease that was added.
+        """
+        added = await cls.add_many(app, [(anitopy_result, torrent_destination)])
+        return added[0] if added else None
+
+    @classmethod
+    async def add_many(
+        cls, app: TsundokuApp, releases: Iterable[Tuple[ParserResult, str]]
+    ) -> List[SeenRelease]:
+        """
+        Adds many new SeenReleases to the database at once.
+
+        Releases are skipped if a release of the same episode with a
+        higher (or the same) version was already seen, either in the
+        database or earlier in `releases`. Everything else is written
+        with a single statement.
+
+        Parameters
+        ----------
+        app : TsundokuApp
+            The TsundokuApp instance.
+        releases : Iterable[Tuple[ParserResult, str]]
+            The result of parsing each torrent's filename
+            with Anitopy, and the torrent's destination.
+
+        Returns
+        -------
+        List[SeenRelease]
+            The SeenReleases that were added.
+        """
+        # (title, release_group, episode, resolution) -> (version, file name, destination)
+        pending: Dict[Tuple[str, str, int, str], Tuple[str, str, str]] = {}
+        for anitopy_result, torrent_destination in releases:
+            validated = cls._validate(anitopy_result)
+            if validated is None:
+                continue
+
+            title, release_group, episode, resolution, version = validated
+            key = (title, release_group, episode, resolution)
+            existing = pending.get(key)
+            if existing and compare_version_strings(version, existing[0]) <= 0:
+                logger.debug(
+                    f"Not adding '{anitopy_result['file_name']}' to seen releases because it has a lower (or same) version than the existing release."
+                )
+                continue
+
+            pending[key] = (version, anitopy_result["file_name"], torrent_destination)
+
+        if not pending:
+            return []
+
+        titles = sorted({title for title, *_ in pending})
+        rows = []
         async with app.acquire_db() as con:
-            existing_version = await con.fetchval(
-                """
-                SELECT
-                    version
-                FROM
-                    seen_release
-                WHERE
-                    title = ?
-                    AND release_group = ?
-                    AND episode = ?
-                    AND resolution = ?;
-                """,
-                anitopy_result["anime_title"],
-                release_group,
-                episode,
-                resolution,
+            for i in range(0, len(titles), DATABASE_MAX_IN_VARIABLES):
+                chunk = titles[i : i + DATABASE_MAX_IN_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                rows += await con.fetchall(
+                    f"""
+                    SELECT
+                        title,
+                        release_group,
+                        episode,
+                        resolution,
+                        version
+                    FROM
+                        seen_release
+                    WHERE
+                        title IN ({placeholders});
+                    """,
+                    *chunk,
+                )
+
+        for row in rows:
+            key = (
+                row["title"],
+                row["release_group"],
+                row["episode"],
+                row["resolution"],
             )
-            if (
-                existing_version
-                and compare_version_strings(version, existing_version) <= 0
-            ):
+            release = pending.get(key)
+            if release and compare_version_strings(release[0], row["version"]) <= 0:
                 logger.debug(
-                    f"Not adding '{anitopy_result['file_name']}' to seen releases because it has a lower (or same) version than the existing release."
+                    f"Not adding '{release[1]}' to seen releases because it has a lower (or same) version than the existing release."
                 )
-                return
+                del pending[key]
 
-            await con.execute(
-                """
-                INSERT INTO seen_release (
-                    title,
-                    release_group,
-                    episode,
-                    resolution,
-                    version,
-                    torrent_destination
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (title, release_group, episode, resolution)
-                DO UPDATE SET
-                    version = excluded.version,
-                    torrent_destination = excluded.torrent_destination;
-                """,
-                anitopy_result["anime_title"],
+        if not pending:
+            return []
+
+        await app.write_many_db(
+            """
+            INSERT INTO seen_release (
+                title,
                 release_group,
                 episode,
                 resolution,
                 version,
-                torrent_destination,
-            )
-
-        return cls(
-            app,
-            anitopy_result["anime_title"],
-            release_group,
-            episode,
-            resolution,
-            version,
-            torrent_destination,
-            datetime.utcnow(),
+                torrent_destination
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (title, release_group, episode, resolution)
+            DO UPDATE SET
+                version = excluded.version,
+                torrent_destination = excluded.torrent_destination;
+            """,
+            [
+                (*key, version, torrent_destination)
+                for key, (version, _, torrent_destination) in pending.items()
+            ],
         )
+
+        seen_at = datetime.utcnow()
+        return [
+            cls(app, *key, version, torrent_destination, seen_at)
+            for key, (version, _, torrent_destination) in pending.items()
+        ]
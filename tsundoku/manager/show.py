@@ -168,6 +168,20 @@ class Show:
 
         return await Library.from_id(self.app, self.library_id)
 
+    @staticmethod
+    def changed(app: TsundokuApp) -> None:
+        """
+        Marks the `shows` table as modified, so that data
+        cached from it is rebuilt. Must be called after
+        shows are inserted, updated, or deleted.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app whose shows changed.
+        """
+        app.flags.SHOWS_REVISION += 1
+
     @staticmethod
     async def insert(
         app: TsundokuApp,
@@ -232,6 +246,8 @@ class Show:
                 )
                 new_id = cur.lastrowid
 
+        Show.changed(app)
+
         if new_id is None:
             raise Exception("Failed to insert show into database")
 
@@ -274,6 +290,8 @@ class Show:
                 self.id_,
             )
 
+        Show.changed(self.app)
+
     async def entries(self) -> List[Entry]:
         """
         Retrieves and sets a list of this Show's
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 import feedparser
 
 from tsundoku.manager import Entry, EntryState
-from tsundoku.utils import parse_anime_title
+from tsundoku.utils import parse_anime_title, parse_many
 
 logger = logging.getLogger("tsundoku")
 
@@ -125,15 +125,7 @@ class SearchResult:
         """
         files = await self._app.dl_client.get_file_structure(self.torrent_link)
         episodes = []
-        for file in files:
-            try:
-                parsed = parse_anime_title(file)
-            except Exception:
-                logger.error(
-                    f"Anitopy - Could not Parse `{file}`, skipping", exc_info=True
-                )
-                continue
-
+        for parsed in await parse_many(files):
             if (
                 parsed is None
                 or "anime_type" in parsed
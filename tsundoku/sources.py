@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import json
+import logging
 from pathlib import Path
-from typing import AsyncGenerator
+import re
+from types import MappingProxyType
+from typing import AsyncGenerator, Dict, List, NamedTuple, Optional, Pattern, Tuple
 
 import aiofiles
 
 from tsundoku.constants import DATA_DIR
+from tsundoku.utils import normalize_resolution, ParserResult
+
+logger = logging.getLogger("tsundoku")
+
+# Named groups a filename template may capture, the first two are required.
+TEMPLATE_GROUPS = (
+    "anime_title",
+    "episode_number",
+    "release_group",
+    "video_resolution",
+    "release_version",
+)
 
 
 @dataclass
@@ -55,6 +71,14 @@ class Source:
 
     rss_key_map: SourceKeyMapping
 
+    # Seconds to wait for the feed to download, falls
+    # back to `POLLER_FETCH_TIMEOUT` if not specified.
+    timeout: Optional[float] = None
+
+    # Matches the filenames this source usually publishes,
+    # anything else is parsed with anitopy.
+    filename_template: Optional[Pattern[str]] = None
+
     @classmethod
     def from_object(cls, obj: dict) -> Source:
         required_keys = ("name", "version", "url", "rssItemKeyMapping")
@@ -75,8 +99,50 @@ class Source:
                 "Invalid RSS Source object, rssItemKeyMapping must be a dictionary"
             )
 
+        timeout = obj.get("timeout")
+        if timeout is not None and (
+            not isinstance(timeout, (int, float))
+            or isinstance(timeout, bool)
+            or timeout <= 0
+        ):
+            raise Exception(
+                "Invalid RSS Source object, timeout must be a positive number"
+            )
+
+        template = obj.get("filenameTemplate")
+        if template is not None:
+            template = cls._compile_template(template)
+
         mapping = SourceKeyMapping.from_object(obj["rssItemKeyMapping"])
-        return cls(obj["name"], obj["version"], obj["url"], mapping)
+        return cls(obj["name"], obj["version"], obj["url"], mapping, timeout, template)
+
+    @staticmethod
+    def _compile_template(template: str) -> Pattern[str]:
+        if not isinstance(template, str):
+            raise Exception(
+                "Invalid RSS Source object, filenameTemplate must be a string"
+            )
+
+        try:
+            pattern = re.compile(template)
+        except re.error as e:
+            raise Exception(
+                f"Invalid RSS Source object, filenameTemplate is not a valid regular expression: {e}"
+            )
+
+        for group in pattern.groupindex:
+            if group not in TEMPLATE_GROUPS:
+                raise Exception(
+                    f"Invalid RSS Source object, filenameTemplate has unknown group '{group}'"
+                )
+
+        for group in TEMPLATE_GROUPS[:2]:
+            if group not in pattern.groupindex:
+                raise Exception(
+                    f"Invalid RSS Source object, filenameTemplate is missing required group '{group}'"
+                )
+
+        return pattern
 
     def get_filename(self, item: dict) -> str:
         return self.rss_key_map.get_filename(item)
@@ -84,28 +150,188 @@ class Source:
     def get_torrent(self, item: dict) -> str:
         return self.rss_key_map.get_torrent(item)
 
+    def parse_filename(self, filename: str) -> Optional[ParserResult]:
+        """
+        Parses a filename with the source's filename template.
+
+        Parameters
+        ----------
+        filename: str
+            The filename to parse.
+
+        Returns
+        -------
+        Optional[ParserResult]
+            The read-only parsed elements, in the same format as
+            `parse_anime_title`. None if the source has no template
+            or the filename does not match it.
+        """
+        if self.filename_template is None:
+            return None
+
+        match = self.filename_template.fullmatch(filename)
+        if match is None:
+            return None
+
+        result = {"file_name": filename}
+        for group, value in match.groupdict().items():
+            if value is not None:
+                result[group] = value
+
+        if "video_resolution" in result:
+            result["video_resolution"] = normalize_resolution(
+                result["video_resolution"]
+            )
+
+        return MappingProxyType(result)  # type: ignore
+
+    def to_dict(self) -> dict:
+        """
+        Returns the Source object as a dictionary.
+
+        Returns
+        -------
+        dict
+            The serialized Source object.
+        """
+        template = self.filename_template
+        return {
+            "name": self.name,
+            "version": self.version,
+            "url": self.url,
+            "timeout": self.timeout,
+            "filename_template": None if template is None else template.pattern,
+        }
+
     def __repr__(self) -> str:
         return f"<Source name={self.name} version={self.version} url={self.url}>"
 
 
+class _LoadedFile(NamedTuple):
+    # (st_mtime_ns, st_size) of the file when it was read.
+    stat: Tuple[int, int]
+    source: Optional[Source]
+    error: Optional[str]
+
+
+class SourceRegistry:
+    """
+    The installed RSS sources, read from the JSON files
+    in a directory and shared by everything that uses them.
+
+    Files are only read again when their modification time or
+    size changes, so unchanged sources keep the same `Source`
+    object. Files that cannot be loaded are skipped and
+    reported in `errors` until they are fixed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+        self._files: Dict[Path, _LoadedFile] = {}
+        self._copied = False
+        # Created by the first refresh, as on Python 3.8 a lock is bound
+        # to the loop of the thread it is created in, not the one it is
+        # used in, and the registry is created when the module is imported.
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def sources(self) -> List[Source]:
+        """
+        The sources loaded by the last refresh, by filename.
+        """
+        return [
+            loaded.source
+            for _, loaded in sorted(self._files.items())
+            if loaded.source is not None
+        ]
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """
+        The reason each malformed source file could not be loaded.
+        """
+        return {
+            path.name: loaded.error
+            for path, loaded in sorted(self._files.items())
+            if loaded.error is not None
+        }
+
+    async def refresh(self) -> List[Source]:
+        """
+        Loads source files that were added or changed
+        since the last refresh, and forgets removed ones.
+
+        Returns
+        -------
+        List[Source]
+            Every installed source.
+        """
+        async with self._get_lock():
+            if not self._copied:
+                await self._copy_default_sources()
+
+            found = set()
+            for path in self.path.glob("*.json"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+
+                found.add(path)
+                stat = (st.st_mtime_ns, st.st_size)
+                loaded = self._files.get(path)
+                if loaded is None or loaded.stat != stat:
+                    self._files[path] = await self._load(path, stat)
+
+            for path in self._files.keys() - found:
+                del self._files[path]
+
+        return self.sources
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        return self._lock
+
+    async def _load(self, path: Path, stat: Tuple[int, int]) -> _LoadedFile:
+        try:
+            async with aiofiles.open(path, "r", encoding="utf-8") as fp:
+                source = Source.from_object(json.loads(await fp.read()))
+        except Exception as e:
+            logger.warning(f"Failed to load RSS source '{path.name}': {e}")
+            return _LoadedFile(stat, None, str(e))
+
+        logger.debug(f"Loaded RSS source `{source.name}@{source.version}`")
+        return _LoadedFile(stat, source, None)
+
+    async def _copy_default_sources(self) -> None:
+        self.path.mkdir(exist_ok=True, parents=True)
+
+        if not (self.path / "COPIED").exists():
+            default_sources = Path("default_sources").glob("*.json")
+            for source in default_sources:
+                source = source.name
+                if not (self.path / source).exists():
+                    async with aiofiles.open(self.path / source, "wb") as fp:
+                        async with aiofiles.open(
+                            Path.cwd() / "default_sources" / source, "rb"
+                        ) as default_fp:
+                            await fp.write(await default_fp.read())
+
+            async with aiofiles.open(self.path / "COPIED", "wb") as fp:
+                await fp.write(b"")
+
+        self._copied = True
+
+
+registry = SourceRegistry(DATA_DIR / "sources")
+
+
 async def get_all_sources() -> AsyncGenerator[Source, None]:
-    source_path = DATA_DIR / "sources"
-    source_path.mkdir(exist_ok=True, parents=True)
-
-    if not (source_path / "COPIED").exists():
-        default_sources = Path("default_sources").glob("*.json")
-        for source in default_sources:
-            source = source.name
-            if not (source_path / source).exists():
-                async with aiofiles.open(source_path / source, "wb") as fp:
-                    async with aiofiles.open(
-                        Path.cwd() / "default_sources" / source, "rb"
-                    ) as default_fp:
-                        await fp.write(await default_fp.read())
-
-        async with aiofiles.open(source_path / "COPIED", "wb") as fp:
-            await fp.write(b"")
-
-    for source in source_path.glob("*.json"):
-        async with aiofiles.open(source, "r") as fp:
-            yield Source.from_object(json.loads(await fp.read()))
+    for source in await registry.refresh():
+        yield source
@@ -1,15 +1,38 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import partial, wraps
 import logging
+import multiprocessing
 from pathlib import Path
 import shutil
-from typing import Any, List, TypedDict
+import threading
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+)
 from uuid import uuid4
 
 import anitopy
 
+from tsundoku.constants import (
+    PARSER_CACHE_SIZE,
+    PARSER_CHUNK_SIZE,
+    PARSER_PROCESSES,
+    PARSER_PROCESS_THRESHOLD,
+)
+
 
 def wrap(func: Any) -> Any:
     @wraps(func)
@@ -37,27 +60,262 @@ class ParserResult(TypedDict, total=False):
     anime_title: str
     anime_year: str
     audio_term: str
-    episode_number: List[str] | str
+    episode_number: Tuple[str, ...] | str
     episode_title: str
     file_checksum: str
     file_extension: str
     file_name: str
     release_group: str
     release_version: str
-    release_information: str
+    release_information: Tuple[str, ...] | str
     video_resolution: str
     video_term: str
 
 
-def parse_anime_title(title: str) -> ParserResult:
-    result: ParserResult = anitopy.parse(
+def _run_anitopy(title: str) -> Dict[str, Any]:
+    result = anitopy.parse(
         title, options={"allowed_delimiters": " _&+,|", "parse_episode_title": False}
-    )  # type: ignore
+    )
 
     if "video_resolution" in result:
         result["video_resolution"] = normalize_resolution(result["video_resolution"])
 
-    return result
+    # Results are shared between every caller parsing the same title,
+    # so the lists anitopy returns are frozen along with the mapping.
+    return {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in result.items()
+    }
+
+
+def _parse_chunk(titles: List[str]) -> List[Optional[Dict[str, Any]]]:
+    # Runs in the parser processes, a title that fails
+    # to parse must not lose the rest of the chunk.
+    results: List[Optional[Dict[str, Any]]] = []
+    for title in titles:
+        try:
+            results.append(_run_anitopy(title))
+        except Exception:
+            results.append(None)
+
+    return results
+
+
+class _ParserCache:
+    """
+    Least recently used cache of `parse_anime_title` results.
+
+    Unlike `functools.lru_cache`, results can be looked up and
+    stored separately, so that titles parsed in other processes
+    by `parse_many` are cached as well.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, title: str) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            result = self._entries.get(title)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(title)
+
+            return result
+
+    def put(self, title: str, result: Dict[str, Any]) -> Mapping[str, Any]:
+        frozen = MappingProxyType(result)
+        with self._lock:
+            self._entries[title] = frozen
+            self._entries.move_to_end(title)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return frozen
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_parser_cache = _ParserCache(PARSER_CACHE_SIZE)
+_parser_pool: Optional[ProcessPoolExecutor] = None
+# Chunks submitted to the pool that have not finished, cancelled by
+# `shutdown_parser_pool` as `cancel_futures` needs Python 3.9.
+_parser_futures: Set[Future] = set()
+_parser_futures_lock = threading.Lock()
+
+
+def parse_anime_title(title: str) -> ParserResult:
+    """
+    Parses a release's file name with anitopy.
+
+    Results are cached, parsing a title that was
+    parsed recently does not run anitopy again.
+
+    Parameters
+    ----------
+    title: str
+        The file name to parse.
+
+    Returns
+    -------
+    ParserResult
+        The read-only parsed elements. Elements found
+        more than once are tuples.
+    """
+    result = _parser_cache.get(title)
+    if result is None:
+        result = _parser_cache.put(title, _run_anitopy(title))
+
+    return result  # type: ignore
+
+
+def _get_parser_pool() -> ProcessPoolExecutor:
+    global _parser_pool
+    if _parser_pool is None:
+        # Forking would copy the state of the database worker
+        # threads' locks into the children, so they are spawned.
+        _parser_pool = ProcessPoolExecutor(
+            max_workers=PARSER_PROCESSES or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _parser_pool
+
+
+def _forget_parser_future(future: Future) -> None:
+    with _parser_futures_lock:
+        _parser_futures.discard(future)
+
+
+def _submit_chunk(pool: ProcessPoolExecutor, chunk: List[str]) -> asyncio.Future:
+    future = pool.submit(_parse_chunk, chunk)
+    with _parser_futures_lock:
+        _parser_futures.add(future)
+    future.add_done_callback(_forget_parser_future)
+
+    return asyncio.wrap_future(future)
+
+
+async def parse_many(titles: Sequence[str]) -> List[Optional[ParserResult]]:
+    """
+    Parses many release file names, spreading them over a
+    pool of processes when there are enough of them that
+    parsing would otherwise block the event loop.
+
+    Cached titles are not parsed again, and titles parsed in
+    the pool are added to the `parse_anime_title` cache.
+
+    Parameters
+    ----------
+    titles: Sequence[str]
+        The file names to parse.
+
+    Returns
+    -------
+    List[Optional[ParserResult]]
+        The result for each title, None for the titles
+        that could not be parsed.
+    """
+    results: Dict[str, Optional[Mapping[str, Any]]] = {}
+    missing = []
+    for title in dict.fromkeys(titles):
+        results[title] = _parser_cache.get(title)
+        if results[title] is None:
+            missing.append(title)
+
+    if len(missing) >= PARSER_PROCESS_THRESHOLD:
+        chunks = [
+            missing[i : i + PARSER_CHUNK_SIZE]
+            for i in range(0, len(missing), PARSER_CHUNK_SIZE)
+        ]
+
+        try:
+            pool = _get_parser_pool()
+            parsed = await asyncio.gather(
+                *(_submit_chunk(pool, chunk) for chunk in chunks)
+            )
+        except BrokenProcessPool:
+            logger.warning(
+                "Title parser processes stopped unexpectedly, parsing in-process",
+                exc_info=True,
+            )
+            shutdown_parser_pool()
+        else:
+            for chunk, chunk_results in zip(chunks, parsed):
+                for title, result in zip(chunk, chunk_results):
+                    if result is not None:
+                        results[title] = _parser_cache.put(title, result)
+                    else:
+                        logger.error(f"Anitopy - Could not parse `{title}`")
+
+            missing = []
+
+    for title in missing:
+        try:
+            results[title] = _parser_cache.put(title, _run_anitopy(title))
+        except Exception:
+            logger.error(f"Anitopy - Could not parse `{title}`", exc_info=True)
+
+    return [results[title] for title in titles]  # type: ignore
+
+
+def shutdown_parser_pool() -> None:
+    """
+    Stops the processes started by `parse_many`, if any.
+    """
+    global _parser_pool
+    if _parser_pool is None:
+        return
+
+    with _parser_futures_lock:
+        pending = list(_parser_futures)
+        _parser_futures.clear()
+
+    # Only chunks that already started are waited for, which takes
+    # milliseconds. Not waiting hangs the interpreter at exit on 3.8.
+    for future in pending:
+        future.cancel()
+
+    _parser_pool.shutdown(wait=True)
+    _parser_pool = None
+
+
+def parser_cache_stats() -> Dict[str, int]:
+    """
+    Returns the number of `parse_anime_title` calls that
+    were served from the cache or had to run anitopy.
+
+    Returns
+    -------
+    Dict[str, int]
+        The hits, misses, size and maximum size of the cache.
+    """
+    return _parser_cache.stats()
+
+
+def clear_parser_cache() -> None:
+    """
+    Empties the `parse_anime_title` cache and resets its counters.
+    """
+    _parser_cache.clear()
 
 
 def normalize_resolution(original: str) -> str: